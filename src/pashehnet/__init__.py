@@ -41,4 +41,6 @@ subclass custom components from.  You can also always subclass a core class and
 override its behaviors using normal Pythonic coding practices.
 """
 from .cli import cli_main  # noqa: F401
-from .sensors import sources, transforms, formats, Sensor  # noqa: F401
+from .sensors import (  # noqa: F401
+    sources, transforms, formats, Sensor, Gateway
+)
@@ -13,12 +13,15 @@ import fire
 from envyaml import EnvYAML
 from schema import Schema, Optional, SchemaError, Or
 
+import pashehnet.sensors.compressors
 import pashehnet.sensors.formats
 import pashehnet.sensors.sources
 import pashehnet.sensors.transforms
 import pashehnet.targets
+from pashehnet.clock import VirtualClock
 from pashehnet.network import SensorNetwork
-from pashehnet.sensors import Sensor
+from pashehnet.sensors import Gateway, Sensor
+from pashehnet.sensors.sources import ResampledSource
 
 ########################################
 # Set up logging
@@ -49,6 +52,7 @@ class ConfigKeys:
     TARGET = 'target'
     RESOURCE = 'resource'
     SENSORS = 'sensors'
+    GATEWAYS = 'gateways'
     TOPIC = 'topic'
     SOURCE = 'source'
     FORMAT = 'format'
@@ -56,6 +60,19 @@ class ConfigKeys:
     ID = 'id'
     SPEC = 'spec'
     FREQUENCY = 'frequency'
+    LAG_POLICY = 'lag_policy'
+    NETWORK = 'network'
+    MODE = 'mode'
+    WORKERS = 'workers'
+    SPEED = 'speed'
+    CACHE_BYTES = 'cache_bytes'
+    SEED = 'seed'
+    REPLAY_SPEED = 'replay_speed'
+    RESAMPLE = 'resample'
+    BLOCK_SIZE = 'block_size'
+    BATCH_SIZE = 'batch_size'
+    BATCH_INTERVAL = 'batch_interval'
+    COMPRESSION = 'compression'
 
 
 @lru_cache
@@ -72,10 +89,23 @@ def config_schema():
             ConfigKeys.RESOURCE: str,
             ConfigKeys.SPEC: dict
         },
-        ConfigKeys.SENSORS: [{
+        Optional(ConfigKeys.NETWORK): {
+            Optional(ConfigKeys.MODE): Or(*SensorNetwork.MODES),
+            Optional(ConfigKeys.WORKERS): int,
+            Optional(ConfigKeys.SPEED): Or(int, float, 'max'),
+            Optional(ConfigKeys.CACHE_BYTES): int,
+            Optional(ConfigKeys.SEED): int,
+        },
+        Optional(ConfigKeys.SENSORS): [{
             ConfigKeys.TOPIC: str,
             ConfigKeys.ID: str,
             Optional(ConfigKeys.FREQUENCY): Or(int, float),
+            Optional(ConfigKeys.LAG_POLICY): Or(*Sensor.LAG_POLICIES),
+            Optional(ConfigKeys.REPLAY_SPEED): Or(int, float),
+            Optional(ConfigKeys.RESAMPLE): Or(*ResampledSource.METHODS),
+            Optional(ConfigKeys.BLOCK_SIZE): int,
+            Optional(ConfigKeys.BATCH_SIZE): int,
+            Optional(ConfigKeys.BATCH_INTERVAL): Or(int, float),
             ConfigKeys.SOURCE: {
                 ConfigKeys.RESOURCE: str,
                 Optional(ConfigKeys.SPEC): dict
@@ -87,6 +117,37 @@ def config_schema():
             Optional(ConfigKeys.TRANSFORMS): [{
                 ConfigKeys.RESOURCE: str,
                 Optional(ConfigKeys.SPEC): dict
+            }],
+            Optional(ConfigKeys.COMPRESSION): {
+                ConfigKeys.RESOURCE: str,
+                Optional(ConfigKeys.SPEC): dict
+            }
+        }],
+        Optional(ConfigKeys.GATEWAYS): [{
+            ConfigKeys.TOPIC: str,
+            ConfigKeys.ID: str,
+            Optional(ConfigKeys.FREQUENCY): Or(int, float),
+            Optional(ConfigKeys.LAG_POLICY): Or(*Sensor.LAG_POLICIES),
+            Optional(ConfigKeys.BLOCK_SIZE): int,
+            ConfigKeys.FORMAT: {
+                ConfigKeys.RESOURCE: str,
+                Optional(ConfigKeys.SPEC): dict
+            },
+            Optional(ConfigKeys.COMPRESSION): {
+                ConfigKeys.RESOURCE: str,
+                Optional(ConfigKeys.SPEC): dict
+            },
+            ConfigKeys.SENSORS: [{
+                ConfigKeys.ID: str,
+                Optional(ConfigKeys.RESAMPLE): Or(*ResampledSource.METHODS),
+                ConfigKeys.SOURCE: {
+                    ConfigKeys.RESOURCE: str,
+                    Optional(ConfigKeys.SPEC): dict
+                },
+                Optional(ConfigKeys.TRANSFORMS): [{
+                    ConfigKeys.RESOURCE: str,
+                    Optional(ConfigKeys.SPEC): dict
+                }]
             }]
         }],
         str: object  # Catchall as we don't care about extra cruft
@@ -107,9 +168,11 @@ class Runner(object):
         """
         self.config_file = config
 
-    def run(self):
+    def run(self, workers=None):
         """
         Create and run the network simulation
+
+        :param workers: Worker process count, overriding the config file
         :return: None
         """
         logging.debug('Starting runner')
@@ -118,9 +181,20 @@ class Runner(object):
             logging.info('Creating target from spec')
             target = self._target_from_config(config[ConfigKeys.TARGET])
             logging.info('Creating sensor network')
-            network = SensorNetwork(target)
+            kwargs = self._network_from_config(
+                config.get(ConfigKeys.NETWORK, {})
+            )
+            if workers:
+                kwargs['workers'] = workers
+            network = SensorNetwork(target, **kwargs)
             logging.info('Adding sensors...')
-            self._sensors_from_config(network, config[ConfigKeys.SENSORS])
+            self._sensors_from_config(
+                network, config.get(ConfigKeys.SENSORS, [])
+            )
+            logging.info('Adding gateways...')
+            self._gateways_from_config(
+                network, config.get(ConfigKeys.GATEWAYS, [])
+            )
             logging.info('Network populated, starting up...')
             network.start()
             logging.info('Network running')
@@ -142,7 +216,10 @@ class Runner(object):
                           f'{config[ConfigKeys.TARGET][ConfigKeys.RESOURCE]}'
                           )
             logging.debug(f'{ConfigKeys.SENSORS}: '
-                          f'{config[ConfigKeys.SENSORS]}'
+                          f'{config.get(ConfigKeys.SENSORS, [])}'
+                          )
+            logging.debug(f'{ConfigKeys.GATEWAYS}: '
+                          f'{config.get(ConfigKeys.GATEWAYS, [])}'
                           )
         except Exception as e:
             logging.error(e)
@@ -174,6 +251,27 @@ class Runner(object):
         kwargs = target_cfg.get(ConfigKeys.SPEC, {})
         return self._instantiate_obj(pashehnet.targets, cls, kwargs)
 
+    def _network_from_config(self, network_cfg):
+        """
+        Build SensorNetwork constructor args from config
+
+        :param network_cfg: Network section of config file
+        :return: Dict of SensorNetwork kwargs
+        """
+        # The runner defaults to the scheduler, which scales past the one
+        # process per sensor of SensorNetwork's default
+        kwargs = {ConfigKeys.MODE: SensorNetwork.MODE_SCHEDULER}
+        for key in [ConfigKeys.MODE, ConfigKeys.WORKERS,
+                    ConfigKeys.CACHE_BYTES, ConfigKeys.SEED]:
+            if key in network_cfg:
+                kwargs[key] = network_cfg[key]
+        if ConfigKeys.SPEED in network_cfg:
+            speed = network_cfg[ConfigKeys.SPEED]
+            kwargs['clock'] = VirtualClock(
+                speed=None if speed == 'max' else speed
+            )
+        return kwargs
+
     def _sensors_from_config(self, network, sensors_cfg):
         """
         Instantiate network sensors from config
@@ -184,16 +282,66 @@ class Runner(object):
             topic = spec[ConfigKeys.TOPIC]
             id = spec[ConfigKeys.ID]
             logging.debug(f'Adding sensor id: {id} // topic: {topic}')
-            freq = spec[ConfigKeys.FREQUENCY]
+            freq = spec.get(ConfigKeys.FREQUENCY, 1)
             source = self._source_from_config(spec[ConfigKeys.SOURCE])
             format = self._format_from_config(spec[ConfigKeys.FORMAT])
             transforms = [
                 self._transform_from_config(cfg)
                 for cfg in spec.get(ConfigKeys.TRANSFORMS, [])
             ]
-            sensor = Sensor(id, source, format, transforms, freq)
+            sensor = Sensor(
+                id, source, format, transforms, freq,
+                lag_policy=spec.get(
+                    ConfigKeys.LAG_POLICY, Sensor.LAG_CATCHUP
+                ),
+                replay_speed=spec.get(ConfigKeys.REPLAY_SPEED),
+                resample=spec.get(ConfigKeys.RESAMPLE),
+                block_size=spec.get(ConfigKeys.BLOCK_SIZE, 1),
+                batch_size=spec.get(ConfigKeys.BATCH_SIZE),
+                batch_interval=spec.get(ConfigKeys.BATCH_INTERVAL),
+                compressor=self._compressor_from_config(
+                    spec.get(ConfigKeys.COMPRESSION)
+                )
+            )
             network.add_sensor(topic, sensor)
 
+    def _gateways_from_config(self, network, gateways_cfg):
+        """
+        Instantiate network gateways and their sensors from config
+
+        :param gateways_cfg: Gateways section of config file
+        """
+        for spec in gateways_cfg:
+            topic = spec[ConfigKeys.TOPIC]
+            id = spec[ConfigKeys.ID]
+            logging.debug(f'Adding gateway id: {id} // topic: {topic}')
+            freq = spec.get(ConfigKeys.FREQUENCY, 1)
+            format = self._format_from_config(spec[ConfigKeys.FORMAT])
+            sensors = []
+            for sensor_spec in spec[ConfigKeys.SENSORS]:
+                source = self._source_from_config(
+                    sensor_spec[ConfigKeys.SOURCE]
+                )
+                transforms = [
+                    self._transform_from_config(cfg)
+                    for cfg in sensor_spec.get(ConfigKeys.TRANSFORMS, [])
+                ]
+                sensors.append(Sensor(
+                    sensor_spec[ConfigKeys.ID], source, None, transforms,
+                    freq, resample=sensor_spec.get(ConfigKeys.RESAMPLE)
+                ))
+            gateway = Gateway(
+                id, sensors, format, freq,
+                lag_policy=spec.get(
+                    ConfigKeys.LAG_POLICY, Sensor.LAG_CATCHUP
+                ),
+                block_size=spec.get(ConfigKeys.BLOCK_SIZE, 256),
+                compressor=self._compressor_from_config(
+                    spec.get(ConfigKeys.COMPRESSION)
+                )
+            )
+            network.add_gateway(topic, gateway)
+
     def _source_from_config(self, source_cfg):
         """
         Instantiate sensor source from config
@@ -224,6 +372,21 @@ class Runner(object):
         kwargs = xform_config.get(ConfigKeys.SPEC, {})
         return self._instantiate_obj(pashehnet.sensors.transforms, cls, kwargs)
 
+    def _compressor_from_config(self, compression_cfg):
+        """
+        Instantiate payload compressor from config
+
+        :param compression_cfg: Sensor or gateway compression section of \
+        config file, if any
+        """
+        if not compression_cfg:
+            return None
+        cls = compression_cfg[ConfigKeys.RESOURCE]
+        kwargs = compression_cfg.get(ConfigKeys.SPEC, {})
+        return self._instantiate_obj(
+            pashehnet.sensors.compressors, cls, kwargs
+        )
+
     def _instantiate_obj(self, core_pkg, cls, kwargs):
         """
         Util method to wrap common dynamic module load/instantiation logic
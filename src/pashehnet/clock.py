@@ -0,0 +1,204 @@
+"""
+The `pashehnet.clock` module provides the time base that sensors and network
+schedulers read from.  `RealClock` follows the host's clocks; `VirtualClock`
+runs simulated time either as fast as possible or at a fixed multiple of real
+time, so hours of data can be generated in seconds while the timestamps in
+the payloads stay on the simulated timeline.
+"""
+import asyncio
+import heapq
+import time
+from abc import ABC, abstractmethod
+
+
+class ClockBase(ABC):
+    """
+    Abstract base class for all PashehNet clocks.  Deadlines are expressed on
+    the clock's monotonic time base; time() gives the matching wall-clock
+    epoch timestamp for payloads.
+    """
+    @abstractmethod
+    def monotonic(self):
+        """
+        :return: Current monotonic time in seconds
+        """
+        ...
+
+    @abstractmethod
+    def time(self):
+        """
+        :return: Current wall-clock time in seconds since the epoch
+        """
+        ...
+
+    @abstractmethod
+    def sleep_until(self, deadline):
+        """
+        Block until the monotonic deadline has passed
+
+        :param deadline: Monotonic time to wait for
+        :return: None
+        """
+        ...
+
+    @abstractmethod
+    async def sleep_until_async(self, deadline):
+        """
+        Asynchronous variant of sleep_until() for use on an event loop
+
+        :param deadline: Monotonic time to wait for
+        :return: None
+        """
+        ...
+
+    def add_task(self):
+        """
+        Register a task that waits on the clock through sleep_until_async()
+        until remove_task() is called.  Clocks running simulated time only
+        advance it once every registered task is waiting.
+
+        :return: None
+        """
+        pass
+
+    def remove_task(self):
+        """
+        Unregister a task registered with add_task()
+
+        :return: None
+        """
+        pass
+
+
+class RealClock(ClockBase):
+    """
+    Clock following the host's real monotonic and wall clocks
+    """
+    def monotonic(self):
+        return time.monotonic()
+
+    def time(self):
+        return time.time()
+
+    def sleep_until(self, deadline):
+        wait = deadline - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def sleep_until_async(self, deadline):
+        # Always yield to the loop, even when already due
+        await asyncio.sleep(max(0.0, deadline - time.monotonic()))
+
+
+class VirtualClock(ClockBase):
+    """
+    Simulated clock.  With no speed it runs as fast as possible: sleeping
+    simply jumps simulated time forward to the deadline, and time spent doing
+    work is not counted.  With a speed it runs at that multiple of real time.
+
+    Tasks running as fast as possible on an event loop register with
+    add_task(): simulated time then only jumps forward once none of them can
+    run, so a task still publishing, say, isn't overtaken by the others.
+    """
+    def __init__(self, speed=None, start=None):
+        """
+        CTOR
+
+        :param speed: Multiple of real time to run at; None or 0 runs as \
+        fast as possible
+        :param start: Epoch timestamp of simulated time zero; defaults to \
+        the current wall-clock time
+        """
+        self.speed = speed or None
+        self.start = time.time() if start is None else start
+        self.origin = time.monotonic()
+        self.now = 0.0
+        self.waiters = []
+        self.waiter_count = 0
+        self.waiting = 0
+        self.tasks = 0
+        self.dispatching = False
+
+    def monotonic(self):
+        if self.speed:
+            return (time.monotonic() - self.origin) * self.speed
+        return self.now
+
+    def time(self):
+        return self.start + self.monotonic()
+
+    def sleep_until(self, deadline):
+        if self.speed:
+            wait = (deadline - self.monotonic()) / self.speed
+            if wait > 0:
+                time.sleep(wait)
+        else:
+            self.now = max(self.now, deadline)
+
+    async def sleep_until_async(self, deadline):
+        if self.speed:
+            await asyncio.sleep(
+                max(0.0, (deadline - self.monotonic()) / self.speed)
+            )
+            return
+
+        # Many tasks share the clock, so waiters are released one at a time
+        # in deadline order and simulated time never runs backwards
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self.waiter_count += 1
+        heapq.heappush(self.waiters, (deadline, self.waiter_count, waiter))
+        self.waiting += 1
+        self._schedule(loop)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.cancelled():
+                # Never released, so no longer waiting
+                self.waiting -= 1
+                self._schedule(loop)
+            raise
+
+    def add_task(self):
+        self.tasks += 1
+
+    def remove_task(self):
+        self.tasks -= 1
+        if self.waiters:
+            self._schedule(asyncio.get_running_loop())
+
+    def _schedule(self, loop):
+        """
+        Internal method scheduling the release of the earliest async waiter
+        once every registered task is waiting
+
+        :param loop: Running event loop
+        :return: None
+        """
+        if not self.dispatching and self.waiting >= self.tasks:
+            self.dispatching = True
+            loop.call_soon(self._dispatch, loop)
+
+    def _dispatch(self, loop):
+        """
+        Internal method releasing the earliest async waiter.  The woken task
+        schedules the next release when it waits again; with no registered
+        tasks, releases follow each other while waiters remain.
+
+        :param loop: Running event loop
+        :return: None
+        """
+        self.dispatching = False
+        if self.waiting < self.tasks:
+            # A task started running since the release was scheduled
+            return
+        while self.waiters:
+            deadline, _, waiter = heapq.heappop(self.waiters)
+            if waiter.cancelled():
+                continue
+            self.now = max(self.now, deadline)
+            self.waiting -= 1
+            waiter.set_result(None)
+            break
+        if not self.tasks and self.waiters:
+            self._schedule(loop)
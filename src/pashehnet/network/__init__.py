@@ -2,4 +2,5 @@
 The `pashehnet.network` package provides the multiprocessing simulation network
 and child processes
 """
-from .network import SensorNetwork  # noqa: F401
+from .network import SensorNetwork, AsyncSensorNetwork  # noqa: F401
+from .scheduler import SensorScheduler  # noqa: F401
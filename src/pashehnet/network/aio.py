@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Process
+
+from pashehnet.targets import SensorTargetBase
+from .publisher import compress_payload
+from .scheduler import align_replays
+from .util import report_ticks, restore_signals
+
+
+async def run_sensor(target: SensorTargetBase, topic, sensor,
+                     executor=None):
+    """
+    Coroutine running a single sensor forever on the current event loop,
+    paced on the sensor's deadlines.  Sources, transforms and formats are
+    called synchronously; only waiting and publishing yield to the loop.
+    Compression runs on the given executor.
+
+    :param target: Target to publish payloads to
+    :param topic: Topic/channel to publish to
+    :param sensor: Sensor to read from
+    :param executor: Executor to compress payloads on; defaults to the \
+    loop's
+    :return: None
+    """
+    clock = sensor.clock
+    sensor.reset(clock.monotonic())
+    # Virtual clocks only advance once every sensor task is waiting on them
+    clock.add_task()
+    try:
+        while True:
+            # Clocks always yield here, even when due, so unpaced or lagging
+            # sensors can't monopolize the loop
+            await clock.sleep_until_async(sensor.deadline)
+            sensor.tick(clock.monotonic())
+            report_ticks(sensor)
+            try:
+                payload = sensor.read()
+                if payload is None:
+                    # Still filling a batch
+                    continue
+                if sensor.compressor:
+                    loop = asyncio.get_running_loop()
+                    payload = await loop.run_in_executor(
+                        executor, compress_payload, sensor, payload
+                    )
+                logging.debug(
+                    f'Sensor {sensor.id} '
+                    f'sending payload {payload} '
+                    f'to {topic}')
+                await target.send_async(topic, payload)
+            except Exception as e:
+                logging.error(f'Sensor {sensor.id}, exception: {str(e)}')
+    finally:
+        clock.remove_task()
+
+
+async def run_sensors(target: SensorTargetBase, sensors):
+    """
+    Coroutine running every sensor as its own task on the current event loop
+
+    :param target: Target to publish payloads to
+    :param sensors: Collection of TopicSensor tuples
+    :return: None
+    """
+    for (_, sensor) in sensors:
+        for source in sensor.sources():
+            source.activate()
+    align_replays(sensors)
+    # A single compression thread, as in the other modes, so compressors
+    # shared by several sensors are never used concurrently
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        await asyncio.gather(*[
+            run_sensor(target, topic, sensor, executor)
+            for (topic, sensor) in sensors
+        ])
+
+
+class AsyncSensorProcess(Process):
+    """
+    Class that wraps a child process running all sensors on one asyncio event
+    loop
+    """
+    def __init__(self, target: SensorTargetBase, sensors):
+        super(AsyncSensorProcess, self).__init__()
+        self.target = target
+        self.sensors = list(sensors)
+
+    def __str__(self):
+        return f'AsyncSensorProcess ({len(self.sensors)} sensors)'
+
+    def run(self):
+        restore_signals()
+        asyncio.run(run_sensors(self.target, self.sensors))
@@ -4,7 +4,13 @@ import signal
 from collections import namedtuple
 from multiprocessing import Process
 
+from pashehnet.clock import RealClock
+from pashehnet.sensors.sources import SharedSamples, sample_cache
 from pashehnet.targets import SensorTargetBase
+from .aio import AsyncSensorProcess, run_sensors
+from .publisher import Publisher
+from .scheduler import SchedulerProcess, align_replays, shard_sensors
+from .util import report_ticks, restore_signals, signals_blocked
 
 ########################################
 # Set up logging
@@ -31,15 +37,31 @@ class SensorProcess(Process):
         self.topic = topic
         self.sensor = sensor
 
+    def __str__(self):
+        return f'SensorProcess {self.topic} // {self.sensor.id}'
+
     def run(self):
+        restore_signals()
+        for source in self.sensor.sources():
+            source.activate()
+        publisher = None
+        if self.sensor.compressor:
+            publisher = Publisher(self.target)
+            publisher.start()
         while True:
             try:
                 payload = next(self.sensor)
+                report_ticks(self.sensor)
+                if payload is None:
+                    continue
                 logging.debug(
                     f'Sensor {self.sensor.id} '
                     f'sending payload {payload} '
                     f'to {self.topic}')
-                self.target.send(self.topic, payload)
+                if publisher:
+                    publisher.publish(self.topic, self.sensor, payload)
+                else:
+                    self.target.send(self.topic, payload)
             except Exception as e:
                 logging.error(f'Sensor {self.sensor.id}, exception: {str(e)}')
                 continue
@@ -50,10 +72,47 @@ class SensorNetwork(object):
     Class that provides a network of simulated sensors, publishing to a single
     target.
     """
-    def __init__(self, target):
+    MODE_PROCESS = 'process'
+    MODE_SCHEDULER = 'scheduler'
+    MODE_ASYNCIO = 'asyncio'
+    MODES = [MODE_PROCESS, MODE_SCHEDULER, MODE_ASYNCIO]
+
+    def __init__(self, target, mode=MODE_PROCESS, workers=None,
+                 clock=None, cache_bytes=None, seed=None):
+        """
+        CTOR
+
+        :param target: Target to publish sensor payloads to
+        :param mode: Execution mode, one of 'process' (one child process \
+        per sensor), 'scheduler' (sensors sharded across a pool of worker \
+        processes, each running a deadline scheduler) or 'asyncio' (every \
+        sensor a task on one event loop in a single child process); the \
+        command line runner defaults to 'scheduler'
+        :param workers: Worker process count for 'scheduler' mode; defaults \
+        to the number of cores
+        :param clock: Clock shared by the schedulers and every sensor added, \
+        subclass of ClockBase; defaults to real time.  Pass a VirtualClock \
+        to run simulated time faster than real time.
+        :param cache_bytes: Byte budget of the process-wide sample cache \
+        shared by identically configured sources; defaults to leaving the \
+        current budget in place
+        :param seed: Master seed every sensor added is reseeded from (see \
+        Sensor.reseed()), making the output reproducible whatever the mode, \
+        worker count or block sizes; by default each random source and \
+        transform keeps its own generator
+        """
+        if mode not in self.MODES:
+            raise ValueError(f'Unknown network mode: {mode}')
         self.sensors = []
         self.sensor_procs = []
         self.target = target
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        self.clock = clock or RealClock()
+        self.seed = seed
+        if cache_bytes is not None:
+            sample_cache.resize(cache_bytes)
+        self.shared_samples = SharedSamples()
         self.running = False
 
     def add_sensor(self, topic, sensor):
@@ -64,8 +123,24 @@ class SensorNetwork(object):
         :param sensor: Sensor to read from and publish to topic
         """
         if not self.running:
+            sensor.clock = self.clock
+            if self.seed is not None:
+                sensor.reseed(self.seed)
             self.sensors.append(TopicSensor(topic, sensor))
 
+    def add_gateway(self, topic, gateway):
+        """
+        Add a gateway publishing the combined readings of its sensors to a
+        given topic
+
+        :param topic: Topic/channel to publish to
+        :param gateway: Gateway to read from and publish to topic
+        """
+        if not self.running:
+            for sensor in gateway.sensors:
+                sensor.clock = self.clock
+        self.add_sensor(topic, gateway)
+
     def add_sensors(self, topic, sensors):
         """
         Add a collection of sensors publishing to the same topic
@@ -81,17 +156,58 @@ class SensorNetwork(object):
         Start the simulated sensor network
         """
         try:
-            for (topic, sensor) in self.sensors:
-                self.sensor_procs.append(SensorProcess(
+            # Identical sample tables are computed once, up front, rather
+            # than on each sensor's first tick.  Child processes attach
+            # read-only to a shared copy; the asyncio mode's single child
+            # inherits the warmed cache.
+            for (_, sensor) in self.sensors:
+                for source in sensor.sources():
+                    if self.mode != self.MODE_ASYNCIO:
+                        self.shared_samples.share(source)
+                    source.warm_up()
+            # Periodic sensors format their payloads once, here, so forked
+            # workers inherit the tables
+            tables = sum(sensor.precompute() for (_, sensor) in self.sensors)
+            logging.debug(
+                f'{tables} of {len(self.sensors)} sensors use precomputed '
+                f'payloads.'
+            )
+            logging.debug(
+                f'Shared {len(self.shared_samples.segments)} '
+                f'distinct samples, sample cache {sample_cache.hits} hits, '
+                f'{sample_cache.misses} misses.'
+            )
+
+            # Replays start together across every worker process.  Aligning
+            # reads ahead, so sources are rewound to leave no open files or
+            # read positions for the forked workers to share.
+            align_replays(self.sensors)
+            for (_, sensor) in self.sensors:
+                sensor.rewind()
+
+            if self.mode == self.MODE_SCHEDULER:
+                for shard in shard_sensors(self.sensors, self.workers):
+                    self.sensor_procs.append(SchedulerProcess(
+                        target=self.target,
+                        sensors=shard,
+                        clock=self.clock
+                    ))
+            elif self.mode == self.MODE_ASYNCIO:
+                self.sensor_procs.append(AsyncSensorProcess(
                     target=self.target,
-                    topic=topic,
-                    sensor=sensor
+                    sensors=self.sensors
                 ))
-            for p in self.sensor_procs:
-                logging.debug(
-                    f'SensorProcess starting: {p.topic} // {p.sensor}'
-                )
-                p.start()
+            else:
+                for (topic, sensor) in self.sensors:
+                    self.sensor_procs.append(SensorProcess(
+                        target=self.target,
+                        topic=topic,
+                        sensor=sensor
+                    ))
+            with signals_blocked():
+                for p in self.sensor_procs:
+                    logging.debug(f'{p} starting')
+                    p.start()
 
             logging.debug(
                 f'Started {len(self.sensor_procs)} sensor processes.'
@@ -110,20 +226,57 @@ class SensorNetwork(object):
         """
         try:
             for p in self.sensor_procs:
-                logging.debug(
-                    f'SensorProcess terminating: {p.topic} // {p.sensor}'
-                )
+                logging.debug(f'{p} terminating')
                 p.terminate()
 
             for p in self.sensor_procs:
-                logging.debug(
-                    f'SensorProcess joining: {p.topic} // {p.sensor}'
-                )
+                logging.debug(f'{p} joining')
                 p.join()
 
             logging.debug(
                 f'Terminated {len(self.sensor_procs)} sensor processes.'
             )
+            self.shared_samples.close()
             self.running = False
         except Exception as e:
             logging.error(str(e))
+
+
+class AsyncSensorNetwork(SensorNetwork):
+    """
+    Sensor network running every sensor as a task on a single asyncio event
+    loop, publishing through the target's send_async().  Use start()/stop()
+    to run the loop in a child process, or await run() to host the sensors
+    on an existing loop.
+    """
+    def __init__(self, target, clock=None, cache_bytes=None, seed=None):
+        """
+        CTOR
+
+        :param target: Target to publish sensor payloads to
+        :param clock: Clock shared by every sensor added; defaults to real \
+        time
+        :param cache_bytes: Byte budget of the process-wide sample cache
+        :param seed: Master seed every sensor added is reseeded from
+        """
+        super(AsyncSensorNetwork, self).__init__(
+            target,
+            mode=SensorNetwork.MODE_ASYNCIO,
+            clock=clock,
+            cache_bytes=cache_bytes,
+            seed=seed
+        )
+
+    async def run(self):
+        """
+        Run all sensors on the current event loop until cancelled
+        """
+        self.running = True
+        for (_, sensor) in self.sensors:
+            for source in sensor.sources():
+                source.warm_up()
+            sensor.precompute()
+        try:
+            await run_sensors(self.target, self.sensors)
+        finally:
+            self.running = False
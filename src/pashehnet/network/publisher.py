@@ -0,0 +1,70 @@
+import logging
+import time
+from queue import Queue
+from threading import Thread
+
+from pashehnet.targets import SensorTargetBase
+from . import util
+
+
+def compress_payload(sensor, payload):
+    """
+    Compress a payload with the sensor's compressor, logging the sensor's
+    compression stats every util.REPORT_INTERVAL seconds
+
+    :param sensor: Sensor the payload was read from
+    :param payload: Formatted payload
+    :return: Compressed payload
+    """
+    payload = sensor.compressor.compress(payload)
+    stats = sensor.compressor.stats
+    now = time.monotonic()
+    if stats.reported is None:
+        stats.reported = now
+    elif now - stats.reported >= util.REPORT_INTERVAL:
+        stats.reported = now
+        logging.info(f'Sensor {sensor.id} compression: {stats}')
+    return payload
+
+
+class Publisher(Thread):
+    """
+    Thread compressing and sending payloads handed over by a sensor loop, so
+    compression and the target's send() run alongside generating the next
+    readings.  Payloads are sent in the order published; once max_pending
+    payloads are waiting, publish() blocks until the thread catches up.
+    """
+    def __init__(self, target: SensorTargetBase, max_pending=1024):
+        """
+        CTOR
+
+        :param target: Target to publish payloads to
+        :param max_pending: Maximum number of payloads waiting to be sent
+        """
+        super(Publisher, self).__init__(daemon=True)
+        self.target = target
+        self.queue = Queue(max_pending)
+
+    def publish(self, topic, sensor, payload):
+        """
+        Queue a payload to be compressed, if the sensor has a compressor,
+        and sent
+
+        :param topic: Topic/channel to publish to
+        :param sensor: Sensor the payload was read from
+        :param payload: Formatted payload
+        :return: None
+        """
+        self.queue.put((topic, sensor, payload))
+
+    def run(self):
+        while True:
+            topic, sensor, payload = self.queue.get()
+            try:
+                if sensor.compressor:
+                    payload = compress_payload(sensor, payload)
+                self.target.send(topic, payload)
+            except Exception as e:
+                logging.error(f'Sensor {sensor.id}, exception: {str(e)}')
+            finally:
+                self.queue.task_done()
@@ -0,0 +1,176 @@
+import heapq
+import logging
+from multiprocessing import Process
+
+from pashehnet.clock import RealClock
+from pashehnet.targets import SensorTargetBase
+from .publisher import Publisher
+from .util import report_ticks, restore_signals
+
+
+def shard_sensors(sensors, workers):
+    """
+    Deterministically spread sensors across workers, balancing on each
+    sensor's frequency.  Sensors are placed heaviest first onto whichever
+    worker currently carries the least load, so a handful of high-rate sensors
+    end up on separate workers.  Unpaced sensors (no frequency) saturate a
+    worker on their own and are balanced separately, ahead of any rate.
+
+    :param sensors: Collection of TopicSensor tuples
+    :param workers: Maximum number of shards to produce
+    :return: List of non-empty lists of TopicSensor tuples
+    """
+    count = max(1, min(workers, len(sensors)))
+    shards = [[] for _ in range(count)]
+    # Heap entries are (unpaced count, total rate, worker index)
+    loads = [(0, 0, i) for i in range(count)]
+    # sorted() is stable, so equal loads keep their insertion order
+    ordered = sorted(
+        sensors,
+        key=lambda ts: tuple(-x for x in _sensor_load(ts.sensor))
+    )
+    for ts in ordered:
+        unpaced, rate, i = heapq.heappop(loads)
+        d_unpaced, d_rate = _sensor_load(ts.sensor)
+        shards[i].append(ts)
+        heapq.heappush(loads, (unpaced + d_unpaced, rate + d_rate, i))
+    return [shard for shard in shards if shard]
+
+
+def align_replays(sensors):
+    """
+    Give every replaying sensor without an explicit replay_start the same
+    start, the earliest first recorded time among them, so independently
+    recorded channels keep their relative timing
+
+    :param sensors: Collection of TopicSensor tuples
+    :return: None
+    """
+    auto = [
+        sensor for (_, sensor) in sensors
+        if sensor.replay_speed and sensor.replay_start is None
+    ]
+    if auto:
+        start = min(sensor.prefetch() for sensor in auto)
+        for sensor in auto:
+            sensor.replay_start = start
+
+
+def _sensor_load(sensor):
+    """
+    Internal method returning the (unpaced, rate) load a sensor puts on a
+    worker
+
+    :param sensor: Sensor to weigh; a gateway weighs as much as its group
+    :return: Tuple of unpaced count and frequency
+    """
+    if sensor.frequency and sensor.frequency > 0:
+        return 0, sensor.frequency * sensor.weight
+    return sensor.weight, 0
+
+
+class SensorScheduler(object):
+    """
+    Runs many sensors cooperatively from a single loop.  Sensors are kept in a
+    heap ordered by the time they are next due, so the loop only ever sleeps
+    until the earliest deadline and per-sensor overhead is a single heap entry.
+    When any sensor compresses its payloads, every payload is handed to a
+    Publisher thread instead of being sent from the loop.
+    """
+    def __init__(self, target: SensorTargetBase, sensors, clock=None):
+        """
+        CTOR
+
+        :param target: Target to publish all sensor payloads to
+        :param sensors: Collection of TopicSensor tuples to schedule
+        :param clock: Clock to schedule on, shared with the sensors; \
+        defaults to real time
+        """
+        self.target = target
+        self.sensors = list(sensors)
+        self.clock = clock or RealClock()
+        self.queue = None
+        self.publisher = None
+
+    def step(self):
+        """
+        Wait for the next sensor to come due, read it and publish its payload
+
+        :return: None
+        """
+        if self.queue is None:
+            self._init_queue()
+        if not self.queue:
+            return
+
+        due, seq, (topic, sensor) = self.queue[0]
+        self.clock.sleep_until(due)
+        sensor.tick(self.clock.monotonic())
+        report_ticks(sensor)
+
+        try:
+            payload = sensor.read()
+            if payload is not None:
+                logging.debug(
+                    f'Sensor {sensor.id} '
+                    f'sending payload {payload} '
+                    f'to {topic}')
+                if self.publisher:
+                    self.publisher.publish(topic, sensor, payload)
+                else:
+                    self.target.send(topic, payload)
+        except Exception as e:
+            logging.error(f'Sensor {sensor.id}, exception: {str(e)}')
+
+        # Unpaced sensors are rescheduled at the time they fired, going to the
+        # back of the currently-due line rather than starving everything else
+        heapq.heapreplace(self.queue, (sensor.deadline, seq, (topic, sensor)))
+
+    def run(self):
+        """
+        Run the scheduler loop forever
+
+        :return: None
+        """
+        while True:
+            self.step()
+
+    def _init_queue(self):
+        """
+        Internal method to build the heap; each sensor is first due one
+        period from now, same as a dedicated SensorProcess.  Entries carry
+        their insertion order to break ties so sensors are never compared.
+
+        :return: None
+        """
+        for (_, sensor) in self.sensors:
+            for source in sensor.sources():
+                source.activate()
+        align_replays(self.sensors)
+        now = self.clock.monotonic()
+        self.queue = []
+        for seq, (topic, sensor) in enumerate(self.sensors):
+            sensor.reset(now)
+            self.queue.append((sensor.deadline, seq, (topic, sensor)))
+        heapq.heapify(self.queue)
+        # Started here, in the process running the loop
+        if any(sensor.compressor for (_, sensor) in self.sensors):
+            self.publisher = Publisher(self.target)
+            self.publisher.start()
+
+
+class SchedulerProcess(Process):
+    """
+    Class that wraps a SensorScheduler running many sensors in a single child
+    process
+    """
+    def __init__(self, target: SensorTargetBase, sensors, clock=None):
+        super(SchedulerProcess, self).__init__()
+        self.scheduler = SensorScheduler(target, sensors, clock)
+
+    def __str__(self):
+        return f'SchedulerProcess ({len(self.scheduler.sensors)} sensors)'
+
+    def run(self):
+        restore_signals()
+        self.scheduler.run()
@@ -0,0 +1,69 @@
+import logging
+import signal
+import time
+from contextlib import contextmanager
+
+# Signals a network stops on
+STOP_SIGNALS = {signal.SIGINT, signal.SIGTERM}
+
+# Seconds between logged stats, per sensor
+REPORT_INTERVAL = 60.0
+
+
+def report_ticks(sensor):
+    """
+    Log a summary of the sensor's tick lateness every REPORT_INTERVAL
+    seconds, as a warning when ticks ran late or were skipped; sensor loops
+    call this after every tick
+
+    :param sensor: Sensor that just ticked
+    :return: None
+    """
+    stats = sensor.stats
+    now = time.monotonic()
+    if stats.reported is None:
+        stats.reported = now
+    elif now - stats.reported >= REPORT_INTERVAL:
+        stats.reported = now
+        if stats.ticks == stats.window[0]:
+            # Unpaced sensors don't record ticks
+            return
+        summary, lagging = stats.summary()
+        logging.log(logging.WARNING if lagging else logging.INFO,
+                    f'Sensor {sensor.id} schedule: {summary}')
+
+
+@contextmanager
+def signals_blocked():
+    """
+    Context manager holding SIGINT/SIGTERM pending while child processes are
+    forked.  Children inherit the blocked mask, so a terminate() arriving
+    before they have called restore_signals() waits instead of running the
+    parent's handler.  Platforms without signal masks, e.g. Windows, fork
+    nothing and start the children with signals unblocked.
+
+    :return: None
+    """
+    if not hasattr(signal, 'pthread_sigmask'):
+        yield
+        return
+    signal.pthread_sigmask(signal.SIG_BLOCK, STOP_SIGNALS)
+    try:
+        yield
+    finally:
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, STOP_SIGNALS)
+
+
+def restore_signals():
+    """
+    Reset SIGINT/SIGTERM to their defaults in a child process; a forked child
+    otherwise inherits the parent network's stop() handler and ignores
+    terminate().  Signals held back by signals_blocked() are delivered once
+    the defaults are in place.
+
+    :return: None
+    """
+    for signum in STOP_SIGNALS:
+        signal.signal(signum, signal.SIG_DFL)
+    if hasattr(signal, 'pthread_sigmask'):
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, STOP_SIGNALS)
@@ -0,0 +1,48 @@
+"""
+The `pashehnet.rng` module derives reproducible random number streams.  A
+network-level seed is combined with stable keys, such as a sensor id and a
+transform's position, into the key of a counter-based Philox generator, so
+every stream depends only on the seed and its keys: never on the order
+streams are created in, how sensors are sharded across processes or how
+many values are drawn at a time.
+"""
+import hashlib
+
+import numpy as np
+
+
+def derive_rng(seed, *keys):
+    """
+    Util method creating an independent random number generator for the
+    given seed and keys.  Keys are compared by their str(), so 1 and '1' give
+    the same stream.
+
+    :param seed: Master seed
+    :param keys: Keys identifying the stream, e.g. a sensor id
+    :return: numpy.random.Generator backed by Philox
+    """
+    material = '\x00'.join(str(k) for k in (seed,) + keys).encode()
+    digest = hashlib.blake2b(material, digest_size=16).digest()
+    key = int.from_bytes(digest, 'little')
+    return np.random.Generator(np.random.Philox(key=key))
+
+
+def split_rng(rng, n):
+    """
+    Util method creating n generators independent of each other, seeded from
+    draws on rng, so rng advances and every split of the same generator
+    gives fresh streams.  Giving each kind of draw its own stream keeps
+    results the same however draws of different kinds interleave.
+
+    :param rng: numpy.random.Generator to split
+    :param n: Number of generators
+    :return: List of numpy.random.Generator objects, with the same kind of \
+    bit generator as rng
+    """
+    bit_generator = type(rng.bit_generator)
+    return [
+        np.random.Generator(bit_generator(np.random.SeedSequence(
+            rng.integers(2 ** 32, size=4).tolist()
+        )))
+        for _ in range(n)
+    ]
@@ -6,3 +6,4 @@ Additional helper methods for constructing sensors in bulk are also located
 here.
 """
 from .sensor import Sensor  # noqa: F401
+from .gateway import Gateway  # noqa: F401
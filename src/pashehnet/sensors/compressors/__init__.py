@@ -0,0 +1,8 @@
+"""
+The `pashehnet.sensors.compressors` package contains the compressors applied
+to sensor payloads after formatting.
+"""
+from .base import SensorCompressorBase  # noqa: F401
+from .zlib import ZlibCompressor  # noqa: F401
+from .gzip import GzipCompressor  # noqa: F401
+from .zstd import ZstdCompressor  # noqa: F401
@@ -0,0 +1,101 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+
+
+class CompressionStats(object):
+    """
+    Running tally of what compressing a sensor's payloads costs and saves
+    """
+    def __init__(self):
+        self.payloads = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cpu_time = 0.0
+        self.reported = None
+
+    @property
+    def ratio(self):
+        """
+        :return: Uncompressed size over compressed size
+        """
+        return self.bytes_in / self.bytes_out if self.bytes_out else 0.0
+
+    @property
+    def mean_cpu_time(self):
+        """
+        :return: Mean CPU seconds spent compressing a payload
+        """
+        return self.cpu_time / self.payloads if self.payloads else 0.0
+
+    def record(self, bytes_in, bytes_out, cpu_time):
+        """
+        Record the compression of a single payload
+
+        :param bytes_in: Size of the payload
+        :param bytes_out: Size of the compressed payload
+        :param cpu_time: CPU seconds spent compressing
+        :return: None
+        """
+        self.payloads += 1
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+        self.cpu_time += cpu_time
+
+    def __str__(self):
+        return (
+            f'{self.payloads} payloads, {self.bytes_in} -> {self.bytes_out} '
+            f'bytes (ratio {self.ratio:.2f}), {self.cpu_time:.3f}s CPU '
+            f'({self.mean_cpu_time * 1e6:.1f}us per payload)'
+        )
+
+
+class SensorCompressorBase(ABC):
+    """
+    Abstract base class for all PashehNet compressors.  A compressor turns
+    a sensor's formatted payload into compressed bytes; networks apply it on
+    the publishing side, off the loop generating readings, and it keeps
+    CompressionStats on the CPU time spent and bytes saved.  Compressing is
+    serialized by a lock, so a compressor can be shared between sensors.
+    """
+    def __init__(self):
+        """
+        CTOR
+        """
+        self.stats = CompressionStats()
+        self.lock = threading.Lock()
+
+    def __getstate__(self):
+        # Locks can't be pickled; each copy gets its own
+        state = self.__dict__.copy()
+        del state['lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def compress(self, payload):
+        """
+        Compress a payload, recording its cost in self.stats
+
+        :param payload: Formatted payload; str payloads are UTF-8 encoded
+        :return: Compressed bytes
+        """
+        data = payload.encode() if isinstance(payload, str) else payload
+        with self.lock:
+            start = time.thread_time()
+            compressed = self._compress(data)
+            self.stats.record(len(data), len(compressed),
+                              time.thread_time() - start)
+        return compressed
+
+    @abstractmethod
+    def _compress(self, data):
+        """
+        Pure abstract method compressing bytes
+
+        :param data: Bytes to compress
+        :return: Compressed bytes
+        """
+        ...
@@ -0,0 +1,22 @@
+import gzip
+
+from .base import SensorCompressorBase
+
+
+class GzipCompressor(SensorCompressorBase):
+    """
+    Compressor producing gzip files (RFC 1952), decompressed with
+    gzip.decompress().  The header's modification time is left at 0 so
+    identical payloads compress identically.
+    """
+    def __init__(self, level=6):
+        """
+        CTOR
+
+        :param level: Compression level, from 0 (none) to 9 (smallest)
+        """
+        super(GzipCompressor, self).__init__()
+        self.level = level
+
+    def _compress(self, data):
+        return gzip.compress(data, compresslevel=self.level, mtime=0)
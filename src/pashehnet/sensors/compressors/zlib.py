@@ -0,0 +1,21 @@
+import zlib
+
+from .base import SensorCompressorBase
+
+
+class ZlibCompressor(SensorCompressorBase):
+    """
+    Compressor producing zlib streams (RFC 1950), decompressed with
+    zlib.decompress()
+    """
+    def __init__(self, level=6):
+        """
+        CTOR
+
+        :param level: Compression level, from 0 (none) to 9 (smallest)
+        """
+        super(ZlibCompressor, self).__init__()
+        self.level = level
+
+    def _compress(self, data):
+        return zlib.compress(data, self.level)
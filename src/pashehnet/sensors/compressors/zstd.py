@@ -0,0 +1,90 @@
+from .base import SensorCompressorBase
+
+
+def _zstandard():
+    """
+    Util method importing zstandard, which is an optional dependency
+
+    :return: zstandard module
+    """
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            'Zstandard compression requires zstandard; '
+            'install with `pip install pashehnet[zstd]`'
+        ) from e
+    return zstandard
+
+
+class ZstdCompressor(SensorCompressorBase):
+    """
+    Compressor producing Zstandard frames, optionally with a dictionary.
+    Small payloads such as single JSON readings share most of their bytes
+    with each other but have too little data of their own to compress well;
+    a dictionary trained on sample payloads supplies that shared content up
+    front.  Consumers need the same dictionary to decompress (see
+    save_dictionary()).
+    See also:
+    - https://python-zstandard.readthedocs.io/
+    """
+    def __init__(self, level=3, dictionary=None, samples=None,
+                 dict_size=16384):
+        """
+        CTOR
+
+        :param level: Compression level, from 1 to 22 (smallest)
+        :param dictionary: Optional pretrained dictionary, as bytes or the \
+        path of a file holding it
+        :param samples: Optional list of sample payloads to train a \
+        dictionary from when none is given; needs enough samples to train on, \
+        typically hundreds
+        :param dict_size: Maximum size in bytes of a trained dictionary
+        """
+        super(ZstdCompressor, self).__init__()
+        zstandard = _zstandard()
+        self.level = level
+        if isinstance(dictionary, str):
+            with open(dictionary, 'rb') as f:
+                dictionary = f.read()
+        elif dictionary is None and samples:
+            dictionary = zstandard.train_dictionary(dict_size, [
+                s.encode() if isinstance(s, str) else s for s in samples
+            ]).as_bytes()
+        self.dictionary = dictionary
+        self.compressor = self._context()
+
+    def __getstate__(self):
+        # Compression contexts can't be pickled; copies make their own
+        state = super(ZstdCompressor, self).__getstate__()
+        del state['compressor']
+        return state
+
+    def __setstate__(self, state):
+        super(ZstdCompressor, self).__setstate__(state)
+        self.compressor = self._context()
+
+    def save_dictionary(self, path):
+        """
+        Write the dictionary to a file, e.g. for consumers to decompress
+        with
+
+        :param path: Path of the file to write
+        :return: None
+        """
+        with open(path, 'wb') as f:
+            f.write(self.dictionary)
+
+    def _context(self):
+        """
+        Internal method creating the compression context
+
+        :return: zstandard.ZstdCompressor object
+        """
+        zstandard = _zstandard()
+        dict_data = zstandard.ZstdCompressionDict(self.dictionary) \
+            if self.dictionary else None
+        return zstandard.ZstdCompressor(level=self.level, dict_data=dict_data)
+
+    def _compress(self, data):
+        return self.compressor.compress(data)
@@ -6,3 +6,6 @@ from .csv import CSVFormat  # noqa: F401
 from .json import JSONFormat  # noqa: F401
 from .simple import SimpleFormat  # noqa: F401
 from .string import StringFormat  # noqa: F401
+from .struct import StructFormat  # noqa: F401
+from .msgpack import MsgPackFormat  # noqa: F401
+from .cbor import CBORFormat  # noqa: F401
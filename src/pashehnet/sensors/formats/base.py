@@ -1,10 +1,32 @@
+import hashlib
+import pickle
 from abc import ABC, abstractmethod
 
 
+def pickle_digest(obj):
+    """
+    Util method digesting an object's pickle, telling apart values that
+    compare equal but format differently, such as 1 and 1.0
+
+    :param obj: Object to digest
+    :return: Hex digest
+    """
+    return hashlib.sha1(pickle.dumps(obj)).hexdigest()
+
+
 class SensorFormatBase(ABC):
     """
     Abstract base class for all PashehNet formatters
+
+    Formatters whose output depends on nothing but the value and timestamp
+    handed to them, with no state, counters or clocks of their own, can set
+    the class attribute `pure` to True.  Sensors with periodic payloads then
+    format a whole period once, ahead of time (see Sensor.precompute()).
+    `pure` only counts on the class that sets it, so subclasses of a pure
+    formatter must set it again after checking they stay pure.
     """
+    pure = False
+
     @abstractmethod
     def transform(self, value):
         """
@@ -14,3 +36,72 @@ class SensorFormatBase(ABC):
         :return: Formatted value
         """
         ...
+
+    def transform_at(self, value, timestamp):
+        """
+        Apply formatter to a value read at the given timestamp; formatters
+        that don't emit timestamps simply ignore it
+
+        :param value: Value to format
+        :param timestamp: Epoch timestamp of the reading, from the sensor's \
+        clock
+        :return: Formatted value
+        """
+        return self.transform(value)
+
+    @property
+    def timestamped(self):
+        """
+        :return: True if payloads may depend on the reading's timestamp; by \
+        default, whether transform_at() is overridden
+        """
+        return type(self).transform_at is not SensorFormatBase.transform_at
+
+    @property
+    def precomputable(self):
+        """
+        :return: True if payloads can be formatted ahead of time: the \
+        formatter's own class is pure and payloads ignore timestamps
+        """
+        return vars(type(self)).get('pure', False) and not self.timestamped
+
+    def format_key(self):
+        """
+        Key identifying this formatter's configuration, for pure formatters
+        whose precomputed payloads can be shared; formatters of the same
+        class with equal keys format every value identically
+
+        :return: Hashable key, or None if payloads can't be shared, the \
+        default
+        """
+        return None
+
+    def transform_batch(self, values, timestamps):
+        """
+        Format a batch of readings into a single payload, each keeping its
+        own timestamp.  The default puts each reading's payload on a line of
+        its own, or simply concatenates them for binary payloads; formatters
+        with a natural multi-row form override this.
+
+        :param values: Values to format
+        :param timestamps: Epoch timestamp of each reading
+        :return: Formatted payload
+        """
+        rows = [self.transform_at(v, t) for v, t in zip(values, timestamps)]
+        if isinstance(rows[0], bytes):
+            return b''.join(rows)
+        return '\n'.join(rows)
+
+    def transform_group(self, ids, values, timestamp):
+        """
+        Format the readings of a gateway's group of sensors, taken at the
+        same time, into a single payload.  The default formats them as a
+        batch in the order of ids; formatters with a way to label readings
+        override this.
+
+        :param ids: Id of each sensor in the group
+        :param values: Value read from each sensor
+        :param timestamp: Epoch timestamp of the readings
+        :return: Formatted payload
+        """
+        return self.transform_batch(values, [timestamp] * len(values))
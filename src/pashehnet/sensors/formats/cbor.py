@@ -0,0 +1,77 @@
+from .template import TemplateFormatBase, _numpy_default
+
+
+def _cbor2():
+    """
+    Util method importing cbor2, which is an optional dependency
+
+    :return: cbor2 module
+    """
+    try:
+        import cbor2
+    except ImportError as e:
+        raise ImportError(
+            'CBOR payloads require cbor2; '
+            'install with `pip install pashehnet[cbor]`'
+        ) from e
+    return cbor2
+
+
+def _cbor_default(encoder, value):
+    """
+    Util method letting cbor2 encode NumPy scalars and arrays
+
+    :param encoder: cbor2 encoder
+    :param value: Value cbor2 can't encode natively
+    :return: None
+    """
+    encoder.encode(_numpy_default(value))
+
+
+def _cbor_array_header(n):
+    """
+    Util method encoding the head of a definite-length CBOR array
+
+    :param n: Number of items in the array
+    :return: Header bytes
+    """
+    if n < 24:
+        return bytes([0x80 + n])
+    for info, size in [(24, 1), (25, 2), (26, 4), (27, 8)]:
+        if n < 1 << (8 * size):
+            return bytes([0x80 + info]) + n.to_bytes(size, 'big')
+    raise ValueError('Array too long for CBOR')
+
+
+class CBORFormat(TemplateFormatBase):
+    """
+    Binary formatter encoding a templated dict as CBOR (RFC 8949) bytes,
+    with the value (and optionally the timestamp) placed by JSONPath
+    selectors as for JSONFormat.  The template is compiled once, so
+    formatting a reading is a single encode of the value (see
+    TemplateFormatBase).
+    See also:
+    - https://cbor.io/
+    """
+    pure = True
+
+    def __init__(self, tpl, value_path, timestamp_path=None, id_path=None):
+        """
+        CTOR
+
+        :param tpl: Template dict for the payload
+        :param value_path: JSONPath selector for value location
+        :param timestamp_path: Optional JSONPath selector for the location \
+        of the reading's epoch timestamp
+        :param id_path: Optional JSONPath selector for the location of the \
+        list of sensor ids in a gateway's group payloads
+        """
+        self.dumps = _cbor2().dumps
+        super(CBORFormat, self).__init__(tpl, value_path, timestamp_path,
+                                         id_path)
+
+    def _encode(self, payload):
+        return self.dumps(payload, default=_cbor_default)
+
+    def _encode_array(self, items):
+        return _cbor_array_header(len(items)) + b''.join(items)
@@ -1,4 +1,4 @@
-from .base import SensorFormatBase
+from .base import SensorFormatBase, pickle_digest
 
 
 class CSVFormat(SensorFormatBase):
@@ -6,7 +6,10 @@ class CSVFormat(SensorFormatBase):
     CSV formatter class for sensor data.  Given a value, format into CSV based
     on the provided template specs.
     """
-    def __init__(self, prefix_fields=None, value_field='value', headers=True):
+    pure = True
+
+    def __init__(self, prefix_fields=None, value_field='value', headers=True,
+                 timestamp_field=None, id_field='id'):
         """
         CTOR for class
 
@@ -14,10 +17,31 @@ class CSVFormat(SensorFormatBase):
         in CSV output
         :param value_field: Name of field where the value will be emitted
         :param headers: Toggle whether headers are generated during formatting
+        :param timestamp_field: Optional name of field, placed before the \
+        value, where the reading's epoch timestamp will be emitted
+        :param id_field: Name of field, placed before the value, where each \
+        sensor's id is emitted in a gateway's group payloads
         """
         self.prefix_fields = prefix_fields or {}
         self.value_field = value_field
         self.headers = headers
+        self.timestamp_field = timestamp_field
+        self.id_field = id_field
+
+    @property
+    def timestamped(self):
+        """
+        :return: True if rows carry a timestamp field
+        """
+        return bool(self.timestamp_field)
+
+    def format_key(self):
+        """
+        :return: Key of the fields and header setting
+        """
+        return pickle_digest((self.prefix_fields, self.value_field,
+                              self.headers, self.timestamp_field,
+                              self.id_field))
 
     def transform(self, value):
         """
@@ -26,10 +50,62 @@ class CSVFormat(SensorFormatBase):
         :param value: Value to transform.
         :return: CSV formatted string
         """
+        return self.transform_at(value, None)
+
+    def transform_at(self, value, timestamp):
+        """
+        Apply the CSV formatting to the given value and timestamp
+
+        :param value: Value to transform.
+        :param timestamp: Epoch timestamp of the reading
+        :return: CSV formatted string
+        """
+        return self.transform_batch([value], [timestamp])
+
+    def transform_batch(self, values, timestamps):
+        """
+        Apply the CSV formatting to a batch of readings, one row each under
+        a single header line
+
+        :param values: Values to transform
+        :param timestamps: Epoch timestamp of each reading
+        :return: CSV formatted string
+        """
+        lines = []
+        keys = list(self.prefix_fields.keys())
+        prefix = [str(x) for x in self.prefix_fields.values()]
+        if self.timestamp_field:
+            keys.append(self.timestamp_field)
+        if self.headers:
+            lines.append(','.join(keys) + ',' + self.value_field)
+        for value, timestamp in zip(values, timestamps):
+            row = prefix.copy()
+            if self.timestamp_field:
+                row.append('' if timestamp is None else str(timestamp))
+            lines.append(','.join(row) + ',' + str(value))
+        return "\n".join(lines)
+
+    def transform_group(self, ids, values, timestamp):
+        """
+        Apply the CSV formatting to a gateway's group of readings, one row
+        per sensor with its id, under a single header line
+
+        :param ids: Id of each sensor in the group
+        :param values: Value read from each sensor
+        :param timestamp: Epoch timestamp of the readings
+        :return: CSV formatted string
+        """
         lines = []
-        keys = self.prefix_fields.keys()
-        values = self.prefix_fields.values()
+        keys = list(self.prefix_fields.keys())
+        prefix = [str(x) for x in self.prefix_fields.values()]
+        if self.timestamp_field:
+            keys.append(self.timestamp_field)
+            prefix.append('' if timestamp is None else str(timestamp))
+        keys.append(self.id_field)
         if self.headers:
             lines.append(','.join(keys) + ',' + self.value_field)
-        lines.append(','.join([str(x) for x in values]) + ',' + str(value))
+        start = ','.join(prefix + [''])
+        lines.extend([
+            f'{start}{id},{value}' for id, value in zip(ids, values)
+        ])
         return "\n".join(lines)
@@ -1,38 +1,62 @@
-import copy
 import json
+import math
 
-from jsonpath_ng import parse
+from .template import TemplateFormatBase, _numpy_default
 
-from .base import SensorFormatBase
+
+def _json_value(value):
+    """
+    Util method serializing a single value exactly as json.dumps would, with
+    fast paths for plain numbers
+
+    :param value: Value to serialize
+    :return: JSON string
+    """
+    if isinstance(value, float):
+        # Same spelling as the json module's float encoder
+        if value != value:
+            return 'NaN'
+        if value == math.inf:
+            return 'Infinity'
+        if value == -math.inf:
+            return '-Infinity'
+        return float.__repr__(value)
+    if type(value) is int:
+        return int.__repr__(value)
+    return json.dumps(value, default=_numpy_default)
 
 
-class JSONFormat(SensorFormatBase):
+class JSONFormat(TemplateFormatBase):
     """
     Formatter class that takes a templated JSON-compatible dict + a JSONPath
     selector spec for the value, and returns properly formatted JSON for any
-    provided value.
+    provided value.  The template is compiled once, so formatting a reading
+    only serializes the value (see TemplateFormatBase).
     See also:
     - https://pypi.org/project/jsonpath-ng/
     """
-    def __init__(self, tpl, value_path):
+    pure = True
+
+    def __init__(self, tpl, value_path, timestamp_path=None, id_path=None):
         """
         Constructor for class
 
         :param tpl: Template dict for JSON data
         :param value_path: JSONPath selector for value location
+        :param timestamp_path: Optional JSONPath selector for the location \
+        of the reading's epoch timestamp
+        :param id_path: Optional JSONPath selector for the location of the \
+        list of sensor ids in a gateway's group payloads
         """
-        self.tpl = tpl
-        self.value_selector = value_path
-        self.jsonpath_expr = parse(value_path)
+        super(JSONFormat, self).__init__(tpl, value_path, timestamp_path,
+                                         id_path)
 
-    def transform(self, value):
-        """
-        Apply formatter transform to value
+    def _encode(self, payload):
+        return json.dumps(payload, default=_numpy_default)
 
-        :param value: Value to inject into JSON template
-        :return: JSON string
-        """
-        payload = copy.deepcopy(self.tpl)
-        matches = self.jsonpath_expr.find(payload)
-        matches[0].full_path.update(payload, value)
-        return json.dumps(payload)
+    def _encode_array(self, items):
+        # Same separator as json.dumps
+        return '[' + ', '.join(items) + ']'
+
+    def _encode_value(self, value):
+        return _json_value(value)
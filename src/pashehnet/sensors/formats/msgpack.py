@@ -0,0 +1,50 @@
+from .template import TemplateFormatBase, _numpy_default
+
+
+def _msgpack():
+    """
+    Util method importing msgpack, which is an optional dependency
+
+    :return: msgpack module
+    """
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ImportError(
+            'MessagePack payloads require msgpack; '
+            'install with `pip install pashehnet[msgpack]`'
+        ) from e
+    return msgpack
+
+
+class MsgPackFormat(TemplateFormatBase):
+    """
+    Binary formatter encoding a templated dict as MessagePack bytes, with
+    the value (and optionally the timestamp) placed by JSONPath selectors as
+    for JSONFormat.  The template is compiled once, so formatting a reading
+    is a single pack of the value (see TemplateFormatBase).
+    See also:
+    - https://msgpack.org/
+    """
+    pure = True
+
+    def __init__(self, tpl, value_path, timestamp_path=None, id_path=None):
+        """
+        CTOR
+
+        :param tpl: Template dict for the payload
+        :param value_path: JSONPath selector for value location
+        :param timestamp_path: Optional JSONPath selector for the location \
+        of the reading's epoch timestamp
+        :param id_path: Optional JSONPath selector for the location of the \
+        list of sensor ids in a gateway's group payloads
+        """
+        self.packer = _msgpack().Packer(default=_numpy_default)
+        super(MsgPackFormat, self).__init__(tpl, value_path, timestamp_path,
+                                            id_path)
+
+    def _encode(self, payload):
+        return self.packer.pack(payload)
+
+    def _encode_array(self, items):
+        return self.packer.pack_array_header(len(items)) + b''.join(items)
@@ -1,10 +1,18 @@
-from .base import SensorFormatBase
+from .base import SensorFormatBase, pickle_digest
 
 
 class SimpleFormat(SensorFormatBase):
     """
     Provides a plain, simple formatter that just returns the stringified value
     """
+    pure = True
+
+    def format_key(self):
+        """
+        :return: Key of nothing, as there is no configuration
+        """
+        return pickle_digest(())
+
     def transform(self, value):
         """
         Format the value using ths builtin str()
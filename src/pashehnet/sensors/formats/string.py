@@ -1,19 +1,38 @@
-from .base import SensorFormatBase
+from .base import SensorFormatBase, pickle_digest
 
 
 class StringFormat(SensorFormatBase):
     """
     Class providing string formatter based on Python core str.format()
     """
-    def __init__(self, tpl, value_field):
+    pure = True
+
+    def __init__(self, tpl, value_field, timestamp_field=None):
         """
         CTOR
 
         :param tpl: Template string to format
         :param value_field: Field in template to place value
+        :param timestamp_field: Optional field in template to place the \
+        reading's epoch timestamp
         """
         self.tpl = tpl
         self.value_field = value_field
+        self.timestamp_field = timestamp_field
+
+    @property
+    def timestamped(self):
+        """
+        :return: True if the template has a timestamp field
+        """
+        return bool(self.timestamp_field)
+
+    def format_key(self):
+        """
+        :return: Key of the template and fields
+        """
+        return pickle_digest((self.tpl, self.value_field,
+                              self.timestamp_field))
 
     def transform(self, value):
         """
@@ -22,7 +41,19 @@ class StringFormat(SensorFormatBase):
         :param value: Value to transform
         :return: Formatted string payload
         """
+        return self.transform_at(value, None)
+
+    def transform_at(self, value, timestamp):
+        """
+        Transform the value and timestamp into formatted payload
+
+        :param value: Value to transform
+        :param timestamp: Epoch timestamp of the reading
+        :return: Formatted string payload
+        """
         kwargs = {
             self.value_field: value
         }
+        if self.timestamp_field:
+            kwargs[self.timestamp_field] = timestamp
         return self.tpl.format(**kwargs)
@@ -0,0 +1,256 @@
+import re
+import struct
+
+import numpy as np
+
+from .base import SensorFormatBase, pickle_digest
+
+# struct format characters for integer fields
+_INTEGER_CODES = set('bBhHiIlLqQnN')
+
+# NumPy equivalents of the standard-size struct format characters, used to
+# pack a gateway's group of readings as one structured array
+_NUMPY_CODES = {
+    'b': 'i1', 'B': 'u1', 'h': 'i2', 'H': 'u2', 'i': 'i4', 'I': 'u4',
+    'l': 'i4', 'L': 'u4', 'q': 'i8', 'Q': 'u8', 'e': 'f2', 'f': 'f4',
+    'd': 'f8', '?': '?',
+}
+_NUMPY_BYTE_ORDERS = {'<': '<', '>': '>', '!': '>', '=': '='}
+
+
+class StructFormat(SensorFormatBase):
+    """
+    Binary formatter packing each reading into a fixed layout with the
+    struct module, as an embedded device would send it: e.g. a 2 byte
+    device id, a 4 byte epoch timestamp and a 4 byte float come to 10 bytes.
+    The layout is compiled once, so formatting a reading is a single pack.
+    See also:
+    - https://docs.python.org/3/library/struct.html
+    """
+    pure = True
+
+    def __init__(self, fields, value_field='value', timestamp_field=None,
+                 byte_order='<', id_field=None):
+        """
+        CTOR
+
+        :param fields: List of [name, format] or [name, format, constant] \
+        entries in layout order, format being a struct format string for \
+        one item such as 'f', 'H' or '8s'.  Every field other than the \
+        value and timestamp fields needs a constant; str constants are \
+        UTF-8 encoded.
+        :param value_field: Name of field where the value will be packed
+        :param timestamp_field: Optional name of field where the reading's \
+        epoch timestamp will be packed, 0 when there is none
+        :param byte_order: struct byte order character; defaults to \
+        little-endian without padding
+        :param id_field: Optional name of field where the sensor id will be \
+        packed in a gateway's group payloads; str ids are UTF-8 encoded
+        """
+        self.fields = fields
+        self.value_field = value_field
+        self.timestamp_field = timestamp_field
+        self.byte_order = byte_order
+        self.id_field = id_field
+
+        names = [field[0] for field in fields]
+        codes = [field[1] for field in fields]
+        for name in [value_field, timestamp_field, id_field]:
+            if name is not None and name not in names:
+                raise ValueError(f'No field named {name} in layout')
+        self.struct = struct.Struct(byte_order + ''.join(codes))
+        self.value_index = names.index(value_field)
+        self.timestamp_index = names.index(timestamp_field) \
+            if timestamp_field else None
+        self.id_index = names.index(id_field) if id_field else None
+        # Integer fields need ints; values and timestamps are often floats
+        self.value_int = codes[self.value_index][-1] in _INTEGER_CODES
+        self.timestamp_int = self.timestamp_index is not None and \
+            codes[self.timestamp_index][-1] in _INTEGER_CODES
+
+        self.args = []
+        for i, field in enumerate(fields):
+            if i in [self.value_index, self.timestamp_index]:
+                self.args.append(0)
+            elif i == self.id_index:
+                self.args.append(b'' if codes[i][-1] in 'sp' else 0)
+            elif len(field) < 3:
+                raise ValueError(f'Field {field[0]} needs a constant')
+            elif isinstance(field[2], str):
+                self.args.append(field[2].encode())
+            else:
+                self.args.append(field[2])
+        # Check the constants fit the layout now rather than on every pack
+        self.struct.pack(*self.args)
+        self.dtype = self._numpy_dtype(codes)
+
+    @property
+    def size(self):
+        """
+        :return: Size of each payload in bytes
+        """
+        return self.struct.size
+
+    @property
+    def timestamped(self):
+        """
+        :return: True if the layout has a timestamp field
+        """
+        return self.timestamp_index is not None
+
+    def format_key(self):
+        """
+        :return: Key of the layout and field names
+        """
+        return pickle_digest((self.fields, self.value_field,
+                              self.timestamp_field, self.byte_order,
+                              self.id_field))
+
+    def transform(self, value):
+        """
+        Pack the value into the layout
+
+        :param value: Value to pack
+        :return: Payload bytes
+        """
+        return self.transform_at(value, None)
+
+    def transform_at(self, value, timestamp):
+        """
+        Pack the value and timestamp into the layout
+
+        :param value: Value to pack
+        :param timestamp: Epoch timestamp of the reading
+        :return: Payload bytes
+        """
+        return self._pack(value, timestamp)
+
+    def transform_group(self, ids, values, timestamp):
+        """
+        Pack a gateway's group of readings as consecutive records, one per
+        sensor, with the sensor id in the id field if there is one.  The
+        records are packed at once as a NumPy structured array when the
+        layout has a standard size and the readings fit their fields; the
+        bytes are the same as packing each, and readings that don't fit
+        raise the same errors.
+
+        :param ids: Id of each sensor in the group
+        :param values: Value read from each sensor
+        :param timestamp: Epoch timestamp of the readings
+        :return: Payload bytes
+        """
+        if self.dtype is not None:
+            values = np.asarray(values)
+            if values.dtype.kind in 'biuf':
+                values = np.rint(values) if self.value_int else values
+                stamp = None
+                if self.timestamp_index is not None and timestamp is not None:
+                    stamp = round(timestamp) if self.timestamp_int \
+                        else timestamp
+                ids = [id.encode() if isinstance(id, str) else id
+                       for id in ids]
+                if self._fits(self.value_index, values) and \
+                        self._fits(self.timestamp_index, stamp) and \
+                        self._fits(self.id_index, ids):
+                    return self._pack_records(values, stamp, ids)
+        return b''.join(
+            self._pack(value, timestamp, id)
+            for id, value in zip(ids, values)
+        )
+
+    def _fits(self, index, values):
+        """
+        Internal method checking numbers fit a numeric field of the NumPy
+        layout, which would otherwise wrap or overflow them silently where
+        struct raises
+
+        :param index: Index of the field, or None if there is none
+        :param values: Value or values to check, or None
+        :return: True if the values can be assigned to the field as is
+        """
+        if index is None or values is None:
+            return True
+        dtype = self.dtype[index]
+        if dtype.kind not in 'iuf':
+            return True
+        values = np.asarray(values)
+        if values.dtype.kind not in 'biuf':
+            return False
+        if dtype.kind == 'f':
+            values = np.abs(values[np.isfinite(values)])
+            return not values.size or values.max() <= np.finfo(dtype).max
+        info = np.iinfo(dtype)
+        return not values.size or (
+            values.min() >= info.min and values.max() <= info.max
+        )
+
+    def _pack_records(self, values, timestamp, ids):
+        """
+        Internal method packing a group's records at once as a NumPy
+        structured array
+
+        :param values: Value of each record, rounded for integer fields
+        :param timestamp: Timestamp to pack, rounded for integer fields, or \
+        None
+        :param ids: Encoded id of each record
+        :return: Records bytes
+        """
+        records = np.empty(len(values), dtype=self.dtype)
+        for i, arg in enumerate(self.args):
+            records[f'f{i}'] = arg
+        records[f'f{self.value_index}'] = values
+        if self.timestamp_index is not None and timestamp is not None:
+            records[f'f{self.timestamp_index}'] = timestamp
+        if self.id_index is not None:
+            records[f'f{self.id_index}'] = ids
+        return records.tobytes()
+
+    def _pack(self, value, timestamp, id=None):
+        """
+        Internal method packing one record
+
+        :param value: Value to pack
+        :param timestamp: Epoch timestamp of the reading, or None
+        :param id: Sensor id to pack in the id field, if any
+        :return: Record bytes
+        """
+        args = self.args.copy()
+        args[self.value_index] = int(round(value)) if self.value_int else \
+            value
+        if self.timestamp_index is not None and timestamp is not None:
+            args[self.timestamp_index] = int(round(timestamp)) \
+                if self.timestamp_int else timestamp
+        if self.id_index is not None and id is not None:
+            args[self.id_index] = id.encode() if isinstance(id, str) else id
+        return self.struct.pack(*args)
+
+    def _numpy_dtype(self, codes):
+        """
+        Internal method translating the layout to a NumPy structured dtype
+
+        :param codes: struct format string of each field
+        :return: numpy.dtype with the same packed layout, or None if the \
+        layout uses native sizes or codes NumPy has no equivalent for
+        """
+        order = _NUMPY_BYTE_ORDERS.get(self.byte_order)
+        if order is None:
+            return None
+        formats = []
+        for code in codes:
+            match = re.fullmatch(r'(\d*)([a-zA-Z?])', code)
+            if match is None:
+                return None
+            count, char = match.groups()
+            if char == 's':
+                formats.append(f'S{count or 1}')
+            elif char in _NUMPY_CODES and not count:
+                formats.append(order + _NUMPY_CODES[char])
+            else:
+                return None
+        dtype = np.dtype({
+            'names': [f'f{i}' for i in range(len(codes))],
+            'formats': formats,
+        })
+        if dtype.itemsize != self.struct.size:
+            return None
+        return dtype
@@ -0,0 +1,219 @@
+import copy
+import uuid
+from abc import abstractmethod
+
+import numpy as np
+from jsonpath_ng import parse
+
+from .base import SensorFormatBase, pickle_digest
+
+
+def _numpy_default(obj):
+    """
+    Util method letting encoders serialize NumPy scalars and arrays, as
+    produced by array-backed sources and batched transforms
+
+    :param obj: Object the encoder can't serialize natively
+    :return: Plain Python equivalent
+    """
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(
+        f'Object of type {type(obj).__name__} is not serializable'
+    )
+
+
+class TemplateFormatBase(SensorFormatBase):
+    """
+    Base class for formatters that take a templated dict + JSONPath
+    selectors for the value (and optionally the timestamp), and encode the
+    filled-in template, e.g. as JSON or MessagePack.
+
+    The template is compiled once: it's encoded with placeholders in the
+    value and timestamp slots and split around them, so formatting a reading
+    only encodes the value and joins the pieces.  Output is identical to
+    filling in a copy of the template and encoding it whole, which is still
+    done for templates the selectors don't resolve in.  Subclasses provide
+    the encoding, which must encode a dict as the concatenation of its
+    parts.
+    """
+    def __init__(self, tpl, value_path, timestamp_path=None, id_path=None):
+        """
+        CTOR
+
+        :param tpl: Template dict for the payload
+        :param value_path: JSONPath selector for value location
+        :param timestamp_path: Optional JSONPath selector for the location \
+        of the reading's epoch timestamp
+        :param id_path: Optional JSONPath selector for the location of the \
+        list of sensor ids in a gateway's group payloads
+        """
+        self.tpl = tpl
+        self.value_selector = value_path
+        self.jsonpath_expr = parse(value_path)
+        self.timestamp_selector = timestamp_path
+        self.timestamp_expr = parse(timestamp_path) if timestamp_path else \
+            None
+        self.id_selector = id_path
+        self.id_expr = parse(id_path) if id_path else None
+        self.pieces, self.value_first = self._compile()
+
+    @property
+    def timestamped(self):
+        """
+        :return: True if the template has a timestamp location
+        """
+        return self.timestamp_expr is not None
+
+    def format_key(self):
+        """
+        :return: Key of the template and selectors, which determine the \
+        payloads along with the subclass
+        """
+        return pickle_digest((self.tpl, self.value_selector,
+                              self.timestamp_selector, self.id_selector))
+
+    def transform(self, value):
+        """
+        Apply formatter transform to value
+
+        :param value: Value to inject into the template
+        :return: Encoded payload
+        """
+        return self.transform_at(value, None)
+
+    def transform_at(self, value, timestamp):
+        """
+        Apply formatter transform to value and timestamp
+
+        :param value: Value to inject into the template
+        :param timestamp: Epoch timestamp to inject into the template
+        :return: Encoded payload
+        """
+        pieces = self.pieces
+        if pieces is None:
+            return self._fill(value, timestamp)
+        if len(pieces) == 2:
+            return pieces[0] + self._encode_value(value) + pieces[1]
+        if self.value_first:
+            first, second = value, timestamp
+        else:
+            first, second = timestamp, value
+        return pieces[0] + self._encode_value(first) + pieces[1] + \
+            self._encode_value(second) + pieces[2]
+
+    def transform_batch(self, values, timestamps):
+        """
+        Apply formatter transform to a batch of readings, encoded as an
+        array of payloads
+
+        :param values: Values to inject into the template
+        :param timestamps: Epoch timestamp of each reading
+        :return: Encoded payload
+        """
+        return self._encode_array([
+            self.transform_at(v, t) for v, t in zip(values, timestamps)
+        ])
+
+    def transform_group(self, ids, values, timestamp):
+        """
+        Apply formatter transform to a gateway's group of readings, encoded
+        as a single columnar payload: the value location holds the list of
+        values, and the id location, if any, the matching list of ids
+
+        :param ids: Id of each sensor in the group
+        :param values: Value read from each sensor
+        :param timestamp: Epoch timestamp of the readings
+        :return: Encoded payload
+        """
+        if isinstance(values, np.ndarray):
+            values = values.tolist()
+        payload = copy.deepcopy(self.tpl)
+        if self.id_expr:
+            matches = self.id_expr.find(payload)
+            matches[0].full_path.update(payload, list(ids))
+        matches = self.jsonpath_expr.find(payload)
+        matches[0].full_path.update(payload, list(values))
+        if self.timestamp_expr:
+            matches = self.timestamp_expr.find(payload)
+            matches[0].full_path.update(payload, timestamp)
+        return self._encode(payload)
+
+    @abstractmethod
+    def _encode(self, payload):
+        """
+        Pure abstract method encoding a whole payload
+
+        :param payload: Filled-in template
+        :return: Encoded payload
+        """
+        ...
+
+    @abstractmethod
+    def _encode_array(self, items):
+        """
+        Pure abstract method encoding an array from already encoded items
+
+        :param items: List of encoded items
+        :return: Encoded array
+        """
+        ...
+
+    def _encode_value(self, value):
+        """
+        Internal method encoding a single value, exactly as it would be
+        encoded within a payload; override with faster paths as needed
+
+        :param value: Value to encode
+        :return: Encoded value
+        """
+        return self._encode(value)
+
+    def _fill(self, value, timestamp):
+        """
+        Internal method filling in a copy of the template and encoding it
+
+        :param value: Value to inject into the template
+        :param timestamp: Epoch timestamp to inject into the template
+        :return: Encoded payload
+        """
+        payload = copy.deepcopy(self.tpl)
+        matches = self.jsonpath_expr.find(payload)
+        matches[0].full_path.update(payload, value)
+        if self.timestamp_expr:
+            matches = self.timestamp_expr.find(payload)
+            matches[0].full_path.update(payload, timestamp)
+        return self._encode(payload)
+
+    def _compile(self):
+        """
+        Internal method encoding the template around its value and
+        timestamp slots
+
+        :return: Tuple of the static pieces between and around the slots, \
+        or None if the template can't be compiled, and whether the value \
+        slot comes before the timestamp slot
+        """
+        token = uuid.uuid4().hex
+        value_mark = f'value-{token}'
+        timestamp_mark = f'timestamp-{token}'
+        try:
+            encoded = self._fill(value_mark, timestamp_mark)
+        except Exception:
+            return None, True
+        value_mark = self._encode(value_mark)
+        timestamp_mark = self._encode(timestamp_mark)
+        # Each slot must appear exactly once; both selectors pointing at one
+        # location, for instance, leaves one out
+        if encoded.count(value_mark) != 1:
+            return None, True
+        pieces = encoded.split(value_mark)
+        if not self.timestamp_expr:
+            return pieces, True
+        if encoded.count(timestamp_mark) != 1:
+            return None, True
+        value_first = encoded.find(value_mark) < encoded.find(timestamp_mark)
+        pieces = [
+            piece for part in pieces for piece in part.split(timestamp_mark)
+        ]
+        return pieces, value_first
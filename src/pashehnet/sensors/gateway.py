@@ -0,0 +1,103 @@
+import numpy as np
+
+from .sensor import Sensor
+
+
+class Gateway(Sensor):
+    """
+    Groups sensors behind a single gateway, as in a building where one
+    device forwards the readings of many.  Each tick reads every sensor in
+    the group at once and publishes one combined payload, built by the
+    format's transform_group(), so the message count drops by the group
+    size.
+
+    The gateway is scheduled like a sensor at its own frequency; its
+    sensors only contribute their source and transforms.  Values are read
+    `block_size` ticks ahead for the whole group, each sensor's block with
+    next_batch() and transform_batch(), and every tick takes one column.
+    """
+    def __init__(self, id, sensors, format, frequency=1,
+                 lag_policy=Sensor.LAG_CATCHUP, clock=None, block_size=256,
+                 compressor=None):
+        """
+        Construct new object
+
+        :param id: the unique ID of this gateway
+        :param sensors: Sensors in the group; their ids label the readings \
+        in the combined payload
+        :param format: Format object with a transform_group(), subclass of \
+        SensorFormatBase
+        :param frequency: Frequency of the combined readings in Hz
+        :param lag_policy: What to do when ticks fall behind their \
+        deadlines, as for Sensor
+        :param clock: Clock to pace ticks and timestamp readings with; a \
+        SensorNetwork replaces this with its own clock
+        :param block_size: Number of ticks read ahead for the whole group \
+        at a time
+        :param compressor: Optional compressor for the combined payloads, \
+        as for Sensor
+        """
+        if any(sensor.replay_speed for sensor in sensors):
+            raise ValueError('Gateway sensors cannot replay at recorded times')
+        super(Gateway, self).__init__(
+            id, None, format, frequency=frequency, lag_policy=lag_policy,
+            clock=clock, block_size=block_size, compressor=compressor,
+            precompute=False
+        )
+        self.sensors = list(sensors)
+        self.ids = [sensor.id for sensor in self.sensors]
+
+    @property
+    def weight(self):
+        """
+        :return: Number of sensors read each tick, for balancing workers
+        """
+        return len(self.sensors)
+
+    def sources(self):
+        """
+        :return: List of the sources of every sensor in the group
+        """
+        return [sensor.source for sensor in self.sensors]
+
+    def reseed(self, seed):
+        """
+        Reseed every sensor in the group (see Sensor.reseed())
+
+        :param seed: Master seed
+        :return: None
+        """
+        for sensor in self.sensors:
+            sensor.reseed(seed)
+
+    def read(self):
+        """
+        Read the next value of every sensor in the group and format them
+        into one payload
+
+        :return: Formatted payload
+        """
+        self.timestamp = self.clock.time()
+        if self.block is None or self.block_pos == self.block.shape[1]:
+            self.block = self._read_block(self.block_size)
+            self.block_pos = 0
+        values = self.block[:, self.block_pos]
+        self.block_pos += 1
+        return self.format.transform_group(self.ids, values, self.timestamp)
+
+    def _read_block(self, n):
+        """
+        Internal method reading the next block of values of every sensor
+
+        :param n: Number of values to read per sensor
+        :return: ndarray of transformed values, one row per sensor
+        """
+        blocks = [np.asarray(sensor._read_block(n)) for sensor in self.sensors]
+        if len({block.dtype.kind in 'biuf' for block in blocks}) == 1:
+            return np.vstack(blocks)
+        # Stacking strings with numbers would turn every value into a
+        # string, so mixed groups keep each sensor's values as objects
+        rows = np.empty((len(blocks), n), dtype=object)
+        for i, block in enumerate(blocks):
+            rows[i] = block.tolist()
+        return rows
@@ -1,19 +1,57 @@
 import pandas as pd
 
-from .sources import SeriesSource
+from .sources import CSVColumnReader, ParquetColumnReader
 
 
-def sources_from_csv(uri, **kwargs):
+def sources_from_csv(uri, chunksize=65536, time_column=None,
+                     sample_rate=None, max_chunks=None, **kwargs):
     """
     Util method to create a collection of sensors from a columnar CSV file
-    via Pandas
+    via Pandas.  All sources share one chunked reader, so the file is never
+    held in memory as a whole.
 
     :param uri: Location to load CSV from
+    :param chunksize: Number of rows to read at a time
+    :param time_column: Optional column holding each row's recorded time; \
+    it gets no source of its own and the other sources can replay at the \
+    recorded times (see Sensor's replay_speed)
+    :param sample_rate: Optional rate the rows were recorded at, in Hz
+    :param max_chunks: Optional limit on the number of chunks held (see \
+    ColumnarReaderBase)
     :param kwargs: Passthrough args to Pandas
-    :return: Dict of SeriesSensor objects keyed to CSV column names
+    :return: Dict of ColumnSource objects keyed to CSV column names
     """
-    sources = {}
-    df = pd.read_csv(uri, **kwargs)
-    for col in df.columns:
-        sources[col] = SeriesSource(df[col])
-    return sources
+    columns = pd.read_csv(uri, nrows=0, **kwargs).columns
+    reader = CSVColumnReader(
+        uri, chunksize=chunksize, max_chunks=max_chunks, **kwargs
+    )
+    return {
+        col: reader.column(col, time_column, sample_rate)
+        for col in columns if col != time_column
+    }
+
+
+def sources_from_parquet(uri, columns=None, batch_size=65536,
+                         time_column=None, sample_rate=None, max_chunks=None):
+    """
+    Util method to create a collection of sensors from a Parquet file via
+    pyarrow, reading only the requested columns.  All sources share one
+    chunked reader.
+
+    :param uri: Location to load the Parquet file from
+    :param columns: Columns to create sources for; defaults to all
+    :param batch_size: Number of rows to read at a time
+    :param time_column: Optional column holding each row's recorded time, \
+    as for sources_from_csv()
+    :param sample_rate: Optional rate the rows were recorded at, in Hz
+    :param max_chunks: Optional limit on the number of chunks held (see \
+    ColumnarReaderBase)
+    :return: Dict of ColumnSource objects keyed to column names
+    """
+    reader = ParquetColumnReader(
+        uri, batch_size=batch_size, max_chunks=max_chunks
+    )
+    return {
+        col: reader.column(col, time_column, sample_rate)
+        for col in columns or reader.names() if col != time_column
+    }
@@ -0,0 +1,43 @@
+import sys
+from array import array
+
+
+class PayloadTable(object):
+    """
+    One full period of a sensor's formatted payloads, rendered once.  The
+    payloads are stored back to back in a single str or bytes object, the
+    type the formatter produced, with an array of offsets, so the table
+    costs little more than the payload bytes themselves and handing out a
+    payload is a single slice.
+    """
+    def __init__(self, payloads):
+        """
+        CTOR
+
+        :param payloads: List of formatted payloads, all str or all bytes
+        """
+        empty = b'' if isinstance(payloads[0], bytes) else ''
+        self.data = empty.join(payloads)
+        self.offsets = array('q', [0])
+        end = 0
+        for payload in payloads:
+            end += len(payload)
+            self.offsets.append(end)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        """
+        :param i: Index of the payload in the period
+        :return: Formatted payload
+        """
+        return self.data[self.offsets[i]:self.offsets[i + 1]]
+
+    @property
+    def nbytes(self):
+        """
+        :return: Memory held by the table in bytes, for cache budgets
+        """
+        return sys.getsizeof(self.data) + \
+            self.offsets.itemsize * len(self.offsets)
@@ -1,4 +1,73 @@
-import time
+import logging
+
+from pashehnet.clock import RealClock
+from pashehnet.rng import derive_rng
+from .payload_table import PayloadTable
+from .sources import ResampledSource, sample_cache
+
+
+class TickStats(object):
+    """
+    Running tally of how late a sensor's ticks fire relative to their
+    scheduled deadlines; steadily growing lateness means the host is
+    saturated.  Networks log a summary() of each sensor's ticks every
+    REPORT_INTERVAL seconds.
+    """
+    def __init__(self):
+        self.ticks = 0
+        self.late = 0
+        self.skipped = 0
+        self.behind = 0
+        self.last_lateness = 0.0
+        self.max_lateness = 0.0
+        self.total_lateness = 0.0
+        self.reported = None
+        self.window = (0, 0, 0, 0, 0.0)
+        self.window_max = 0.0
+
+    @property
+    def mean_lateness(self):
+        """
+        :return: Mean lateness per tick in seconds
+        """
+        return self.total_lateness / self.ticks if self.ticks else 0.0
+
+    def record(self, lateness):
+        """
+        Record the lateness of a single tick
+
+        :param lateness: Seconds between the deadline and the actual tick
+        :return: None
+        """
+        self.ticks += 1
+        self.last_lateness = lateness
+        self.total_lateness += lateness
+        if lateness > 0.0:
+            self.late += 1
+            self.max_lateness = max(self.max_lateness, lateness)
+            self.window_max = max(self.window_max, lateness)
+
+    def summary(self):
+        """
+        Summarize the ticks since the last summary and start a new window
+
+        :return: Tuple of the summary and whether any tick ran late or was \
+        skipped
+        """
+        counts = (self.ticks, self.late, self.skipped, self.behind,
+                  self.total_lateness)
+        ticks, late, skipped, behind, lateness = [
+            now - before for now, before in zip(counts, self.window)
+        ]
+        mean = lateness / ticks if ticks else 0.0
+        summary = (
+            f'{ticks} ticks, {late} late (mean {mean:.3f}s, '
+            f'max {self.window_max:.3f}s), {behind} caught up a period or '
+            f'more behind, {skipped} skipped'
+        )
+        self.window = counts
+        self.window_max = 0.0
+        return summary, bool(late or skipped)
 
 
 class Sensor(object):
@@ -6,8 +75,30 @@ class Sensor(object):
     Wrapper class for source, transform(s) and formatting of sensor
     data, implemented as an iterator. Applies transforms and
     formatter to values provided by source.
+
+    Ticks are paced on absolute monotonic deadlines, so time spent reading,
+    transforming and publishing does not stretch the period.  With a
+    replay_speed, each value's deadline is instead taken from its recorded
+    time, reproducing the recording's irregular timing.
+
+    A sensor reading a periodic source (see period()) without transforms,
+    batching or timestamps in its payloads publishes a periodic sequence of
+    payloads.  These are formatted once, for a whole period, into a
+    PayloadTable shared by identically configured sensors through the
+    sample cache, and each tick hands out the next one.
     """
-    def __init__(self, id, source, format, transforms=[], frequency=1):
+    LAG_CATCHUP = 'catchup'
+    LAG_SKIP = 'skip'
+    LAG_POLICIES = [LAG_CATCHUP, LAG_SKIP]
+
+    # Longest period, in values, formatted ahead into a payload table
+    MAX_TABLE_PERIOD = 65536
+
+    def __init__(self, id, source, format, transforms=[], frequency=1,
+                 lag_policy=LAG_CATCHUP, clock=None, replay_speed=None,
+                 replay_start=None, resample=None, block_size=1,
+                 batch_size=None, batch_interval=None, compressor=None,
+                 precompute=True):
         """
         Construct new object
 
@@ -17,7 +108,49 @@ class Sensor(object):
         :param transforms: One or more transforms in order to be called, \
         subclasses of SensorTransformBase
         :param freq: Frequency of signal in Hz
+        :param lag_policy: What to do when ticks fall behind their deadlines; \
+        'catchup' fires the missed ticks back to back, 'skip' drops them and \
+        resumes on the next deadline still in the future
+        :param clock: Clock to pace ticks and timestamp readings with, \
+        subclass of ClockBase; defaults to real time.  A SensorNetwork \
+        replaces this with its own clock.
+        :param replay_speed: Replay values at their recorded times, at this \
+        multiple of the recorded rate, instead of every 1/frequency seconds; \
+        requires a source with timestamps (see next_timed())
+        :param replay_start: Recorded time, in seconds, that maps to the \
+        start of the replay; defaults to the first recorded value.  Sensors \
+        in a network default to a common start so channels stay aligned.
+        :param resample: Resample the source from its declared sample_rate \
+        to this sensor's frequency, using 'hold', 'linear' or 'decimate' \
+        (see ResampledSource); by default each tick takes the next value
+        :param block_size: Number of values read from the source and run \
+        through every transform at a time, using next_batch() and \
+        transform_batch(); blocks above 1 take the per-value work of \
+        high-rate sensors out of the interpreter.  Not available with \
+        replay_speed.
+        :param batch_size: Number of readings published together as one \
+        payload, each keeping its own timestamp (see the format's \
+        transform_batch()); defaults to 1, or to no limit with \
+        batch_interval
+        :param batch_interval: Publish the readings of every batch_interval \
+        seconds together as one payload, sent on the first reading after \
+        the interval; can be combined with batch_size, whichever fills first
+        :param compressor: Optional compressor object, subclass of \
+        SensorCompressorBase, applied to every payload by the network on \
+        the publishing side; read() still returns uncompressed payloads
+        :param precompute: Format the payloads of periodic sensors once, \
+        ahead of time, when possible (see precompute())
         """
+        if block_size > 1 and replay_speed:
+            raise ValueError('block_size is not available with replay_speed')
+        if batch_size is not None and batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+        if replay_speed is not None and replay_speed <= 0:
+            raise ValueError('replay_speed must be positive')
+        if lag_policy not in self.LAG_POLICIES:
+            raise ValueError(f'Unknown lag policy: {lag_policy}')
+        if resample:
+            source = ResampledSource(source, frequency, resample)
         self.id = id
         self.source = source
         self.format = format
@@ -26,6 +159,27 @@ class Sensor(object):
         self.delay = 1.0 / frequency if \
             (frequency and frequency > 0.0) else \
             None
+        self.lag_policy = lag_policy
+        self.clock = clock or RealClock()
+        self.replay_speed = replay_speed
+        self.replay_start = replay_start
+        self.replay_origin = None
+        self.pending = None
+        self.value = None
+        self.block_size = block_size
+        self.block = None
+        self.block_pos = 0
+        self.batch_size = batch_size or (None if batch_interval else 1)
+        self.batch_interval = batch_interval
+        self.batch_values = []
+        self.batch_times = []
+        self.compressor = compressor
+        self.precompute_payloads = precompute
+        self.payloads = None
+        self.payload_pos = 0
+        self.deadline = None
+        self.timestamp = None
+        self.stats = TickStats()
 
     def __iter__(self):
         """
@@ -39,17 +193,293 @@ class Sensor(object):
         """
         Implementation for iterator
 
-        :return: Next value from sensor stream
+        :return: Next value from sensor stream; None while a batch fills up
         """
-        if self.delay:
-            time.sleep(self.delay)
+        if self.paced:
+            if self.deadline is None:
+                self.reset(self.clock.monotonic())
+            self.clock.sleep_until(self.deadline)
+            self.tick(self.clock.monotonic())
+        return self.read()
 
-        # Get next value from source iterator
-        value = next(self.source)
+    @property
+    def weight(self):
+        """
+        :return: Number of sensors read each tick, for balancing workers
+        """
+        return 1
 
-        # Apply all transforms in order provided, if given
-        for xform in self.transforms:
-            value = xform.transform(value)
+    def sources(self):
+        """
+        :return: List of the sources read from, for networks to warm up
+        """
+        return [self.source]
+
+    @property
+    def paced(self):
+        """
+        :return: True if ticks wait for deadlines
+        """
+        return bool(self.delay or self.replay_speed)
+
+    def reset(self, now):
+        """
+        (Re)start the deadline schedule, first tick due one period from now;
+        when replaying, the replay start is due now
+
+        :param now: Current monotonic time on the sensor's clock
+        :return: None
+        """
+        if self.replay_speed:
+            self.prefetch()
+            self.replay_origin = now
+            self.deadline = self._replay_deadline()
+        else:
+            self.deadline = now + self.delay if self.delay else now
+
+    def reseed(self, seed):
+        """
+        Give the source and each transform a random stream of its own,
+        derived from a master seed, this sensor's id and the transform's
+        position, so the sensor's output depends on nothing else
+
+        :param seed: Master seed
+        :return: None
+        """
+        self.source.reseed(derive_rng(seed, self.id, 'source'))
+        for i, xform in enumerate(self.transforms):
+            xform.reseed(derive_rng(seed, self.id, 'transform', i))
+
+    def precompute(self):
+        """
+        Format one full period of payloads ahead, if this sensor's payloads
+        are periodic: the source is periodic (see period()), there are no
+        transforms or batching, and the format is precomputable.  Networks
+        call this when starting; otherwise the first read() does.
+
+        :return: True if reads now come from the payload table
+        """
+        if self.precompute_payloads:
+            self.precompute_payloads = False
+            if not (self.transforms or self.replay_speed or
+                    self.batch_size != 1 or not self.format.precomputable):
+                self.payloads, self.payload_pos = self._payload_table()
+        return self.payloads is not None
+
+    def prefetch(self):
+        """
+        Fetch the first recorded value of a replay ahead of starting it
+
+        :return: Recorded time of the first value in seconds
+        """
+        if self.pending is None:
+            self.pending = self.source.next_timed()
+        if self.replay_start is None:
+            self.replay_start = self.pending[0]
+        return self.pending[0]
+
+    def rewind(self):
+        """
+        Drop a replay's prefetched value and rewind the source, keeping the
+        replay start, so a replay aligned in a network's parent process
+        reads its source afresh in its worker; sources that can't rewind
+        keep their prefetched value
+
+        :return: None
+        """
+        if self.pending is not None and self.source.rewind():
+            self.pending = None
+
+    def tick(self, now):
+        """
+        Record the lateness of the tick due at the current deadline and
+        advance to the next one according to the lag policy
+
+        :param now: Monotonic time the tick actually fired, on the \
+        sensor's clock
+        :return: None
+        """
+        if self.replay_speed:
+            self._tick_replay(now)
+            return
+        if not self.delay:
+            self.deadline = now
+            return
+
+        lateness = max(0.0, now - self.deadline)
+        self.stats.record(lateness)
+        self.deadline += self.delay
+        if lateness >= self.delay and self.lag_policy == self.LAG_CATCHUP:
+            # Part of a burst firing missed ticks back to back
+            self.stats.behind += 1
+
+        if self.lag_policy == self.LAG_SKIP and self.deadline <= now:
+            missed = int((now - self.deadline) // self.delay) + 1
+            self.deadline += missed * self.delay
+            self.stats.skipped += missed
+            logging.warning(
+                f'Sensor {self.id} running {lateness:.3f}s late, '
+                f'skipped {missed} ticks'
+            )
+
+    def _tick_replay(self, now):
+        """
+        Internal method taking the value due at the current deadline and
+        scheduling the next one at its recorded time
+
+        :param now: Monotonic time the tick actually fired
+        :return: None
+        """
+        lateness = max(0.0, now - self.deadline)
+        self.stats.record(lateness)
+        self.value = self.pending[1]
+        skipped = 0
+        while True:
+            self.pending = self.source.next_timed()
+            self.deadline = self._replay_deadline()
+            if self.lag_policy != self.LAG_SKIP or self.deadline > now:
+                break
+            skipped += 1
+
+        if skipped:
+            self.stats.skipped += skipped
+            logging.warning(
+                f'Sensor {self.id} running {lateness:.3f}s behind replay, '
+                f'skipped {skipped} values'
+            )
+
+    def _replay_deadline(self):
+        """
+        Internal method mapping the pending value's recorded time onto the
+        sensor's clock
+
+        :return: Monotonic deadline
+        """
+        return self.replay_origin + \
+            (self.pending[0] - self.replay_start) / self.replay_speed
+
+    def read(self):
+        """
+        Read, transform and format the next value from the source without
+        any pacing; schedulers that manage timing themselves call this
+        directly instead of iterating.
+
+        :return: Next formatted payload, or None while a batch fills up
+        """
+        self.timestamp = self.clock.time()
+
+        if self.precompute_payloads:
+            self.precompute()
+        if self.payloads is not None:
+            payload = self.payloads[self.payload_pos]
+            self.payload_pos += 1
+            if self.payload_pos == len(self.payloads):
+                self.payload_pos = 0
+            return payload
+
+        if self.block_size > 1:
+            # Values come already transformed from the current block
+            if self.block is None or self.block_pos == len(self.block):
+                self.block = self._read_block(self.block_size)
+                self.block_pos = 0
+            value = self.block[self.block_pos]
+            self.block_pos += 1
+        else:
+            # Get next value from source iterator, or the value due for a
+            # replay
+            if self.replay_speed:
+                if self.replay_origin is None:
+                    self.reset(self.clock.monotonic())
+                    self.tick(self.deadline)
+                value = self.value
+            else:
+                value = next(self.source)
+
+            # Apply all transforms in order provided, if given
+            for xform in self.transforms:
+                value = xform.transform(value)
 
         # Format final output
-        return self.format.transform(value)
+        if self.batch_size == 1:
+            return self.format.transform_at(value, self.timestamp)
+        return self._batch(value)
+
+    def flush(self):
+        """
+        Format the readings batched so far into one payload and start a new
+        batch
+
+        :return: Formatted payload, or None if no readings are batched
+        """
+        if not self.batch_values:
+            return None
+        payload = self.format.transform_batch(self.batch_values,
+                                              self.batch_times)
+        self.batch_values = []
+        self.batch_times = []
+        return payload
+
+    def _batch(self, value):
+        """
+        Internal method adding a reading to the current batch, publishing
+        the batch once it is full
+
+        :param value: Transformed value read at self.timestamp
+        :return: Formatted payload of a finished batch, or None
+        """
+        payload = None
+        if self.batch_interval and self.batch_times and \
+                self.timestamp - self.batch_times[0] >= self.batch_interval:
+            payload = self.flush()
+        self.batch_values.append(value)
+        self.batch_times.append(self.timestamp)
+        if payload is None and self.batch_size and \
+                len(self.batch_values) >= self.batch_size:
+            payload = self.flush()
+        return payload
+
+    def _payload_table(self):
+        """
+        Internal method formatting the source's period into a payload table,
+        going through the process-wide sample cache when both the values and
+        the format can be keyed
+
+        :return: Tuple of the PayloadTable and the index of the next \
+        payload in it, or (None, 0) if the source isn't periodic, its \
+        period is too long or formatting it fails
+        """
+        period = self.source.period()
+        if period is None:
+            return None, 0
+        values, start, values_key = period
+        if not 0 < len(values) <= self.MAX_TABLE_PERIOD:
+            return None, 0
+
+        def generate():
+            return PayloadTable([self.format.transform(v) for v in values])
+
+        try:
+            format_key = self.format.format_key()
+            if values_key is None or format_key is None:
+                return generate(), start
+            key = 'payloads', values_key, type(self.format), format_key
+            return sample_cache.get(key, generate), start
+        except Exception as e:
+            logging.warning(
+                f'Sensor {self.id} formats every tick, '
+                f'precomputing payloads failed: {str(e)}'
+            )
+            return None, 0
+
+    def _read_block(self, n):
+        """
+        Internal method reading the next block of values from the source and
+        running it through the whole transform chain
+
+        :param n: Number of values to read
+        :return: ndarray of transformed values
+        """
+        values = self.source.next_batch(n)
+        for xform in self.transforms:
+            values = xform.transform_batch(values)
+        return values
@@ -2,12 +2,29 @@
 The `pashehnet.sensors.sources` package contains the data sources for sensors.
 """
 from .base import SensorSourceBase  # noqa: F401
+from .cyclic import CyclicSourceBase  # noqa: F401
 from .constant import ConstantValueSource  # noqa: F401
 from .sawtoothwave import SawtoothWaveSource  # noqa: F401
 from .squarewave import SquareWaveSource  # noqa: F401
 from .sweep_poly import SweepPolySource  # noqa: F401
 from .unit_impulse import UnitImpulseSource  # noqa: F401
+from .generator import GeneratorSourceBase  # noqa: F401
+from .square_generator import SquareWaveGenerator  # noqa: F401
+from .sawtooth_generator import SawtoothWaveGenerator  # noqa: F401
+from .gaussian_generator import GaussianPulseGenerator  # noqa: F401
 from .chirp import ChirpSource  # noqa: F401
 from .gaussianpulse import GaussianPulseSource  # noqa: F401
 from .file import FileSource  # noqa: F401
+from .streaming_file import StreamingFileSource  # noqa: F401
+from .binary_file import BinaryFileSource  # noqa: F401
+from .columnar import ColumnarReaderBase, ColumnSource  # noqa: F401
+from .csv_columns import CSVColumnReader  # noqa: F401
+from .parquet_columns import ParquetColumnReader  # noqa: F401
+from .fleet import FleetSourceBase  # noqa: F401
+from .random_walk_fleet import RandomWalkFleet  # noqa: F401
+from .ar1_fleet import AR1Fleet  # noqa: F401
+from .trend_fleet import TrendFleet  # noqa: F401
+from .resampled import ResampledSource  # noqa: F401
 from .series import SeriesSource  # noqa: F401
+from .cache import SampleCache, sample_cache  # noqa: F401
+from .shared import SharedSamples  # noqa: F401
@@ -0,0 +1,46 @@
+import numpy as np
+from scipy import signal
+
+from .fleet import FleetSourceBase
+
+
+class AR1Fleet(FleetSourceBase):
+    """
+    Fleet of channels each following a first-order autoregressive process,
+    x[t] = mean + phi * (x[t-1] - mean) + noise, which reverts to its mean
+    at a rate set by phi.  The noise can be correlated across channels.
+    """
+    def __init__(self, n, phi=0.9, mean=0.0, scale=1.0, correlation=0.0,
+                 block_size=256, seed=None, max_chunks=None):
+        """
+        Construct new object
+
+        :param n: Number of channels
+        :param phi: Autoregression coefficient, scalar in (-1, 1)
+        :param mean: Long-run mean, scalar or one per channel
+        :param scale: Standard deviation of the noise, scalar or one per \
+        channel
+        :param correlation: Correlation between the noise of every pair of \
+        channels, [0, 1]
+        :param block_size: Number of time steps computed at a time
+        :param seed: Seed for the random number generator
+        :param max_chunks: Optional limit on the number of blocks held (see \
+        ColumnarReaderBase)
+        """
+        super(AR1Fleet, self).__init__(n, block_size, seed, max_chunks)
+        self.phi = phi
+        self.mean = np.broadcast_to(np.asarray(mean, dtype=float), (n,))
+        self.scale = scale
+        self.correlation = correlation
+        # Deviation from the mean after the last step
+        self.state = np.zeros(n)
+
+    def _step(self, steps):
+        noise = self._innovations(steps, self.scale, self.correlation)
+        # The recurrence runs over time for every channel in one call
+        dev, _ = signal.lfilter(
+            [1.0], [1.0, -self.phi], noise, axis=0,
+            zi=self.phi * self.state[np.newaxis, :]
+        )
+        self.state = dev[-1]
+        return self.mean + dev
@@ -1,11 +1,18 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class SensorSourceBase(ABC):
     """
     Abstract base class for all sensor sources;
     atm a thin wrapper for an iterator.
+
+    Sources replaying or generating data at a fixed rate declare it as
+    `sample_rate` (Hz), so sensors can resample them to their own rate.
     """
+    sample_rate = None
+
     def __iter__(self):
         """
         Implementation for iterator
@@ -22,3 +29,80 @@ class SensorSourceBase(ABC):
         :return: Next value from sensor source
         """
         ...
+
+    def next_batch(self, n):
+        """
+        Return the next n values as a NumPy array.  The default falls back
+        to calling __next__ n times; sources that can produce blocks natively
+        should override this.
+
+        :param n: Number of values to return
+        :return: ndarray of the next n values
+        """
+        return np.array([next(self) for _ in range(n)])
+
+    def next_timed(self):
+        """
+        Return the next value along with its recorded time, for sources
+        replaying timestamped data.  Sources without timestamps don't
+        implement this.
+
+        :return: Tuple of recorded time in seconds and value
+        """
+        raise NotImplementedError(
+            f'{type(self).__name__} has no recorded timestamps'
+        )
+
+    def activate(self):
+        """
+        Prepare to be read in the current process; network loops call this
+        in the process a source runs in, before its first read, e.g. so
+        readers shared by many sources only read what runs there.  The
+        default does nothing.
+
+        :return: None
+        """
+        pass
+
+    def rewind(self):
+        """
+        Go back to the start, closing any open files, so a source read
+        ahead in a network's parent process starts afresh, with files of its
+        own, in the worker process it runs in.  The default can't rewind.
+
+        :return: True if the source was rewound
+        """
+        return False
+
+    def period(self):
+        """
+        Return one full period of the values produced by a source that
+        repeats them forever, e.g. for sensors to format each value once.
+        Non-periodic sources, the default, return None.
+
+        :return: Tuple of the period's values, the index in them of the \
+        next value and a hashable key identifying the values (None if they \
+        can't be shared), or None
+        """
+        return None
+
+    def warm_up(self):
+        """
+        Do any expensive one-off preparation, such as generating a sample
+        table, ahead of the first read.  Networks call this when starting so
+        the first tick isn't delayed; the default does nothing.
+
+        :return: None
+        """
+        pass
+
+    def reseed(self, rng):
+        """
+        Replace the source's random number generator, e.g. with a stream
+        derived from a network seed.  The default does nothing, for
+        deterministic sources.
+
+        :param rng: NumPy random number generator to use
+        :return: None
+        """
+        pass
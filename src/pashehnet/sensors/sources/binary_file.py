@@ -0,0 +1,37 @@
+import numpy as np
+
+from .cyclic import CyclicSourceBase
+
+
+class BinaryFileSource(CyclicSourceBase):
+    """
+    Provides a source replaying a local binary file through a read-only
+    memory map, so there is no parsing and pages are only read in as the
+    cursor reaches them.  `.npy` files are opened with numpy.load; anything
+    else is treated as a raw array of `dtype` values.  Every process replaying
+    the same file shares the OS page cache rather than holding its own copy.
+    """
+    def __init__(self, path, dtype='<f8', offset=0, sample_rate=None):
+        """
+        Construct new object
+
+        :param path: Local filesystem path of the file
+        :param dtype: Data type of the values in a raw file; defaults to \
+        little-endian float64.  Ignored for `.npy` files.
+        :param offset: Byte offset of the first value in a raw file, e.g. to \
+        skip a header
+        :param sample_rate: Optional rate the file was recorded at, in Hz
+        """
+        self.path = path
+        self.dtype = dtype
+        self.offset = offset
+        self.sample_rate = sample_rate
+        self.sample = None
+
+    def _generate(self):
+        if str(self.path).endswith('.npy'):
+            sample = np.load(self.path, mmap_mode='r')
+        else:
+            sample = np.memmap(self.path, dtype=self.dtype, mode='r',
+                               offset=self.offset)
+        return sample.reshape(-1)
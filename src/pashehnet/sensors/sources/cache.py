@@ -0,0 +1,94 @@
+from collections import OrderedDict
+
+# Default byte budget for the process-wide sample cache
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+
+class SampleCache(object):
+    """
+    Process-wide LRU cache of generated samples, keyed on a source's
+    sample_key() (source class plus normalized constructor parameters), so
+    identically configured sources compute their table once.  Cached arrays
+    are read-only and handed out as-is.  The least recently used entries are
+    evicted once the total size exceeds the byte budget; samples larger than
+    the whole budget are never cached.
+    """
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        """
+        CTOR
+
+        :param max_bytes: Byte budget for all cached samples; 0 disables \
+        caching
+        """
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key, generate):
+        """
+        Return the cached sample for key, calling generate() to produce and
+        cache it on a miss
+
+        :param key: Hashable sample key
+        :param generate: Callable returning the read-only sample array
+        :return: Sample array
+        """
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+        self.misses += 1
+        sample = generate()
+        if sample.nbytes <= self.max_bytes:
+            self.entries[key] = sample
+            self.nbytes += sample.nbytes
+            self._evict()
+        return sample
+
+    def resize(self, max_bytes):
+        """
+        Change the byte budget, evicting entries as needed
+
+        :param max_bytes: New byte budget
+        :return: None
+        """
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def clear(self):
+        """
+        Drop all entries and reset the counters
+
+        :return: None
+        """
+        self.entries.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _evict(self):
+        """
+        Internal method dropping least recently used entries until the cache
+        fits its budget
+
+        :return: None
+        """
+        while self.entries and self.nbytes > self.max_bytes:
+            _, sample = self.entries.popitem(last=False)
+            self.nbytes -= sample.nbytes
+            self.evictions += 1
+
+
+# Shared by every source in the process
+sample_cache = SampleCache()
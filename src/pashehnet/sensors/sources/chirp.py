@@ -1,16 +1,16 @@
-from queue import SimpleQueue
-
 from scipy.signal import chirp
 
-from .base import SensorSourceBase
+from .cyclic import CyclicSourceBase
 
 
-class ChirpSource(SensorSourceBase):
+class ChirpSource(CyclicSourceBase):
     """
     Frequency-swept cosine generator.
     See:
     https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.chirp.html
     """
+    shareable = True
+
     def __init__(self, t, f0, t1, f1, method='linear', phi=0,
                  vertex_zero=True):
         """
@@ -37,28 +37,13 @@ class ChirpSource(SensorSourceBase):
         self.vertex_zero = vertex_zero
         self.sample = None
 
-    def __next__(self):
-        """
-        Implementation for iterator
-
-        :return: Next value from source
-        """
-        if not self.sample:
-            self._init_sample()
-        val = self.sample.get()
-        self.sample.put(val)
-        return val
-
-    def _init_sample(self):
-        # Leverage Python core FIFO queue for infinite cycle sample
-        self.sample = SimpleQueue()
-        for x in chirp(
-                self.t,
-                self.f0,
-                self.t1,
-                self.f1,
-                self.method,
-                self.phi,
-                self.vertex_zero
-        ):
-            self.sample.put(x)
+    def _generate(self):
+        return chirp(
+            self.t,
+            self.f0,
+            self.t1,
+            self.f1,
+            self.method,
+            self.phi,
+            self.vertex_zero
+        )
@@ -0,0 +1,380 @@
+import logging
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from .base import SensorSourceBase
+from .timeline import Timeline
+
+
+class ColumnarReaderBase(ABC):
+    """
+    Abstract base class for readers replaying a multi-column file through
+    many sources, one per column.  The file is read in chunks holding only
+    the columns in use, and every column source walks the same chunks through
+    its own cursor, handed out as zero-copy, read-only views.  A chunk is
+    dropped once every column source reading it has moved on (plus one chunk
+    of slack); a column that only starts reading after others have moved on
+    joins them at the oldest chunk still held.  Replay loops back to the
+    start of the file at its end; a file that fits in a single chunk is only
+    read once.
+
+    Memory is bounded by the chunk size rather than the file size as long as
+    the sensors run at similar rates.  Otherwise the slowest column holds
+    every chunk the fastest has read since, and chunks pile up without limit
+    unless `max_chunks` is set: beyond it the oldest chunks are dropped and
+    columns still reading them skip ahead, with a warning.
+
+    Readers are per-process: each worker process reads its own copy of the
+    file.  Network loops activate() the sources running in their process
+    before reading, and only those columns are read; without activation,
+    e.g. outside a network, every column created is read.
+    """
+    def __init__(self, max_chunks=None):
+        """
+        CTOR
+
+        :param max_chunks: Optional limit on the number of chunks held; \
+        by default chunks are held until every active column has moved on
+        """
+        if max_chunks is not None and max_chunks < 2:
+            raise ValueError('max_chunks must be at least 2')
+        self.max_chunks = max_chunks
+        self.columns = []
+        self.in_use = []
+        self.reading = None
+        self.active = []
+        self.chunks = {}
+        self.first = 0
+        self.loaded = 0
+        self.reader = None
+        self.pass_chunks = 0
+        self.last = None
+        self.single = None
+
+    def column(self, name, time_column=None, sample_rate=None):
+        """
+        Create a source replaying one column; the column is read from then on
+
+        :param name: Column name
+        :param time_column: Optional name of a column holding the recorded \
+        time of each row, for replaying at the recorded times
+        :param sample_rate: Optional rate the rows were recorded at, in Hz
+        :return: ColumnSource object
+        """
+        for col in [name, time_column]:
+            if col is not None and col not in self.columns:
+                if self.loaded:
+                    raise ValueError(
+                        f'Column {col} added after reading started'
+                    )
+                self.columns.append(col)
+        return ColumnSource(self, name, time_column, sample_rate)
+
+    @abstractmethod
+    def names(self):
+        """
+        Pure abstract method listing the columns available in the file
+
+        :return: List of column names
+        """
+        ...
+
+    @abstractmethod
+    def _read_chunks(self, columns):
+        """
+        Pure abstract method reading the file in chunks from the start
+
+        :param columns: Names of the columns to read
+        :return: Iterator of dicts mapping column names to equal-length \
+        ndarrays
+        """
+        ...
+
+    def reseed(self, rng):
+        """
+        Replace the reader's random number generator; the default does
+        nothing, for readers of files
+
+        :param rng: NumPy random number generator to use
+        :return: None
+        """
+        pass
+
+    def activate(self, source):
+        """
+        Register a source that will be read in this process, before reading
+        starts, so its columns are read
+
+        :param source: ColumnSource object
+        :return: None
+        """
+        for col in [source.name, source.time_column]:
+            if col is not None and col not in self.in_use:
+                if self.loaded:
+                    raise ValueError(
+                        f'Column {col} activated after reading started'
+                    )
+                self.in_use.append(col)
+
+    def attach(self, source):
+        """
+        Register a source that has started reading; it starts on the oldest
+        chunk still held
+
+        :param source: ColumnSource object
+        :return: None
+        """
+        if self.reading is not None:
+            for col in [source.name, source.time_column]:
+                if col is not None and col not in self.reading:
+                    raise ValueError(
+                        f'Column {col} is not read in this process; '
+                        f'activate its source before reading starts'
+                    )
+        source.chunk_no = self.first
+        source.pos = 0
+        self.active.append(source)
+
+    def rewind(self):
+        """
+        Close the file and drop every chunk, detaching all sources, so
+        reading starts again from the beginning with a fresh file
+
+        :return: None
+        """
+        if self.reader is not None and hasattr(self.reader, 'close'):
+            self.reader.close()
+        for source in self.active:
+            source.chunk_no = None
+            source.pos = 0
+        self.active = []
+        self.reading = None
+        self.chunks = {}
+        self.first = 0
+        self.loaded = 0
+        self.reader = None
+        self.pass_chunks = 0
+        self.last = None
+        self.single = None
+
+    def chunk(self, no):
+        """
+        Return a chunk by sequence number, reading ahead as needed
+
+        :param no: Chunk sequence number
+        :return: Dict mapping column names to read-only ndarrays
+        """
+        while no >= self.loaded:
+            self._load_next()
+        return self.chunks[no]
+
+    def release(self):
+        """
+        Drop chunks every active source has moved past, keeping one more so
+        sources that start reading within a chunk of the others still start
+        at the beginning
+
+        :return: None
+        """
+        oldest = min(s.chunk_no for s in self.active) - 1
+        for no in range(self.first, oldest):
+            self.chunks.pop(no, None)
+        self.first = max(self.first, oldest)
+
+    def _load_next(self):
+        """
+        Internal method reading the next non-empty chunk, restarting from the
+        beginning of the file at its end
+
+        :return: None
+        """
+        if self.single is not None:
+            self.chunks[self.loaded] = self.single
+            self.loaded += 1
+            self._trim()
+            return
+
+        if self.reading is None:
+            # Activated columns, in the order created, or else all of them
+            self.reading = [
+                col for col in self.columns
+                if col in self.in_use or not self.in_use
+            ]
+        while True:
+            if self.reader is None:
+                self.reader = iter(self._read_chunks(list(self.reading)))
+                self.pass_chunks = 0
+            chunk = next(self.reader, None)
+            if chunk is None:
+                if self.pass_chunks == 0:
+                    raise ValueError('No rows to replay')
+                if self.pass_chunks == 1:
+                    self.reader = None
+                    self.single = self.last
+                    self.chunks[self.loaded] = self.single
+                    self.loaded += 1
+                    self._trim()
+                    return
+                self.reader = None
+                continue
+            if len(chunk[self.reading[0]]):
+                break
+
+        for values in chunk.values():
+            values.flags.writeable = False
+        self.pass_chunks += 1
+        self.last = chunk
+        self.chunks[self.loaded] = chunk
+        self.loaded += 1
+        self._trim()
+
+    def _trim(self):
+        """
+        Internal method dropping the oldest chunks beyond max_chunks; columns
+        still reading them skip ahead to the oldest chunk left
+
+        :return: None
+        """
+        if not self.max_chunks or len(self.chunks) <= self.max_chunks:
+            return
+        while len(self.chunks) > self.max_chunks:
+            self.chunks.pop(self.first, None)
+            self.first += 1
+        for source in self.active:
+            if source.chunk_no < self.first:
+                logging.warning(
+                    f'Column {source.name} fell {self.first - source.chunk_no}'
+                    f' chunks behind the others, skipping ahead'
+                )
+                source.chunk_no = self.first
+                source.pos = 0
+
+
+class ColumnSource(SensorSourceBase):
+    """
+    Provides a source replaying one column of a ColumnarReaderBase; create
+    these through the reader's column() method
+    """
+    def __init__(self, reader, name, time_column=None, sample_rate=None):
+        """
+        Construct new object
+
+        :param reader: Reader the column belongs to
+        :param name: Column name
+        :param time_column: Optional name of the column holding each row's \
+        recorded time
+        :param sample_rate: Optional rate the rows were recorded at, in Hz
+        """
+        self.reader = reader
+        self.name = name
+        self.time_column = time_column
+        self.sample_rate = sample_rate
+        self.timeline = Timeline()
+        self.chunk_no = None
+        self.pos = 0
+
+    def __next__(self):
+        """
+        Implementation for iterator
+
+        :return: Next value from source
+        """
+        values = self._values()
+        val = values[self.pos]
+        self._advance(1, len(values))
+        return val
+
+    def next_timed(self):
+        """
+        Return the next value along with its recorded time
+
+        :return: Tuple of recorded time in seconds and value
+        """
+        if self.time_column is None:
+            return super(ColumnSource, self).next_timed()
+        chunk = self._chunk()
+        values = chunk[self.name]
+        t, val = chunk[self.time_column][self.pos], values[self.pos]
+        self._advance(1, len(values))
+        return self.timeline.offset(t), val
+
+    def next_batch(self, n):
+        """
+        Return the next n values; a read-only view into the current chunk
+        when the block doesn't cross into the next one, otherwise a copy
+
+        :param n: Number of values to return
+        :return: ndarray of the next n values
+        """
+        blocks = []
+        while n > 0:
+            values = self._values()
+            block = values[self.pos:self.pos + n]
+            self._advance(len(block), len(values))
+            n -= len(block)
+            blocks.append(block)
+        if len(blocks) == 1:
+            return blocks[0]
+        return np.concatenate(blocks) if blocks else np.array([])
+
+    def activate(self):
+        """
+        Register the column to be read in this process
+
+        :return: None
+        """
+        self.reader.activate(self)
+
+    def reseed(self, rng):
+        """
+        Reseed the reader the column belongs to
+
+        :param rng: NumPy random number generator to use
+        :return: None
+        """
+        self.reader.reseed(rng)
+
+    def rewind(self):
+        """
+        Rewind the whole reader the column belongs to, closing its file;
+        every column of the reader starts again from the first row
+
+        :return: True
+        """
+        self.timeline = Timeline()
+        self.reader.rewind()
+        return True
+
+    def _chunk(self):
+        """
+        Internal method returning the current chunk
+
+        :return: Dict mapping column names to read-only ndarrays
+        """
+        if self.chunk_no is None:
+            self.reader.attach(self)
+        return self.reader.chunk(self.chunk_no)
+
+    def _values(self):
+        """
+        Internal method returning this column of the current chunk
+
+        :return: Read-only ndarray
+        """
+        return self._chunk()[self.name]
+
+    def _advance(self, n, length):
+        """
+        Internal method to move the cursor, stepping onto the next chunk at
+        the end of the current one
+
+        :param n: Number of values consumed
+        :param length: Length of the current chunk
+        :return: None
+        """
+        self.pos += n
+        if self.pos == length:
+            self.chunk_no += 1
+            self.pos = 0
+            self.reader.release()
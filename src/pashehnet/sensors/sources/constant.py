@@ -1,3 +1,5 @@
+import numpy as np
+
 from .base import SensorSourceBase
 
 
@@ -20,3 +22,24 @@ class ConstantValueSource(SensorSourceBase):
         :return: Next value from source
         """
         return self.value
+
+    def period(self):
+        """
+        Return the constant value as a period of one
+
+        :return: Tuple of the value in a list, 0 and a key for plain values
+        """
+        key = None
+        # Typed, since e.g. 1 and 1.0 are equal but format differently
+        if isinstance(self.value, (str, bytes, int, float)):
+            key = type(self).__qualname__, type(self.value), self.value
+        return [self.value], 0, key
+
+    def next_batch(self, n):
+        """
+        Return the next n values as a NumPy array
+
+        :param n: Number of values to return
+        :return: ndarray filled with the constant value
+        """
+        return np.full(n, self.value)
@@ -0,0 +1,34 @@
+import pandas as pd
+
+from .columnar import ColumnarReaderBase
+
+
+class CSVColumnReader(ColumnarReaderBase):
+    """
+    Columnar reader for CSV files via Pandas, reading only the columns in use
+    `chunksize` rows at a time
+    """
+    def __init__(self, uri, chunksize=65536, max_chunks=None, **kwargs):
+        """
+        Construct new object
+
+        :param uri: Location to load CSV from
+        :param chunksize: Number of rows to read at a time
+        :param max_chunks: Optional limit on the number of chunks held (see \
+        ColumnarReaderBase)
+        :param kwargs: Passthrough args to pandas.read_csv; `usecols` is \
+        managed by the reader
+        """
+        super(CSVColumnReader, self).__init__(max_chunks)
+        self.uri = uri
+        self.chunksize = chunksize
+        self.kwargs = {k: v for k, v in kwargs.items() if k != 'usecols'}
+
+    def names(self):
+        return list(pd.read_csv(self.uri, nrows=0, **self.kwargs).columns)
+
+    def _read_chunks(self, columns):
+        with pd.read_csv(self.uri, usecols=columns, chunksize=self.chunksize,
+                         **self.kwargs) as chunks:
+            for df in chunks:
+                yield {col: df[col].to_numpy() for col in columns}
@@ -0,0 +1,161 @@
+import hashlib
+from abc import abstractmethod
+
+import numpy as np
+
+from .base import SensorSourceBase
+from .cache import sample_cache
+from .shared import attach_sample
+
+
+def freeze(value):
+    """
+    Util method to turn constructor parameters into a hashable, comparable
+    form so identical configurations produce identical keys; arrays are
+    reduced to a content digest
+
+    :param value: Value to freeze
+    :return: Hashable equivalent of value
+    """
+    if isinstance(value, np.poly1d):
+        return 'poly1d', freeze(value.coeffs)
+    if isinstance(value, np.ndarray):
+        data = np.ascontiguousarray(value)
+        digest = hashlib.sha1(data.view(np.uint8)).hexdigest() \
+            if not data.dtype.hasobject else freeze(data.tolist())
+        return 'ndarray', data.dtype.str, data.shape, digest
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, type):
+        return f'{value.__module__}.{value.__qualname__}'
+    if isinstance(value, np.dtype):
+        return value.str
+    return value
+
+
+class CyclicSourceBase(SensorSourceBase):
+    """
+    Base class for sources that loop forever over a precomputed sample.  The
+    sample is held in one contiguous, read-only NumPy array and an integer
+    cursor walks it, so batches that don't wrap are zero-copy slices.
+
+    Subclasses whose sample is fully determined by their constructor
+    parameters set `shareable` so identical sources can share one copy of
+    the sample, within a process through `sample_cache` and across processes
+    through `SharedSamples`.
+    """
+    shareable = False
+    sample = None
+    pos = 0
+    shared = None
+
+    # Instance attributes that are runtime state, not configuration
+    RUNTIME_ATTRS = ('sample', 'pos', 'shared')
+
+    def __next__(self):
+        """
+        Implementation for iterator
+
+        :return: Next value from source
+        """
+        if self.sample is None:
+            self._init_sample()
+        val = self.sample[self.pos]
+        self.pos += 1
+        if self.pos == len(self.sample):
+            self.pos = 0
+        return val
+
+    def next_batch(self, n):
+        """
+        Return the next n values; a read-only view into the sample when the
+        block doesn't wrap around, otherwise a copy
+
+        :param n: Number of values to return
+        :return: ndarray of the next n values
+        """
+        if self.sample is None:
+            self._init_sample()
+        start, end = self.pos, self.pos + n
+        self.pos = end % len(self.sample)
+        if end <= len(self.sample):
+            return self.sample[start:end]
+        return self.sample.take(np.arange(start, end), mode='wrap')
+
+    def rewind(self):
+        """
+        Go back to the start of the sample
+
+        :return: True
+        """
+        self.pos = 0
+        return True
+
+    def period(self):
+        """
+        Return the sample, which repeats forever from the cursor on
+
+        :return: Tuple of the sample, the cursor and the sample_key()
+        """
+        if self.sample is None:
+            self._init_sample()
+        return self.sample, self.pos, self.sample_key()
+
+    def sample_key(self):
+        """
+        Key identifying this source's sample; sources with equal keys
+        generate identical samples
+
+        :return: Hashable key, or None if the sample can't be shared
+        """
+        if not self.shareable:
+            return None
+        params = {
+            k: v for k, v in vars(self).items()
+            if k not in self.RUNTIME_ATTRS
+        }
+        return type(self).__module__, type(self).__qualname__, freeze(params)
+
+    @abstractmethod
+    def _generate(self):
+        """
+        Pure abstract method producing one full cycle of the sample
+
+        :return: array_like of sample values
+        """
+        ...
+
+    def warm_up(self):
+        # Shared samples are attached in the process the source runs in
+        if self.sample is None and self.shared is None:
+            self._init_sample()
+
+    def cached_sample(self):
+        """
+        Return this source's read-only sample, going through the process-wide
+        sample cache when the sample can be keyed
+
+        :return: Read-only ndarray
+        """
+        key = self.sample_key()
+        if key is None:
+            return self._readonly_sample()
+        return sample_cache.get(key, self._readonly_sample)
+
+    def _readonly_sample(self):
+        # Flag a view read-only so batches handed out can't corrupt the
+        # sample, without touching any array the caller passed in
+        sample = np.asarray(self._generate()).view()
+        sample.flags.writeable = False
+        return sample
+
+    def _init_sample(self):
+        if self.shared is not None:
+            self.sample = attach_sample(self.shared)
+        else:
+            self.sample = self.cached_sample()
+        self.pos = 0
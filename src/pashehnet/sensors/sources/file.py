@@ -1,38 +1,29 @@
-from queue import SimpleQueue
-
-from .base import SensorSourceBase
+import numpy as np
 from smart_open import open
 
+from .cyclic import CyclicSourceBase
+
 
-class FileSource(SensorSourceBase):
+class FileSource(CyclicSourceBase):
     """
     Provides a file-based source, one value per line, from a local file or URI
     """
-    def __init__(self, uri, dtype=float):
+    shareable = True
+
+    def __init__(self, uri, dtype=float, sample_rate=None):
         """
         Constructor for file source that can read file contents,
         one reading per line.
 
         :param uri: Local filesystem or URI to open file from
         :param dtype: Data type to cast read values from
+        :param sample_rate: Optional rate the file was recorded at, in Hz
         """
         self.uri = uri
         self.dtype = dtype
+        self.sample_rate = sample_rate
         self.sample = None
 
-    def __next__(self):
-        """
-        Implementation for iterator
-
-        :return: Next value from source
-        """
-        if not self.sample:
-            self._init_sample()
-        val = self.sample.get()
-        self.sample.put(val)
-        return val
-
-    def _init_sample(self):
-        self.sample = SimpleQueue()
-        for line in open(self.uri):
-            self.sample.put(self.dtype(line.strip()))
+    def _generate(self):
+        with open(self.uri) as f:
+            return np.array([self.dtype(line.strip()) for line in f])
@@ -0,0 +1,101 @@
+from abc import abstractmethod
+
+import numpy as np
+
+from .columnar import ColumnarReaderBase
+
+
+class FleetSourceBase(ColumnarReaderBase):
+    """
+    Abstract base class for models advancing the state of many correlated
+    channels at once.  Each step computes a block of values for every
+    channel in a handful of array operations; sensors read their own channel
+    through channel(), which walks the shared blocks like a column of a
+    file.  Only the channels in use are handed out, but every channel is
+    simulated so correlations are unaffected.
+    """
+    def __init__(self, n, block_size=256, seed=None, max_chunks=None):
+        """
+        CTOR
+
+        :param n: Number of channels
+        :param block_size: Number of time steps computed at a time
+        :param seed: Seed for the random number generator
+        :param max_chunks: Optional limit on the number of blocks held (see \
+        ColumnarReaderBase)
+        """
+        super(FleetSourceBase, self).__init__(max_chunks)
+        self.n = n
+        self.block_size = block_size
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+
+    def channel(self, i):
+        """
+        Create a source for one channel
+
+        :param i: Channel index
+        :return: ColumnSource object
+        """
+        if not 0 <= i < self.n:
+            raise IndexError(f'Channel {i} out of range')
+        return self.column(i)
+
+    def channels(self):
+        """
+        Create a source for every channel
+
+        :return: List of ColumnSource objects
+        """
+        return [self.channel(i) for i in range(self.n)]
+
+    def reseed(self, rng):
+        """
+        Replace the random number generator.  Each sensor reading a channel
+        reseeds the fleet in turn, so it ends up on the stream of the last
+        one, the same in every process.
+
+        :param rng: NumPy random number generator to use
+        :return: None
+        """
+        self.rng = rng
+
+    def names(self):
+        return list(range(self.n))
+
+    @abstractmethod
+    def _step(self, steps):
+        """
+        Pure abstract method advancing the model
+
+        :param steps: Number of time steps to advance
+        :return: ndarray of shape (steps, n)
+        """
+        ...
+
+    def _read_chunks(self, columns):
+        while True:
+            # Channel-major copy, so each channel's values are contiguous
+            block = np.ascontiguousarray(self._step(self.block_size).T)
+            yield {i: block[i] for i in columns}
+
+    def _innovations(self, steps, scale=1.0, correlation=0.0, chol=None):
+        """
+        Internal method drawing correlated normal noise for every channel
+
+        :param steps: Number of time steps
+        :param scale: Standard deviation, scalar or one per channel
+        :param correlation: Correlation shared by every pair of channels, \
+        cheap at any fleet size
+        :param chol: Cholesky factor of a full covariance matrix, used \
+        instead of scale and correlation when given
+        :return: ndarray of shape (steps, n)
+        """
+        noise = self.rng.standard_normal((steps, self.n))
+        if chol is not None:
+            return noise @ chol.T
+        if correlation:
+            common = self.rng.standard_normal((steps, 1))
+            noise = np.sqrt(correlation) * common + \
+                np.sqrt(1.0 - correlation) * noise
+        return noise * scale
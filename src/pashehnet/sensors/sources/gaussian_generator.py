@@ -0,0 +1,41 @@
+from scipy import signal
+from .generator import GeneratorSourceBase
+
+
+class GaussianPulseGenerator(GeneratorSourceBase):
+    """
+    Provides a Gaussian pulse wave source using scipy.signal.gausspulse,
+    computed on the fly; a constant-memory alternative to
+    GaussianPulseSource.  The pulse repeats every `period` seconds.
+    """
+    def __init__(self, center_frequency=1000, fractional_bandwidth=0.5,
+                 reference_level=-6, cutoff_time=-60, sample_rate=1000,
+                 period=1.0):
+        """
+        Construct a new GaussianPulseGenerator object
+
+        :param center_frequency: Center frequency of the Gaussian pulse in Hz \
+        (default is 1000)
+        :param fractional_bandwidth: Fractional bandwidth in frequency domain \
+        of pulse (default is 0.5)
+        :param reference_level: Reference level at which fractional bandwidth \
+        is calculated (dB) (default is -6)
+        :param cutoff_time: Cutoff time for when the pulse amplitude falls \
+        below the specified level (in dB) (default is -60)
+        :param sample_rate: Sampling rate in Hz (default is 1000)
+        :param period: Seconds between pulses (default is 1)
+        """
+        super(GaussianPulseGenerator, self).__init__(
+            1.0 / period, sample_rate
+        )
+        self.center_frequency = center_frequency
+        self.fractional_bandwidth = fractional_bandwidth
+        self.reference_level = reference_level
+        self.cutoff_time = cutoff_time
+        self.period = period
+
+    def _evaluate(self, phase):
+        return signal.gausspulse(
+            phase * self.period, fc=self.center_frequency,
+            bw=self.fractional_bandwidth, bwr=self.reference_level,
+            tpr=self.cutoff_time, retenv=False, retquad=False)
@@ -1,14 +1,14 @@
-from queue import SimpleQueue
-
 import numpy as np
 from scipy import signal
-from .base import SensorSourceBase
+from .cyclic import CyclicSourceBase
 
 
-class GaussianPulseSource(SensorSourceBase):
+class GaussianPulseSource(CyclicSourceBase):
     """
     Provides a Gaussian pulse wave source using scipy.signal.gausspulse
     """
+    shareable = True
+
     def __init__(self, center_frequency=1000, fractional_bandwidth=0.5,
                  reference_level=-6, cutoff_time=-60, sample_rate=1000):
         """
@@ -31,24 +31,9 @@ class GaussianPulseSource(SensorSourceBase):
         self.sample_rate = sample_rate
         self.sample = None
 
-    def __next__(self):
-        """
-        Implementation for iterator
-
-        :return: Next value from the Gaussian pulse source
-        """
-        if not self.sample:
-            self._init_sample()
-        val = self.sample.get()
-        self.sample.put(val)
-        return val
-
-    def _init_sample(self):
-        # Leverage Python core FIFO queue for infinite cycle sample
-        self.sample = SimpleQueue()
+    def _generate(self):
         t = np.linspace(0, 1, self.sample_rate, endpoint=False)
-        for x in signal.gausspulse(
-                t, fc=self.center_frequency, bw=self.fractional_bandwidth,
-                bwr=self.reference_level, tpr=self.cutoff_time,
-                retenv=False, retquad=False):
-            self.sample.put(x)
+        return signal.gausspulse(
+            t, fc=self.center_frequency, bw=self.fractional_bandwidth,
+            bwr=self.reference_level, tpr=self.cutoff_time,
+            retenv=False, retquad=False)
@@ -0,0 +1,87 @@
+from abc import abstractmethod
+
+import numpy as np
+
+from .base import SensorSourceBase
+
+
+class GeneratorSourceBase(SensorSourceBase):
+    """
+    Base class for periodic sources computed on the fly from a phase
+    accumulator rather than looped over a precomputed table.  Memory is
+    constant whatever the sample rate, and since the phase is carried from
+    one block to the next the waveform stays continuous for any frequency,
+    however long it runs.  Values are computed in small vectorized blocks.
+    """
+    def __init__(self, frequency, sample_rate, phase=0.0, block_size=1024):
+        """
+        CTOR
+
+        :param frequency: Frequency of the waveform in Hz
+        :param sample_rate: Sampling rate in Hz
+        :param phase: Starting phase in cycles, [0, 1)
+        :param block_size: Number of values computed at a time when iterating
+        """
+        self.frequency = frequency
+        self.sample_rate = sample_rate
+        self.phase = phase % 1.0
+        self.block_size = block_size
+        self.block = None
+        self.pos = 0
+
+    @property
+    def step(self):
+        """
+        :return: Phase advance per sample, in cycles
+        """
+        return self.frequency / self.sample_rate
+
+    def __next__(self):
+        """
+        Implementation for iterator
+
+        :return: Next value from source
+        """
+        if self.block is None or self.pos == len(self.block):
+            self.block = self._compute(self.block_size)
+            self.pos = 0
+        val = self.block[self.pos]
+        self.pos += 1
+        return val
+
+    def next_batch(self, n):
+        """
+        Return the next n values, continuing from any values already
+        computed for iteration
+
+        :param n: Number of values to return
+        :return: ndarray of the next n values
+        """
+        if self.block is None or self.pos == len(self.block):
+            return self._compute(n)
+        head = self.block[self.pos:self.pos + n]
+        self.pos += len(head)
+        if len(head) == n:
+            return head
+        return np.concatenate([head, self._compute(n - len(head))])
+
+    @abstractmethod
+    def _evaluate(self, phase):
+        """
+        Pure abstract method computing the waveform at the given phases
+
+        :param phase: ndarray of phases in cycles, [0, 1)
+        :return: ndarray of values
+        """
+        ...
+
+    def _compute(self, n):
+        """
+        Internal method computing the next n values and advancing the phase
+
+        :param n: Number of values to compute
+        :return: ndarray of values
+        """
+        phase = (self.phase + self.step * np.arange(n)) % 1.0
+        self.phase = (self.phase + self.step * n) % 1.0
+        return self._evaluate(phase)
@@ -0,0 +1,48 @@
+from .columnar import ColumnarReaderBase
+
+
+def _parquet():
+    """
+    Util method importing pyarrow.parquet, which is an optional dependency
+
+    :return: pyarrow.parquet module
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            'Parquet replay requires pyarrow; '
+            'install with `pip install pashehnet[parquet]`'
+        ) from e
+    return pq
+
+
+class ParquetColumnReader(ColumnarReaderBase):
+    """
+    Columnar reader for Parquet files via pyarrow, reading only the columns
+    in use `batch_size` rows at a time
+    """
+    def __init__(self, uri, batch_size=65536, max_chunks=None):
+        """
+        Construct new object
+
+        :param uri: Location to load the Parquet file from
+        :param batch_size: Number of rows to read at a time
+        :param max_chunks: Optional limit on the number of chunks held (see \
+        ColumnarReaderBase)
+        """
+        super(ParquetColumnReader, self).__init__(max_chunks)
+        self.uri = uri
+        self.batch_size = batch_size
+
+    def names(self):
+        return list(_parquet().read_schema(self.uri).names)
+
+    def _read_chunks(self, columns):
+        with _parquet().ParquetFile(self.uri) as f:
+            for batch in f.iter_batches(batch_size=self.batch_size,
+                                        columns=columns):
+                yield {
+                    col: batch.column(col).to_numpy(zero_copy_only=False)
+                    for col in columns
+                }
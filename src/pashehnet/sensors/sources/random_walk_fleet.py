@@ -0,0 +1,46 @@
+import numpy as np
+
+from .fleet import FleetSourceBase
+
+
+class RandomWalkFleet(FleetSourceBase):
+    """
+    Fleet of channels each following a Gaussian random walk, with steps
+    correlated across channels either through a single shared correlation or
+    a full covariance matrix
+    """
+    def __init__(self, n, start=0.0, scale=1.0, correlation=0.0, cov=None,
+                 block_size=256, seed=None, max_chunks=None):
+        """
+        Construct new object
+
+        :param n: Number of channels
+        :param start: Starting value, scalar or one per channel
+        :param scale: Standard deviation of each step, scalar or one per \
+        channel
+        :param correlation: Correlation between the steps of every pair of \
+        channels, [0, 1]
+        :param cov: Covariance matrix (n x n) of the steps, used instead of \
+        scale and correlation; costs O(n^2) per step
+        :param block_size: Number of time steps computed at a time
+        :param seed: Seed for the random number generator
+        :param max_chunks: Optional limit on the number of blocks held (see \
+        ColumnarReaderBase)
+        """
+        super(RandomWalkFleet, self).__init__(n, block_size, seed,
+                                              max_chunks)
+        self.scale = scale
+        self.correlation = correlation
+        self.chol = np.linalg.cholesky(cov) if cov is not None else None
+        self.state = np.broadcast_to(
+            np.asarray(start, dtype=float), (n,)
+        ).copy()
+
+    def _step(self, steps):
+        walk = self.state + np.cumsum(
+            self._innovations(steps, self.scale, self.correlation,
+                              self.chol),
+            axis=0
+        )
+        self.state = walk[-1]
+        return walk
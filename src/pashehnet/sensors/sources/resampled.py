@@ -0,0 +1,247 @@
+import numpy as np
+
+from .base import SensorSourceBase
+from .cache import sample_cache
+from .cyclic import CyclicSourceBase
+from .series import SeriesSource
+
+
+class ResampledSource(SensorSourceBase):
+    """
+    Wraps a source with a native sample rate to produce values at a different
+    rate, e.g. to play a 1kHz recording through a 1Hz sensor in real time.
+    Resampling runs vectorized over blocks of output values; iterating then
+    just steps through the current block.  When the wrapped source is a
+    cyclic table whose cycle maps onto a whole number of output values, the
+    whole resampled cycle is computed once, kept in the sample cache, and
+    looped over instead.
+
+    Methods:
+      'hold': sample-and-hold, the latest native value at each output time
+      'linear': linear interpolation between neighbouring native values
+      'decimate': mean of the native values in each output period, for
+      downsampling without the aliasing of simply dropping values
+    """
+    METHOD_HOLD = 'hold'
+    METHOD_LINEAR = 'linear'
+    METHOD_DECIMATE = 'decimate'
+    METHODS = [METHOD_HOLD, METHOD_LINEAR, METHOD_DECIMATE]
+
+    def __init__(self, source, rate, method=METHOD_LINEAR, block_size=256):
+        """
+        Construct new object
+
+        :param source: Source to resample; must declare its sample_rate
+        :param rate: Output rate in Hz
+        :param method: One of 'hold', 'linear' or 'decimate'
+        :param block_size: Number of output values computed at a time when \
+        iterating
+        """
+        if method not in self.METHODS:
+            raise ValueError(f'Unknown resampling method: {method}')
+        if not source.sample_rate:
+            raise ValueError(
+                f'{type(source).__name__} declares no sample_rate'
+            )
+        if not rate or rate <= 0:
+            raise ValueError('Resampling needs a positive output rate')
+        if method == self.METHOD_DECIMATE and rate > source.sample_rate:
+            raise ValueError('Decimation can only lower the sample rate')
+        self.source = source
+        self.sample_rate = rate
+        self.method = method
+        self.block_size = block_size
+        self.ratio = source.sample_rate / rate
+        # Native values not yet consumed, and the position of the next
+        # output value among them, in native samples
+        self.native = None
+        self.offset = 0.0
+        self.block = None
+        self.pos = 0
+        self.cycle = None
+
+    def __next__(self):
+        """
+        Implementation for iterator
+
+        :return: Next value from source
+        """
+        if self.cycle is None:
+            self._init_cycle()
+        if self.cycle is not False:
+            val = self.cycle[self.pos]
+            self.pos = (self.pos + 1) % len(self.cycle)
+            return val
+        if self.block is None or self.pos == len(self.block):
+            self.block = self._resample(self.block_size)
+            self.pos = 0
+        val = self.block[self.pos]
+        self.pos += 1
+        return val
+
+    def next_batch(self, n):
+        """
+        Return the next n resampled values, continuing from any values
+        already computed for iteration
+
+        :param n: Number of values to return
+        :return: ndarray of the next n values
+        """
+        if self.cycle is None:
+            self._init_cycle()
+        if self.cycle is not False:
+            start = self.pos
+            self.pos = (start + n) % len(self.cycle)
+            return self.cycle.take(np.arange(start, start + n), mode='wrap')
+        if self.block is None or self.pos == len(self.block):
+            return self._resample(n)
+        head = self.block[self.pos:self.pos + n]
+        self.pos += len(head)
+        if len(head) == n:
+            return head
+        return np.concatenate([head, self._resample(n - len(head))])
+
+    def warm_up(self):
+        """
+        Compute the resampled cycle when the wrapped source qualifies,
+        otherwise warm up the wrapped source
+
+        :return: None
+        """
+        if self.cycle is None:
+            self._init_cycle()
+        if self.cycle is False:
+            self.source.warm_up()
+
+    def sample_key(self):
+        """
+        Key of the wrapped source's sample, which networks share in place of
+        the resampled values
+
+        :return: Hashable key, or None if the sample can't be shared
+        """
+        if not hasattr(self.source, 'sample_key'):
+            return None
+        return self.source.sample_key()
+
+    def activate(self):
+        """
+        Activate the wrapped source
+
+        :return: None
+        """
+        self.source.activate()
+
+    def period(self):
+        """
+        Return the resampled cycle, for cyclic sources resampled into a
+        whole number of values
+
+        :return: Tuple of the resampled cycle, the position in it and its \
+        cache key, or None
+        """
+        if self.cycle is None:
+            self._init_cycle()
+        if self.cycle is False:
+            return None
+        key = self.source.sample_key() + \
+            ('resampled', self.sample_rate, self.method)
+        return self.cycle, self.pos, key
+
+    def reseed(self, rng):
+        """
+        Reseed the wrapped source
+
+        :param rng: NumPy random number generator to use
+        :return: None
+        """
+        self.source.reseed(rng)
+
+    def _init_cycle(self):
+        """
+        Internal method to compute, or fetch from the sample cache, the
+        resampled cycle of a cyclic source; cycle is left False when the
+        source doesn't qualify
+
+        :return: None
+        """
+        self.cycle = False
+        source = self.source
+        if not isinstance(source, CyclicSourceBase) or source.pos != 0:
+            return
+        key = source.sample_key()
+        if key is None:
+            return
+        sample = source.cached_sample()
+        outputs = len(sample) / self.ratio
+        if round(outputs) < 1 or abs(outputs - round(outputs)) > 1e-9:
+            return
+
+        def generate():
+            # Resample a throwaway copy of one cycle, looping over it for
+            # the values interpolation needs past the end
+            native = SeriesSource(sample, sample_rate=source.sample_rate)
+            resampled = ResampledSource(native, self.sample_rate,
+                                        self.method, self.block_size)
+            resampled.cycle = False
+            cycle = resampled.next_batch(round(outputs))
+            cycle.flags.writeable = False
+            return cycle
+
+        self.cycle = sample_cache.get(
+            key + ('resampled', self.sample_rate, self.method), generate
+        )
+        self.pos = 0
+
+    def _resample(self, n):
+        """
+        Internal method computing the next n output values, pulling native
+        values from the wrapped source as needed
+
+        :param n: Number of values to compute
+        :return: ndarray of values
+        """
+        x = self.offset + self.ratio * np.arange(n + 1)
+        idx = np.floor(x).astype(np.int64)
+        # Native values up to the start of the next block are always read,
+        # even when skipped over, so the source stays in step
+        needed = idx[-1]
+        if self.method == self.METHOD_LINEAR:
+            needed = max(needed, idx[-2] + 2)
+        elif self.method == self.METHOD_HOLD:
+            needed = max(needed, idx[-2] + 1)
+        self._fill(needed)
+
+        if self.method == self.METHOD_HOLD:
+            values = self.native[idx[:-1]]
+        elif self.method == self.METHOD_LINEAR:
+            frac = x[:-1] - idx[:-1]
+            lo = self.native[idx[:-1]]
+            hi = self.native[idx[:-1] + 1]
+            values = lo + (hi - lo) * frac
+        else:
+            sums = np.concatenate([[0.0], np.cumsum(self.native[:needed])])
+            values = (sums[idx[1:]] - sums[idx[:-1]]) / np.diff(idx)
+
+        # Drop native values no later output can need
+        drop = idx[-1]
+        self.native = self.native[drop:]
+        self.offset = x[-1] - drop
+        return values
+
+    def _fill(self, needed):
+        """
+        Internal method reading native values until at least `needed` are
+        buffered
+
+        :param needed: Number of native values required
+        :return: None
+        """
+        if self.native is None:
+            # Start from the source's own values to keep their dtype
+            self.native = self.source.next_batch(max(1, needed))
+        elif len(self.native) < needed:
+            self.native = np.concatenate([
+                self.native,
+                self.source.next_batch(needed - len(self.native))
+            ])
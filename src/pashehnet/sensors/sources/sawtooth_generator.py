@@ -0,0 +1,27 @@
+import numpy as np
+from scipy import signal
+from .generator import GeneratorSourceBase
+
+
+class SawtoothWaveGenerator(GeneratorSourceBase):
+    """
+    Provides a sawtooth wave source using scipy.signal.sawtooth, computed on
+    the fly; a constant-memory alternative to SawtoothWaveSource
+    """
+    def __init__(self, frequency, sample_rate, width=1.0, phase=0.0):
+        """
+        Construct a new SawtoothWaveGenerator object
+
+        :param frequency: Frequency of the sawtooth wave in Hz
+        :param sample_rate: Sampling rate in Hz
+        :param width: Width of the rising ramp as a proportion of the cycle \
+        (default is 1.0)
+        :param phase: Starting phase in cycles (default is 0)
+        """
+        super(SawtoothWaveGenerator, self).__init__(
+            frequency, sample_rate, phase
+        )
+        self.width = width
+
+    def _evaluate(self, phase):
+        return signal.sawtooth(2 * np.pi * phase, width=self.width)
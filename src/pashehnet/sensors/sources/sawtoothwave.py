@@ -1,14 +1,14 @@
-from queue import SimpleQueue
-
 import numpy as np
 from scipy import signal
-from .base import SensorSourceBase
+from .cyclic import CyclicSourceBase
 
 
-class SawtoothWaveSource(SensorSourceBase):
+class SawtoothWaveSource(CyclicSourceBase):
     """
     Provides a sawtooth wave source using scipy.signal.sawtooth
     """
+    shareable = True
+
     def __init__(self, frequency, sample_rate, width=1.0):
         """
         Construct a new SawtoothWaveSource object
@@ -23,24 +23,9 @@ class SawtoothWaveSource(SensorSourceBase):
         self.width = width
         self.sample = None
 
-    def __next__(self):
-        """
-        Implementation for iterator
-
-        :return: Next value from the sawtooth wave source
-        """
-        if not self.sample:
-            self._init_sample()
-        val = self.sample.get()
-        self.sample.put(val)
-        return val
-
-    def _init_sample(self):
-        # Leverage Python core FIFO queue for infinite cycle sample
-        self.sample = SimpleQueue()
+    def _generate(self):
         t = np.linspace(0, 1, self.sample_rate, endpoint=False)
-        for x in signal.sawtooth(
+        return signal.sawtooth(
             2 * np.pi * self.frequency * t,
             width=self.width
-        ):
-            self.sample.put(x)
+        )
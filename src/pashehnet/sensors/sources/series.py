@@ -1,34 +1,59 @@
-from queue import SimpleQueue
+import numpy as np
 
-from .base import SensorSourceBase
+from .cyclic import CyclicSourceBase
+from .timeline import Timeline
 
 
-class SeriesSource(SensorSourceBase):
+class SeriesSource(CyclicSourceBase):
     """
     Class to provide a sensor data source from a list
     """
-    def __init__(self, series):
+    def __init__(self, series, times=None, sample_rate=None):
         """
         Constructor for series source
 
         :param series: List of values to loop over
+        :param times: Optional list of the recorded time of each value, in \
+        seconds or as datetimes, for replaying at the recorded times
+        :param sample_rate: Optional rate the series was recorded at, in Hz
         """
+        if times is not None and len(times) != len(series):
+            raise ValueError('times must be the same length as series')
         self.sample = None
         self.series = series
+        # Positional, even for a pandas Series with its own index
+        self.times = None if times is None else np.asarray(times)
+        self.sample_rate = sample_rate
+        self.timeline = Timeline()
 
-    def __next__(self):
+    def next_timed(self):
         """
-        Implementation for iterator
+        Return the next value along with its recorded time
 
-        :return: Next value from source
+        :return: Tuple of recorded time in seconds and value
         """
-        if not self.sample:
-            self._init_sample()
-        val = self.sample.get()
-        self.sample.put(val)
-        return val
-
-    def _init_sample(self):
-        self.sample = SimpleQueue()
-        for x in self.series:
-            self.sample.put(x)
+        if self.times is None:
+            return super(SeriesSource, self).next_timed()
+        t = self.times[self.pos]
+        return self.timeline.offset(t), next(self)
+
+    def rewind(self):
+        """
+        Go back to the start of the series and its recorded times
+
+        :return: True
+        """
+        self.timeline = Timeline()
+        return super(SeriesSource, self).rewind()
+
+    def _generate(self):
+        try:
+            sample = np.asarray(self.series)
+        except ValueError:
+            sample = None
+        if sample is None or sample.ndim != 1 or sample.dtype.kind in 'US':
+            # Keep the original objects rather than letting NumPy reject them
+            # or coerce them into rows or fixed-width strings
+            sample = np.empty(len(self.series), dtype=object)
+            sample[:] = list(self.series)
+        return sample
@@ -0,0 +1,100 @@
+from collections import namedtuple
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+# Define namedtuples
+SharedSample = namedtuple('SharedSample', ['name', 'shape', 'dtype'])
+
+# Segments attached by this process, keyed by name, so many sources sharing
+# a sample map it (and hold its file descriptor) only once
+_attached = {}
+
+
+def attach_sample(shared):
+    """
+    Attach to a shared sample published by SharedSamples, returning a
+    read-only array backed by the shared memory segment
+
+    :param shared: SharedSample handle
+    :return: Read-only ndarray
+    """
+    if shared.name not in _attached:
+        shm = SharedMemory(name=shared.name)
+        sample = np.ndarray(shared.shape, np.dtype(shared.dtype),
+                            buffer=shm.buf)
+        sample.flags.writeable = False
+        _attached[shared.name] = (shm, sample)
+    return _attached[shared.name][1]
+
+
+class SharedSamples(object):
+    """
+    Publishes the samples of cyclic sources into shared memory, once per
+    distinct sample.  Sources handed to share() are pointed at the segment
+    and attach to it read-only on first use in whatever process they run in,
+    so memory grows with the number of distinct waveforms rather than the
+    number of sensors.  The creating process owns the segments and must
+    close() them.
+    """
+    def __init__(self):
+        self.segments = {}
+        self.sources = []
+
+    def share(self, source):
+        """
+        Point a source at a shared copy of its sample, publishing the sample
+        if this is the first source with its configuration
+
+        :param source: Source to share; ignored unless it is a \
+        CyclicSourceBase with a sample_key(), or a ResampledSource wrapping one
+        :return: True if the source now uses shared memory
+        """
+        key = source.sample_key() if hasattr(source, 'sample_key') else None
+        # Resampled sources forward the key of the source they wrap
+        source = getattr(source, 'source', source)
+        if key is None or source.sample is not None:
+            return False
+
+        if key not in self.segments:
+            sample = np.ascontiguousarray(source.cached_sample())
+            if sample.dtype.hasobject:
+                self.segments[key] = None
+            else:
+                shm = SharedMemory(create=True, size=max(1, sample.nbytes))
+                np.ndarray(sample.shape, sample.dtype, buffer=shm.buf)[:] = \
+                    sample
+                self.segments[key] = (
+                    shm, SharedSample(shm.name, sample.shape, sample.dtype.str)
+                )
+
+        if self.segments[key] is None:
+            return False
+        source.shared = self.segments[key][1]
+        self.sources.append(source)
+        return True
+
+    def close(self):
+        """
+        Release and unlink all published segments, along with any this
+        process attached to, e.g. when precomputing payloads.  Shared sources
+        go back to generating their own samples.
+
+        :return: None
+        """
+        for source in self.sources:
+            source.shared = None
+            source.sample = None
+        self.sources = []
+        for segment in self.segments.values():
+            if segment:
+                attached = _attached.pop(segment[1].name, None)
+                if attached:
+                    try:
+                        attached[0].close()
+                    except BufferError:
+                        # Still viewed, e.g. by a sensor's current block
+                        pass
+                segment[0].close()
+                segment[0].unlink()
+        self.segments = {}
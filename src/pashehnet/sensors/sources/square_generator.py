@@ -0,0 +1,26 @@
+import numpy as np
+from scipy import signal
+from .generator import GeneratorSourceBase
+
+
+class SquareWaveGenerator(GeneratorSourceBase):
+    """
+    Provides a square wave source using scipy.signal.square, computed on the
+    fly; a constant-memory alternative to SquareWaveSource
+    """
+    def __init__(self, frequency, sample_rate, duty_cycle=0.5, phase=0.0):
+        """
+        Construct a new SquareWaveGenerator object
+
+        :param frequency: Frequency of the square wave in Hz
+        :param sample_rate: Sampling rate in Hz
+        :param duty_cycle: Duty cycle of the square wave (default is 0.5)
+        :param phase: Starting phase in cycles (default is 0)
+        """
+        super(SquareWaveGenerator, self).__init__(
+            frequency, sample_rate, phase
+        )
+        self.duty_cycle = duty_cycle
+
+    def _evaluate(self, phase):
+        return signal.square(2 * np.pi * phase, duty=self.duty_cycle)
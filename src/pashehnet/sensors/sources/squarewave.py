@@ -1,14 +1,14 @@
-from queue import SimpleQueue
-
 import numpy as np
 from scipy import signal
-from .base import SensorSourceBase
+from .cyclic import CyclicSourceBase
 
 
-class SquareWaveSource(SensorSourceBase):
+class SquareWaveSource(CyclicSourceBase):
     """
     Provides a square wave source using scipy.signal.square
     """
+    shareable = True
+
     def __init__(self, frequency, sample_rate, duty_cycle=0.5):
         """
         Construct a new SquareWaveSource object
@@ -22,23 +22,9 @@ class SquareWaveSource(SensorSourceBase):
         self.duty_cycle = duty_cycle
         self.sample = None
 
-    def __next__(self):
-        """
-        Implementation for iterator
-
-        :return: Next value from the square wave source
-        """
-        if not self.sample:
-            self._init_sample()
-        val = self.sample.get()
-        self.sample.put(val)
-        return val
-
-    def _init_sample(self):
-        self.sample = SimpleQueue()
+    def _generate(self):
         t = np.linspace(0, 1, self.sample_rate, endpoint=False)
-        for x in signal.square(
+        return signal.square(
             2 * np.pi * self.frequency * t,
             duty=self.duty_cycle
-        ):
-            self.sample.put(x)
+        )
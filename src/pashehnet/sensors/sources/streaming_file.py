@@ -0,0 +1,115 @@
+import numpy as np
+from smart_open import open
+
+from .base import SensorSourceBase
+
+
+class StreamingFileSource(SensorSourceBase):
+    """
+    Provides a file-based source, one value per line, from a local file or
+    URI, for files too large to hold in memory.  Lines are read ahead in
+    bounded chunks and the file is rewound (or reopened, if the stream can't
+    seek) when it runs out, so memory use is independent of file size.  The
+    file is opened on first read, in whichever process the sensor runs in.
+    """
+    def __init__(self, uri, dtype=float, chunk_size=4096, sample_rate=None):
+        """
+        Construct new object
+
+        :param uri: Local filesystem or URI to open file from
+        :param dtype: Data type to cast read values from
+        :param chunk_size: Maximum number of lines to read ahead at a time
+        :param sample_rate: Optional rate the file was recorded at, in Hz
+        """
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+        self.uri = uri
+        self.dtype = dtype
+        self.chunk_size = chunk_size
+        self.sample_rate = sample_rate
+        self.file = None
+        self.chunk = None
+        self.pos = 0
+
+    def __next__(self):
+        """
+        Implementation for iterator
+
+        :return: Next value from source
+        """
+        if self.chunk is None or self.pos == len(self.chunk):
+            self._read_chunk()
+        val = self.chunk[self.pos]
+        self.pos += 1
+        return val
+
+    def next_batch(self, n):
+        """
+        Return the next n values, reading further chunks as needed
+
+        :param n: Number of values to return
+        :return: ndarray of the next n values
+        """
+        blocks = []
+        while n > 0:
+            if self.chunk is None or self.pos == len(self.chunk):
+                self._read_chunk()
+            block = self.chunk[self.pos:self.pos + n]
+            self.pos += len(block)
+            n -= len(block)
+            blocks.append(block)
+        return np.concatenate(blocks) if blocks else np.array([])
+
+    def close(self):
+        """
+        Close the underlying file; it is reopened on the next read
+
+        :return: None
+        """
+        if self.file is not None:
+            self.file.close()
+        self.file = None
+
+    def _read_chunk(self):
+        """
+        Internal method to read up to chunk_size lines into the read-ahead
+        buffer, looping back to the start of the file at its end
+
+        :return: None
+        """
+        values = self._read_lines()
+        if not values:
+            self._rewind()
+            values = self._read_lines()
+            if not values:
+                raise ValueError(f'No values in {self.uri}')
+        self.chunk = np.array(values)
+        self.pos = 0
+
+    def _read_lines(self):
+        """
+        Internal method reading and parsing up to chunk_size non-blank lines
+
+        :return: List of parsed values
+        """
+        if self.file is None:
+            self.file = open(self.uri)
+        values = []
+        for line in self.file:
+            line = line.strip()
+            if line:
+                values.append(self.dtype(line))
+                if len(values) == self.chunk_size:
+                    break
+        return values
+
+    def _rewind(self):
+        """
+        Internal method to go back to the start of the file
+
+        :return: None
+        """
+        if self.file.seekable():
+            self.file.seek(0)
+        else:
+            self.close()
@@ -1,16 +1,16 @@
-from queue import SimpleQueue
-
 from scipy.signal import sweep_poly
 
-from .base import SensorSourceBase
+from .cyclic import CyclicSourceBase
 
 
-class SweepPolySource(SensorSourceBase):
+class SweepPolySource(CyclicSourceBase):
     """
     Frequency-swept cosine generator, with a time-dependent frequency.
     See:
     https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.sweep_poly.html
     """
+    shareable = True
+
     def __init__(self, t, poly, phi=0):
         """
         Construct new object
@@ -24,24 +24,9 @@ class SweepPolySource(SensorSourceBase):
         self.phi = phi
         self.sample = None
 
-    def __next__(self):
-        """
-        Implementation for iterator
-
-        :return: Next value from source
-        """
-        if not self.sample:
-            self._init_sample()
-        val = self.sample.get()
-        self.sample.put(val)
-        return val
-
-    def _init_sample(self):
-        # Leverage Python core FIFO queue for infinite cycle sample
-        self.sample = SimpleQueue()
-        for x in sweep_poly(
-                self.t,
-                self.poly,
-                self.phi
-        ):
-            self.sample.put(x)
+    def _generate(self):
+        return sweep_poly(
+            self.t,
+            self.poly,
+            self.phi
+        )
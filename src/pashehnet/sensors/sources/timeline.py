@@ -0,0 +1,49 @@
+import numpy as np
+
+
+def to_seconds(t):
+    """
+    Util method converting a recorded timestamp to seconds
+
+    :param t: Number of seconds, datetime-like or ISO 8601 string
+    :return: Float seconds
+    """
+    if isinstance(t, str):
+        t = np.datetime64(t)
+    if isinstance(t, np.datetime64):
+        return t.astype('datetime64[ns]').astype(np.int64) / 1e9
+    if hasattr(t, 'timestamp'):
+        return t.timestamp()
+    return float(t)
+
+
+class Timeline(object):
+    """
+    Turns the recorded timestamps of a replay into seconds on a timeline that
+    keeps running forward when the replay loops back to its start (the
+    timestamp goes backwards); the next pass follows the last value after the
+    recording's first gap.
+    """
+    def __init__(self):
+        self.first = None
+        self.last = None
+        self.gap = 0.0
+        self.loop_offset = 0.0
+
+    def offset(self, t):
+        """
+        Position of a recorded timestamp on the replay timeline
+
+        :param t: Recorded timestamp, see to_seconds()
+        :return: Recorded time in seconds, plus the length of any passes \
+        already replayed
+        """
+        t = to_seconds(t)
+        if self.first is None:
+            self.first = t
+        elif t < self.last:
+            self.loop_offset += self.last - self.first + self.gap
+        elif not self.gap:
+            self.gap = t - self.last
+        self.last = t
+        return self.loop_offset + t
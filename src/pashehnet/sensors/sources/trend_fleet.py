@@ -0,0 +1,36 @@
+import numpy as np
+
+from .constant import ConstantValueSource
+from .fleet import FleetSourceBase
+
+
+class TrendFleet(FleetSourceBase):
+    """
+    Fleet of channels sharing one trend, e.g. a building's daily temperature
+    cycle, each with its own offset plus independent noise.  The trend is
+    any source, read a block at a time.
+    """
+    def __init__(self, n, trend=None, offset=0.0, scale=1.0, block_size=256,
+                 seed=None, max_chunks=None):
+        """
+        Construct new object
+
+        :param n: Number of channels
+        :param trend: Source of the shared trend; defaults to constant zero
+        :param offset: Offset from the trend, scalar or one per channel
+        :param scale: Standard deviation of the noise, scalar or one per \
+        channel
+        :param block_size: Number of time steps computed at a time
+        :param seed: Seed for the random number generator
+        :param max_chunks: Optional limit on the number of blocks held (see \
+        ColumnarReaderBase)
+        """
+        super(TrendFleet, self).__init__(n, block_size, seed, max_chunks)
+        self.trend = trend if trend is not None else ConstantValueSource(0.0)
+        self.offset = np.asarray(offset, dtype=float)
+        self.scale = scale
+
+    def _step(self, steps):
+        trend = np.asarray(self.trend.next_batch(steps), dtype=float)
+        return trend[:, np.newaxis] + self.offset + \
+            self._innovations(steps, self.scale)
@@ -1,12 +1,10 @@
-from queue import SimpleQueue
-
 import numpy as np
 from scipy.signal import unit_impulse
 
-from .base import SensorSourceBase
+from .cyclic import CyclicSourceBase
 
 
-class UnitImpulseSource(SensorSourceBase):
+class UnitImpulseSource(CyclicSourceBase):
     """
     Unit impulse signal (discrete delta function) or unit basis vector.
     See:
@@ -21,26 +19,13 @@ class UnitImpulseSource(SensorSourceBase):
     :param dtype: data-type, optional. The desired data-type for the array, \
     e.g., numpy.int8. Default is numpy.float64.
     """
+    shareable = True
+
     def __init__(self, shape, idx=None, dtype=np.float64):
         self.shape = shape
         self.idx = idx
         self.dtype = dtype
         self.sample = None
 
-    def __next__(self):
-        """
-        Implementation for iterator
-
-        :return: Next value from source
-        """
-        if not self.sample:
-            self._init_sample()
-        val = self.sample.get()
-        self.sample.put(val)
-        return val
-
-    def _init_sample(self):
-        # Leverage Python core FIFO queue for infinite cycle sample
-        self.sample = SimpleQueue()
-        for x in unit_impulse(self.shape, self.idx, self.dtype):
-            self.sample.put(x)
+    def _generate(self):
+        return unit_impulse(self.shape, self.idx, self.dtype)
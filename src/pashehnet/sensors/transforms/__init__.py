@@ -4,3 +4,8 @@ The `pashehnet.sensors.transforms` package contains the transforms for sensors.
 from .base import SensorTransformBase  # noqa: F401
 from .dropout import DropoutTransform  # noqa: F401
 from .stuck import StuckTransform  # noqa: F401
+from .noise import NoiseTransform  # noqa: F401
+from .drift import DriftTransform  # noqa: F401
+from .spike import SpikeTransform  # noqa: F401
+from .quantize import QuantizeTransform  # noqa: F401
+from .delay import DelayTransform  # noqa: F401
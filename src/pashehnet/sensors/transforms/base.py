@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class SensorTransformBase(ABC):
     """
@@ -14,3 +16,26 @@ class SensorTransformBase(ABC):
         :return: Transformed value
         """
         ...
+
+    def transform_batch(self, values):
+        """
+        Apply transform to a block of consecutive sensor data, carrying any
+        state across blocks exactly as transform() would.  The default falls
+        back to calling transform() per value; transforms that can work on
+        whole arrays should override this.
+
+        :param values: ndarray of values to transform
+        :return: ndarray of transformed values
+        """
+        return np.array([self.transform(v) for v in values])
+
+    def reseed(self, rng):
+        """
+        Replace the transform's random number generator, e.g. with a stream
+        derived from a network seed, restarting any random state.  The
+        default does nothing, for deterministic transforms.
+
+        :param rng: NumPy random number generator to use
+        :return: None
+        """
+        pass
@@ -0,0 +1,78 @@
+from collections import deque
+
+import numpy as np
+
+from .base import SensorTransformBase
+from .events import BlockDraws
+
+
+class DelayTransform(SensorTransformBase):
+    """
+    Signal transform delaying the signal by `delay` samples, optionally
+    with a random jitter of up to `jitter` samples either way, drawn per
+    sample (so jitter can reorder values).  Until enough history has built
+    up, the earliest value seen stands in for older ones.
+    """
+    def __init__(self, delay=1, jitter=0, rng=None, block_size=1024):
+        """
+        CTOR for class
+
+        :param delay: Delay in samples
+        :param jitter: Maximum deviation from the delay, in samples
+        :param rng: NumPy random number generator to use; defaults to \
+        numpy.random.default_rng
+        :param block_size: Number of jitter values to draw at a time
+        """
+        if delay < 0 or jitter < 0:
+            raise ValueError('delay and jitter must not be negative')
+        self.delay = delay
+        self.jitter = jitter
+        self.block_size = block_size
+        # Latest values, including the current one
+        self.history = deque(maxlen=delay + jitter + 1)
+        self.reseed(rng or np.random.default_rng())
+
+    def reseed(self, rng):
+        """
+        Replace the random number generator, restarting the jitter
+
+        :param rng: NumPy random number generator to use
+        :return: None
+        """
+        self.rng = rng
+        self.draws = BlockDraws(
+            lambda n: rng.integers(-self.jitter, self.jitter + 1, size=n),
+            self.block_size
+        ) if self.jitter else None
+
+    def transform(self, value):
+        """
+        Apply transform, returning the value from `delay` samples ago
+
+        :param value: Value to apply transform to
+        :return: Transformed value
+        """
+        self.history.append(value)
+        lag = self.delay
+        if self.draws:
+            lag = max(lag + self.draws.next(), 0)
+        return self.history[max(len(self.history) - 1 - lag, 0)]
+
+    def transform_batch(self, values):
+        """
+        Apply transform to a block of values
+
+        :param values: ndarray of values to transform
+        :return: ndarray of transformed values
+        """
+        if not len(values):
+            return values
+        past = np.asarray(self.history) \
+            if self.history else values[:0]
+        buf = np.concatenate([past, values])
+        lags = self.delay
+        if self.draws:
+            lags = np.maximum(lags + self.draws.take(len(values)), 0)
+        idx = np.maximum(len(past) + np.arange(len(values)) - lags, 0)
+        self.history.extend(values[-self.history.maxlen:])
+        return buf[idx]
@@ -0,0 +1,71 @@
+import numpy as np
+
+from .base import SensorTransformBase
+from .events import BlockDraws
+
+
+class DriftTransform(SensorTransformBase):
+    """
+    Signal transform adding a slowly drifting offset, as from a sensor
+    losing calibration.  Each sample the offset moves by `rate`, for linear
+    drift, plus a Gaussian step of standard deviation `walk`, for random-walk
+    drift; either can be used alone.
+    """
+    def __init__(self, rate=0.0, walk=0.0, offset=0.0, rng=None,
+                 block_size=1024):
+        """
+        CTOR for class
+
+        :param rate: Offset added per sample
+        :param walk: Standard deviation of the random step per sample
+        :param offset: Starting offset
+        :param rng: NumPy random number generator to use; defaults to \
+        numpy.random.default_rng
+        :param block_size: Number of random steps to draw at a time
+        """
+        self.rate = rate
+        self.walk = walk
+        self.offset = offset
+        self.block_size = block_size
+        self.reseed(rng or np.random.default_rng())
+
+    def reseed(self, rng):
+        """
+        Replace the random number generator, restarting the random walk
+
+        :param rng: NumPy random number generator to use
+        :return: None
+        """
+        self.rng = rng
+        self.draws = BlockDraws(rng.standard_normal, self.block_size)
+
+    def transform(self, value):
+        """
+        Apply transform, advancing the drift and adding it to the value
+
+        :param value: Value to apply transform to
+        :return: Transformed value
+        """
+        step = self.rate
+        if self.walk:
+            step += self.walk * self.draws.next()
+        self.offset += step
+        return value + self.offset
+
+    def transform_batch(self, values):
+        """
+        Apply transform to a block of values
+
+        :param values: ndarray of values to transform
+        :return: ndarray of transformed values
+        """
+        if not len(values):
+            return values
+        steps = np.full(len(values), float(self.rate))
+        if self.walk:
+            steps += self.walk * self.draws.take(len(values))
+        # Accumulating from the current offset adds the steps in the same
+        # order transform() does, so results match to the last bit
+        offsets = np.cumsum(np.concatenate([[self.offset], steps]))[1:]
+        self.offset = float(offsets[-1])
+        return values + offsets
@@ -1,6 +1,7 @@
 import numpy as np
 
 from .base import SensorTransformBase
+from .events import EventSchedule
 
 
 class DropoutTransform(SensorTransformBase):
@@ -29,8 +30,18 @@ class DropoutTransform(SensorTransformBase):
         self.value = value
         self.duration = duration
         self.duration_range = duration_range
-        self.rng = rng or np.random.default_rng()
-        self.rem_dropout = 0
+        self.reseed(rng or np.random.default_rng())
+
+    def reseed(self, rng):
+        """
+        Replace the random number generator, restarting the dropout schedule
+
+        :param rng: NumPy random number generator to use
+        :return: None
+        """
+        self.rng = rng
+        self.events = EventSchedule(self.prob, rng, self.duration,
+                                    self.duration_range)
 
     def transform(self, value):
         """
@@ -40,16 +51,15 @@ class DropoutTransform(SensorTransformBase):
         :param value: Value to apply transform to
         :return: Transformed value
         """
-        if self.rem_dropout <= 0:
-            p = self.rng.random()
-            if p <= self.prob:
-                self.in_dropout = True
-                self.start_count = 0
-                self.rem_dropout = self.rng.integers(
-                    self.duration_range[0], self.duration_range[1] + 1
-                ) if self.duration_range else self.duration
-
-        if self.rem_dropout > 0:
-            self.rem_dropout -= 1
+        if self.events.step():
             return self.value
         return value
+
+    def transform_batch(self, values):
+        """
+        Apply transform to a block of values
+
+        :param values: ndarray of values to transform
+        :return: ndarray of transformed values
+        """
+        return np.where(self.events.mask(len(values)), self.value, values)
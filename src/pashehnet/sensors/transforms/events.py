@@ -0,0 +1,174 @@
+import math
+
+import numpy as np
+
+from pashehnet.rng import split_rng
+
+
+class BlockDraws(object):
+    """
+    Serves random draws one at a time from blocks drawn in a single call,
+    so the per-draw cost is a list lookup rather than a generator call
+    """
+    def __init__(self, draw, block_size=256):
+        """
+        CTOR
+
+        :param draw: Callable taking a size and returning that many draws
+        :param block_size: Number of values to draw at a time
+        """
+        self.draw = draw
+        self.block_size = block_size
+        self.array = np.empty(0)
+        self.block = []
+        self.pos = 0
+
+    def next(self):
+        """
+        :return: Next draw
+        """
+        if self.pos == len(self.array):
+            self._refill()
+        if self.block is None:
+            self.block = self.array.tolist()
+        val = self.block[self.pos]
+        self.pos += 1
+        return val
+
+    def take(self, n):
+        """
+        Return the next n draws at once.  Fresh blocks are drawn exactly as
+        next() would draw them, so taking draws in batches or one at a time
+        yields the same values.
+
+        :param n: Number of draws
+        :return: ndarray of draws
+        """
+        head = self.array[self.pos:self.pos + n]
+        self.pos += len(head)
+        # Leave out an empty head, whose dtype may not match the draws
+        parts = [head] if len(head) or not n else []
+        needed = n - len(head)
+        while needed > 0:
+            self._refill()
+            self.pos = min(needed, self.block_size)
+            parts.append(self.array[:self.pos])
+            needed -= self.pos
+        return np.concatenate(parts)
+
+    def _refill(self):
+        """
+        Internal method drawing a fresh block; next() converts it to a list
+        on first use, for fast scalar access
+
+        :return: None
+        """
+        self.array = self.draw(self.block_size)
+        self.block = None
+        self.pos = 0
+
+
+class EventSchedule(object):
+    """
+    Decides, sample by sample, whether a randomly starting event such as a
+    dropout is in progress.  Every sample outside an event starts one with
+    probability `prob`, so rather than a draw per sample the gap until the
+    next event is drawn from the matching geometric distribution and counted
+    down.  Gaps and durations are drawn in blocks.
+    """
+    def __init__(self, prob, rng, duration=1, duration_range=None,
+                 block_size=256):
+        """
+        CTOR
+
+        :param prob: Probability of an event starting at each sample
+        :param rng: NumPy random number generator to draw from
+        :param duration: Sample count of each event
+        :param duration_range: Tuple of min/max event sample counts, drawn \
+        uniformly; overrides duration
+        :param block_size: Number of gaps and durations to draw at a time
+        """
+        self.prob = prob
+        self.duration = duration
+        self.duration_range = duration_range
+        # Separate streams, so draws come out the same however gaps and
+        # durations interleave
+        gap_rng, duration_rng = split_rng(rng, 2)
+        self.gaps = BlockDraws(
+            lambda n: gap_rng.geometric(prob, size=n), block_size
+        ) if prob > 0 else None
+        self.durations = BlockDraws(
+            lambda n: duration_rng.integers(duration_range[0],
+                                            duration_range[1] + 1, size=n),
+            block_size
+        ) if duration_range else None
+        self.gap = None
+        self.remaining = 0
+
+    def step(self):
+        """
+        Advance one sample
+
+        :return: True if the sample falls within an event
+        """
+        if self.remaining > 0:
+            self.remaining -= 1
+            return True
+        if self.gap is None:
+            self.gap = self._next_gap()
+        if self.gap > 0:
+            self.gap -= 1
+            return False
+
+        # An event starts on this sample
+        self.gap = None
+        duration = self.durations.next() if self.durations else self.duration
+        if duration <= 0:
+            return False
+        self.remaining = duration - 1
+        return True
+
+    def mask(self, n):
+        """
+        Advance n samples at once, stepping from event to event rather than
+        sample to sample
+
+        :param n: Number of samples
+        :return: Boolean ndarray, True for samples within an event
+        """
+        mask = np.zeros(n, dtype=bool)
+        i = 0
+        while i < n:
+            if self.remaining > 0:
+                k = min(self.remaining, n - i)
+                mask[i:i + k] = True
+                self.remaining -= k
+                i += k
+                continue
+            if self.gap is None:
+                self.gap = self._next_gap()
+            if self.gap > 0:
+                k = int(min(self.gap, n - i))
+                self.gap -= k
+                i += k
+                continue
+
+            # An event starts on sample i
+            self.gap = None
+            duration = self.durations.next() if self.durations else \
+                self.duration
+            if duration <= 0:
+                i += 1
+            else:
+                self.remaining = duration
+        return mask
+
+    def _next_gap(self):
+        """
+        Internal method drawing the number of samples before the next event
+
+        :return: Sample count, infinite if events never happen
+        """
+        if self.gaps is None:
+            return math.inf
+        return self.gaps.next() - 1
@@ -0,0 +1,75 @@
+import numpy as np
+
+from .base import SensorTransformBase
+from .events import BlockDraws
+
+
+class NoiseTransform(SensorTransformBase):
+    """
+    Signal transform adding random noise to every value, either Gaussian
+    with standard deviation `scale` or uniform over [-scale, scale].  Noise
+    is drawn from `rng` in blocks.
+    """
+    GAUSSIAN = 'gaussian'
+    UNIFORM = 'uniform'
+    DISTRIBUTIONS = [GAUSSIAN, UNIFORM]
+
+    def __init__(self, scale=1.0, distribution=GAUSSIAN, rng=None,
+                 block_size=1024):
+        """
+        CTOR for class
+
+        :param scale: Standard deviation of Gaussian noise, or half-width of \
+        uniform noise
+        :param distribution: One of 'gaussian' or 'uniform'
+        :param rng: NumPy random number generator to use; defaults to \
+        numpy.random.default_rng
+        :param block_size: Number of values to draw at a time
+        """
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f'Unknown noise distribution: {distribution}')
+        self.scale = scale
+        self.distribution = distribution
+        self.block_size = block_size
+        self.reseed(rng or np.random.default_rng())
+
+    def reseed(self, rng):
+        """
+        Replace the random number generator, restarting the noise
+
+        :param rng: NumPy random number generator to use
+        :return: None
+        """
+        self.rng = rng
+        self.draws = BlockDraws(
+            rng.standard_normal if self.distribution == self.GAUSSIAN
+            else self._uniform,
+            self.block_size
+        )
+
+    def transform(self, value):
+        """
+        Apply transform, adding noise to the value
+
+        :param value: Value to apply transform to
+        :return: Transformed value
+        """
+        return value + self.scale * self.draws.next()
+
+    def transform_batch(self, values):
+        """
+        Apply transform to a block of values
+
+        :param values: ndarray of values to transform
+        :return: ndarray of transformed values
+        """
+        return values + self.scale * self.draws.take(len(values))
+
+    def _uniform(self, n):
+        """
+        Internal method drawing uniform noise over [-1, 1)
+
+        :param n: Number of values to draw
+        :return: ndarray of values
+        """
+        return self.rng.uniform(-1.0, 1.0, n)
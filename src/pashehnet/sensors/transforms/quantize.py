@@ -0,0 +1,65 @@
+import numpy as np
+
+from .base import SensorTransformBase
+
+
+class QuantizeTransform(SensorTransformBase):
+    """
+    Signal transform modelling an analog-to-digital converter: values are
+    rounded to the nearest level, `step` apart from `low`, and clipped to
+    [low, high].  The step can be given directly or as a resolution in
+    `bits` across the range; either the rounding or the clipping can be
+    used alone.
+    """
+    def __init__(self, step=None, low=None, high=None, bits=None):
+        """
+        CTOR for class
+
+        :param step: Distance between levels; None for no rounding
+        :param low: Lowest value, also the first level; None for no lower \
+        bound
+        :param high: Highest value; None for no upper bound
+        :param bits: Resolution in bits, setting step so 2**bits levels \
+        span [low, high]; overrides step and needs both bounds
+        """
+        if bits is not None:
+            if low is None or high is None:
+                raise ValueError('bits needs both low and high')
+            step = (high - low) / (2 ** bits - 1)
+        if step is not None and step <= 0:
+            raise ValueError('step must be positive')
+        self.step = step
+        self.low = low
+        self.high = high
+        self.bits = bits
+        self.origin = low or 0.0
+
+    def transform(self, value):
+        """
+        Apply transform, rounding and clipping the value
+
+        :param value: Value to apply transform to
+        :return: Transformed value
+        """
+        if self.step:
+            value = self.origin + \
+                round((value - self.origin) / self.step) * self.step
+        if self.low is not None:
+            value = max(value, self.low)
+        if self.high is not None:
+            value = min(value, self.high)
+        return value
+
+    def transform_batch(self, values):
+        """
+        Apply transform to a block of values
+
+        :param values: ndarray of values to transform
+        :return: ndarray of transformed values
+        """
+        if self.step:
+            values = self.origin + \
+                np.round((values - self.origin) / self.step) * self.step
+        if self.low is not None or self.high is not None:
+            values = np.clip(values, self.low, self.high)
+        return values
@@ -0,0 +1,96 @@
+import numpy as np
+
+from pashehnet.rng import split_rng
+from .base import SensorTransformBase
+from .events import BlockDraws, EventSchedule
+
+
+class SpikeTransform(SensorTransformBase):
+    """
+    Signal transform adding random spikes (outliers) to the signal:
+
+    - Probability of a spike starting (uniform distro)
+    - Size of each outlier, constant or min/max variable from uniform \
+    distro, with a random sign
+    - Duration of a spike in samples, constant or min/max variable from \
+    uniform distro; every sample within a spike gets its own outlier
+
+    Spike starts are scheduled like dropouts, by geometric gaps, and
+    outlier sizes are drawn in blocks.
+    """
+    def __init__(self, prob=0.01, magnitude=1.0, magnitude_range=None,
+                 duration=1, duration_range=None, rng=None, block_size=256):
+        """
+        CTOR for class
+
+        :param prob: Probability of a spike starting [0.0, 1.0]
+        :param magnitude: Size of each outlier
+        :param magnitude_range: Tuple of min/max outlier sizes; overrides \
+        magnitude
+        :param duration: Sample count in a spike
+        :param duration_range: Tuple of min/max spike sample counts
+        :param rng: NumPy random number generator to use; defaults to \
+        numpy.random.default_rng
+        :param block_size: Number of outlier sizes to draw at a time
+        """
+        self.prob = prob
+        self.magnitude = magnitude
+        self.magnitude_range = magnitude_range
+        self.duration = duration
+        self.duration_range = duration_range
+        self.block_size = block_size
+        self.reseed(rng or np.random.default_rng())
+
+    def reseed(self, rng):
+        """
+        Replace the random number generator, restarting the spike schedule
+
+        :param rng: NumPy random number generator to use
+        :return: None
+        """
+        self.rng = rng
+        # Outliers get their own stream, apart from the schedule's
+        event_rng, self.outlier_rng = split_rng(rng, 2)
+        self.events = EventSchedule(self.prob, event_rng, self.duration,
+                                    self.duration_range)
+        self.outliers = BlockDraws(self._outliers, self.block_size)
+
+    def transform(self, value):
+        """
+        Apply transform, adding an outlier when a spike is occurring
+
+        :param value: Value to apply transform to
+        :return: Transformed value
+        """
+        if self.events.step():
+            return value + self.outliers.next()
+        return value
+
+    def transform_batch(self, values):
+        """
+        Apply transform to a block of values
+
+        :param values: ndarray of values to transform
+        :return: ndarray of transformed values
+        """
+        spikes = self.events.mask(len(values))
+        count = np.count_nonzero(spikes)
+        if not count:
+            return values
+        values = values.astype(np.result_type(values, float))
+        values[spikes] += self.outliers.take(count)
+        return values
+
+    def _outliers(self, n):
+        """
+        Internal method drawing signed outlier sizes; one uniform draw on
+        [-1, 1) gives both the sign and, with a range, the size
+
+        :param n: Number of outliers to draw
+        :return: ndarray of outliers
+        """
+        u = self.outlier_rng.uniform(-1.0, 1.0, n)
+        if not self.magnitude_range:
+            return np.where(u < 0, -self.magnitude, self.magnitude)
+        low, high = self.magnitude_range
+        return np.sign(u) * (low + (high - low) * np.abs(u))
@@ -1,6 +1,7 @@
 import numpy as np
 
 from .base import SensorTransformBase
+from .events import EventSchedule
 
 
 class StuckTransform(SensorTransformBase):
@@ -28,8 +29,18 @@ class StuckTransform(SensorTransformBase):
         self.last_value = None
         self.duration = duration
         self.duration_range = duration_range
-        self.rng = rng or np.random.default_rng()
-        self.rem_stuck = 0
+        self.reseed(rng or np.random.default_rng())
+
+    def reseed(self, rng):
+        """
+        Replace the random number generator, restarting the stuck schedule
+
+        :param rng: NumPy random number generator to use
+        :return: None
+        """
+        self.rng = rng
+        self.events = EventSchedule(self.prob, rng, self.duration,
+                                    self.duration_range)
 
     def transform(self, value):
         """
@@ -39,17 +50,29 @@ class StuckTransform(SensorTransformBase):
         :param value:
         :return:
         """
-        if self.rem_stuck <= 0:
-            p = self.rng.random()
-            if p <= self.prob:
-                self.in_dropout = True
-                self.start_count = 0
-                self.rem_stuck = self.rng.integers(
-                    self.duration_range[0], self.duration_range[1] + 1
-                ) if self.duration_range else self.duration
-
-        if self.rem_stuck > 0:
-            self.rem_stuck -= 1
+        if self.events.step():
             return self.last_value
         self.last_value = value
         return value
+
+    def transform_batch(self, values):
+        """
+        Apply transform to a block of values, holding the last good value
+        through stuck stretches, including from the previous block
+
+        :param values: ndarray of values to transform
+        :return: ndarray of transformed values
+        """
+        if not len(values):
+            return values
+        stuck = self.events.mask(len(values))
+        # Index of the latest good value at each position; -1 means the last
+        # good value of an earlier block
+        good = np.where(stuck, -1, np.arange(len(values)))
+        latest = np.maximum.accumulate(good)
+        if (latest < 0).any():
+            values = np.concatenate([[self.last_value], values])
+            latest = latest + 1
+        out = values[latest]
+        self.last_value = out[-1]
+        return out
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 
@@ -15,3 +16,17 @@ class SensorTargetBase(ABC):
         :return: None
         """
         ...
+
+    async def send_async(self, topic, payload):
+        """
+        Asynchronous variant of send() for use on an event loop.  By default
+        the blocking send() runs on the loop's executor so socket writes
+        don't stall other sensors; targets with non-blocking clients should
+        override this.
+
+        :param topic: Topic/channel to publish to
+        :param payload: Payload to publish
+        :return: None
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.send, topic, payload)
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 
 import paho.mqtt.client as mqtt
@@ -42,13 +43,18 @@ class MQTTTarget(SensorTargetBase):
                 protocol in [self.MQTTv311, self.MQTTv31, self.MQTTv5]) else (
             self.__getattribute__(protocol))
 
+        # Generated IDs are regenerated per worker process on connect so
+        # that workers sharing this target don't kick each other off the
+        # broker
+        self.generated_client_id = not self.client_id
         if not self.client_id:
             if not self.client_id_prefix:
                 self.client_id_prefix = 'pashehnet'
-            self.client_id = f'{self.client_id_prefix}--{str(uuid.uuid4())}'
+            self.client_id = self._generate_client_id()
 
         # Client object; needs to be instantiated on worker proc/thread
         self.client = None
+        self.connecting = None
 
     def send(self, topic, payload):
         """
@@ -62,6 +68,29 @@ class MQTTTarget(SensorTargetBase):
             self._init_client()
         self.client.publish(topic, payload)
 
+    async def send_async(self, topic, payload):
+        """
+        Publish the payload to the topic from an event loop.  Connecting
+        blocks, so it runs once on the loop's executor; after that the paho
+        network thread started by loop_start() owns the socket and publish()
+        only queues the message.
+
+        :param topic: Topic (channel) to publish to
+        :param payload: Payload (data) to publish
+        :return: None
+        """
+        if not self.client:
+            if not self.connecting:
+                self.connecting = asyncio.get_running_loop().run_in_executor(
+                    None, self._init_client
+                )
+            try:
+                await self.connecting
+            except Exception:
+                self.connecting = None
+                raise
+        self.client.publish(topic, payload)
+
     def _init_client(self):
         """
         Internal method to initialize the MQTT client on the local
@@ -69,6 +98,8 @@ class MQTTTarget(SensorTargetBase):
         paho.mqtt.publish.single()
         :return: None
         """
+        if self.generated_client_id:
+            self.client_id = self._generate_client_id()
         client = mqtt.Client(
             client_id=self.client_id,
             clean_session=True,
@@ -86,3 +117,10 @@ class MQTTTarget(SensorTargetBase):
         )
         client.loop_start()
         self.client = client
+
+    def _generate_client_id(self):
+        """
+        Internal method to generate a unique client ID from the prefix
+        :return: Client ID string
+        """
+        return f'{self.client_id_prefix}--{str(uuid.uuid4())}'
@@ -0,0 +1,17 @@
+import gzip
+
+from pashehnet.sensors.compressors import GzipCompressor
+
+
+class TestGzipCompressor:
+    """
+    Unit tests for GzipCompressor class
+    """
+
+    def test_compress(self):
+        compressor = GzipCompressor()
+        payload = 'a,ts,value\n1,12.5,42\n1,13.0,43'
+        compressed = compressor.compress(payload)
+        assert gzip.decompress(compressed) == payload.encode()
+        # No timestamp in the header
+        assert compressor.compress(payload) == compressed
@@ -0,0 +1,26 @@
+import zlib
+
+from pashehnet.sensors.compressors import ZlibCompressor
+
+
+class TestZlibCompressor:
+    """
+    Unit tests for ZlibCompressor class
+    """
+
+    def test_compress(self):
+        compressor = ZlibCompressor(level=9)
+        payload = '{"value": 1.5}' * 20
+        compressed = compressor.compress(payload)
+        assert zlib.decompress(compressed) == payload.encode()
+
+    def test_stats(self):
+        compressor = ZlibCompressor()
+        for payload in [b'a' * 100, b'b' * 300]:
+            compressor.compress(payload)
+        stats = compressor.stats
+        assert stats.payloads == 2
+        assert stats.bytes_in == 400
+        assert stats.ratio == 400 / stats.bytes_out
+        assert stats.ratio > 1
+        assert stats.cpu_time >= 0.0
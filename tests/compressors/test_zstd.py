@@ -0,0 +1,63 @@
+import json
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pashehnet.sensors.compressors import ZstdCompressor
+
+zstandard = pytest.importorskip('zstandard')
+
+
+@pytest.fixture()
+def samples():
+    return [
+        json.dumps({'sensor': f'room{i % 20}', 'ts': 1700000000 + i * 0.5,
+                    'data': {'value': i * 0.37}})
+        for i in range(500)
+    ]
+
+
+class TestZstdCompressor:
+    """
+    Unit tests for ZstdCompressor class
+    """
+
+    def test_compress(self):
+        compressor = ZstdCompressor(level=9)
+        payload = b'1.5,2.5,3.5\n' * 50
+        compressed = compressor.compress(payload)
+        assert zstandard.ZstdDecompressor().decompress(compressed) == payload
+
+    def test_dictionary(self, samples, tmp_path):
+        """
+        Test a dictionary trained on samples shrinks small payloads, and
+        decompresses with the saved dictionary
+        """
+        trained = ZstdCompressor(samples=samples)
+        plain = ZstdCompressor()
+        payload = samples[7]
+        compressed = trained.compress(payload)
+        assert len(compressed) < len(plain.compress(payload)) / 2
+
+        path = tmp_path / 'readings.dict'
+        trained.save_dictionary(path)
+        loaded = ZstdCompressor(dictionary=str(path))
+        assert loaded.compress(payload) == compressed
+        dict_data = zstandard.ZstdCompressionDict(path.read_bytes())
+        decompressor = zstandard.ZstdDecompressor(dict_data=dict_data)
+        assert decompressor.decompress(compressed) == payload.encode()
+
+    def test_shared(self, samples):
+        """
+        Test a compressor shared between threads keeps exact stats, and
+        survives pickling
+        """
+        compressor = ZstdCompressor(samples=samples)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            compressed = list(executor.map(compressor.compress, samples * 4))
+        assert compressor.stats.payloads == len(samples) * 4
+        assert compressor.stats.bytes_out == sum(len(c) for c in compressed)
+
+        copy = pickle.loads(pickle.dumps(compressor))
+        assert copy.compress(samples[0]) == compressed[0]
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from pashehnet.sensors.formats import CBORFormat
+
+cbor2 = pytest.importorskip('cbor2')
+
+
+class TestCBORFormat:
+    """
+    Unit tests for CBORFormat class
+    """
+
+    def test_format(self):
+        tpl = {'ts': None, 'id': 'abc', 'data': [None]}
+        fmt = CBORFormat(tpl, 'data[0]', timestamp_path='ts')
+        assert fmt.pieces is not None
+        for value in [1.5, -7, np.int64(2), np.float32(0.5), 'x', None]:
+            payload = fmt.transform_at(value, 12.5)
+            assert payload == fmt._fill(value, 12.5)
+            decoded = cbor2.loads(payload)
+            assert decoded == {'ts': 12.5, 'id': 'abc', 'data': [value]}
+
+    def test_batch(self):
+        fmt = CBORFormat({'v': None}, 'v')
+        for n in [1, 30, 300]:
+            values = list(range(n))
+            payload = fmt.transform_batch(values, [None] * n)
+            assert payload == cbor2.dumps([{'v': v} for v in values])
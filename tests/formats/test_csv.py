@@ -35,3 +35,36 @@ class TestCSVFormat:
             headers=True
         )
         assert 'a,b,value\n1,2,42' == fmt.transform(42)
+
+    def test_timestamp(self):
+        """
+        Test case where a timestamp field is emitted ahead of the value
+        """
+        fmt = CSVFormat(
+            prefix_fields={'a': 1},
+            timestamp_field='ts'
+        )
+        assert 'a,ts,value\n1,12.5,42' == fmt.transform_at(42, 12.5)
+
+    def test_batch(self):
+        """
+        Test case where a batch of readings shares one header line
+        """
+        fmt = CSVFormat(
+            prefix_fields={'a': 1},
+            timestamp_field='ts'
+        )
+        payload = fmt.transform_batch([42, 43], [12.5, 13.0])
+        assert 'a,ts,value\n1,12.5,42\n1,13.0,43' == payload
+
+    def test_group(self):
+        """
+        Test case where a gateway's readings share one header line and
+        timestamp, one row per sensor
+        """
+        fmt = CSVFormat(
+            prefix_fields={'a': 1},
+            timestamp_field='ts'
+        )
+        payload = fmt.transform_group(['x', 'y'], [1.0, 2.5], 10.0)
+        assert 'a,ts,id,value\n1,10.0,x,1.0\n1,10.0,y,2.5' == payload
@@ -1,3 +1,8 @@
+import json
+
+import numpy as np
+import pytest
+
 from pashehnet.sensors.formats import JSONFormat
 
 
@@ -14,3 +19,52 @@ class TestJSONFormat:
         payload = fmt.transform('a')
         expected = '{"sensor": 1, "source": "abc", "data": {"value": "a"}}'
         assert expected == payload
+
+    def test_timestamp(self):
+        tpl = {'ts': None, 'data': {'value': None}}
+        fmt = JSONFormat(tpl, 'data.value', timestamp_path='ts')
+
+        payload = fmt.transform_at(1.5, 12.5)
+        expected = '{"ts": 12.5, "data": {"value": 1.5}}'
+        assert expected == payload
+
+    def test_numpy(self):
+        fmt = JSONFormat({'data': {'value': None}}, 'data.value')
+        payload = fmt.transform(np.int64(3))
+        assert '{"data": {"value": 3}}' == payload
+
+    def test_compiled(self):
+        """
+        Compiled templates match filling in and serializing the whole
+        template, byte for byte
+        """
+        tpl = {'id': 'é"x', 'data': [{'v': None}, {'ts': None}], 'n': 1.5}
+        values = [1, -0.1, 1e300, float('nan'), float('-inf'), True, None,
+                  'ü\n', [1, 2], {'a': 1}, np.float64(0.3), np.int32(-4),
+                  np.bool_(False), np.float32(0.1)]
+        for ts_path in [None, 'data[1].ts', 'id']:
+            fmt = JSONFormat(tpl, 'data[0].v', timestamp_path=ts_path)
+            assert fmt.pieces is not None
+            for value in values:
+                assert fmt.transform_at(value, 12.25) == \
+                    fmt._fill(value, 12.25)
+
+    def test_uncompiled(self):
+        fmt = JSONFormat({'ts': None}, 'ts', timestamp_path='ts')
+        assert fmt.pieces is None
+        assert fmt.transform_at(1, 2) == '{"ts": 2}'
+        with pytest.raises(IndexError):
+            JSONFormat({'a': None}, 'b').transform(1)
+
+    def test_batch(self):
+        fmt = JSONFormat({'ts': None, 'v': None}, 'v', timestamp_path='ts')
+        payload = fmt.transform_batch([1, 2.5], [10.0, 11.0])
+        assert payload == json.dumps([{'ts': 10.0, 'v': 1},
+                                      {'ts': 11.0, 'v': 2.5}])
+
+    def test_group(self):
+        fmt = JSONFormat({'ts': None, 'ids': [], 'v': []}, 'v',
+                         timestamp_path='ts', id_path='ids')
+        payload = fmt.transform_group(['x', 'y'], np.array([1.0, 2.5]), 10.0)
+        assert payload == json.dumps({'ts': 10.0, 'ids': ['x', 'y'],
+                                      'v': [1.0, 2.5]})
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from pashehnet.sensors.formats import MsgPackFormat
+
+msgpack = pytest.importorskip('msgpack')
+
+
+class TestMsgPackFormat:
+    """
+    Unit tests for MsgPackFormat class
+    """
+
+    def test_format(self):
+        tpl = {'id': 3, 'data': {'value': None}, 'ts': None}
+        fmt = MsgPackFormat(tpl, 'data.value', timestamp_path='ts')
+        assert fmt.pieces is not None
+        for value in [1.5, -7, np.int64(2), np.float32(0.5), 'x', None]:
+            payload = fmt.transform_at(value, 12.5)
+            assert payload == fmt._fill(value, 12.5)
+            assert msgpack.unpackb(payload)['data']['value'] == value
+
+    def test_batch(self):
+        fmt = MsgPackFormat({'v': None}, 'v')
+        values = list(range(20))
+        payload = fmt.transform_batch(values, [None] * 20)
+        assert payload == msgpack.packb([{'v': v} for v in values])
@@ -0,0 +1,68 @@
+import struct
+
+import numpy as np
+import pytest
+
+from pashehnet.sensors.formats import StructFormat
+
+
+class TestStructFormat:
+    """
+    Unit tests for StructFormat class
+    """
+
+    def test_format(self):
+        fields = [['id', 'H', 7], ['ts', 'I'], ['value', 'f']]
+        fmt = StructFormat(fields, timestamp_field='ts')
+        payload = fmt.transform_at(np.float64(1.5), 1700000000.6)
+        assert fmt.size == 10
+        assert payload == struct.pack('<HIf', 7, 1700000001, 1.5)
+
+    def test_no_timestamp(self):
+        fmt = StructFormat([['tag', '4s', 'ab'], ['value', 'h'],
+                            ['ts', 'd']],
+                           timestamp_field='ts', byte_order='>')
+        payload = fmt.transform(-2.7)
+        assert payload == struct.pack('>4shd', b'ab', -3, 0.0)
+
+    def test_layout(self):
+        with pytest.raises(ValueError):
+            StructFormat([['id', 'H'], ['value', 'f']])
+        with pytest.raises(ValueError):
+            StructFormat([['v', 'f']])
+        with pytest.raises(struct.error):
+            StructFormat([['id', 'B', 300], ['value', 'f']])
+
+    def test_batch(self):
+        fmt = StructFormat([['ts', 'd'], ['value', 'f']],
+                           timestamp_field='ts')
+        payload = fmt.transform_batch([1.0, 2.0], [10.0, 11.0])
+        assert payload == struct.pack('<dfdf', 10.0, 1.0, 11.0, 2.0)
+
+    def test_group(self):
+        fields = [['id', '4s'], ['ts', 'I'], ['value', 'h'], ['k', 'B', 9]]
+        values = np.array([1.6, -2.5, 300.2])
+        for byte_order in ['<', '>', '@']:
+            fmt = StructFormat(fields, timestamp_field='ts', id_field='id',
+                               byte_order=byte_order)
+            payload = fmt.transform_group(['a', 'bc', 'def'], values, 10.6)
+            assert payload == b''.join(
+                struct.pack(byte_order + '4sIhB', id, 11, value, 9)
+                for id, value in [(b'a', 2), (b'bc', -2), (b'def', 300)]
+            )
+
+    def test_group_range(self):
+        """
+        Group readings that don't fit their fields raise as when packed one
+        at a time, rather than wrapping
+        """
+        fmt = StructFormat([['id', 'B'], ['value', 'h']], id_field='id')
+        with pytest.raises(struct.error):
+            fmt.transform_group([1, 2], np.array([1.0, 40000.0]), None)
+        with pytest.raises(struct.error):
+            fmt.transform_group([1, 256], np.array([1.0, 2.0]), None)
+        fmt = StructFormat([['value', 'e']])
+        with pytest.raises(OverflowError):
+            fmt.transform_group([1], np.array([1e6]), None)
+        assert fmt.transform_group([1], np.array([np.inf]), None) == \
+            struct.pack('<e', np.inf)
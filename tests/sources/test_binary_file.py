@@ -0,0 +1,23 @@
+import numpy as np
+
+from pashehnet.sensors.sources import BinaryFileSource
+
+
+class TestBinaryFileSource:
+    """
+    Unit tests for BinaryFileSource class
+    """
+    def test_npy(self, tmp_path):
+        path = tmp_path / 'sample.npy'
+        np.save(path, np.arange(5, dtype=np.float32))
+        src = BinaryFileSource(str(path))
+        assert [next(src) for _ in range(7)] == [0, 1, 2, 3, 4, 0, 1]
+        assert not src.sample.flags.owndata
+
+    def test_raw(self, tmp_path):
+        path = tmp_path / 'sample.bin'
+        with open(path, 'wb') as f:
+            f.write(b'HEAD')
+            f.write(np.arange(4, dtype='<f8').tobytes())
+        src = BinaryFileSource(str(path), offset=4)
+        assert list(src.next_batch(6)) == [0.0, 1.0, 2.0, 3.0, 0.0, 1.0]
@@ -0,0 +1,73 @@
+import numpy as np
+
+from pashehnet.sensors.sources import (
+    SampleCache, SawtoothWaveSource, SeriesSource, sample_cache
+)
+
+
+class TestSampleCache:
+    def test_hits(self):
+        cache = SampleCache()
+        calls = []
+
+        def generate():
+            calls.append(1)
+            return np.zeros(10)
+
+        a = cache.get('a', generate)
+        b = cache.get('a', generate)
+        assert a is b
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.nbytes == a.nbytes
+
+    def test_eviction(self):
+        cache = SampleCache(max_bytes=250)
+        for key in 'abc':
+            cache.get(key, lambda: np.zeros(10))
+        # Touch a so b is the least recently used
+        cache.get('a', lambda: np.zeros(10))
+        cache.get('d', lambda: np.zeros(10))
+        assert 'b' not in cache
+        assert 'a' in cache and 'd' in cache
+        assert cache.evictions == 1
+        assert cache.nbytes <= 250
+
+    def test_oversized(self):
+        cache = SampleCache(max_bytes=10)
+        cache.get('a', lambda: np.zeros(10))
+        assert len(cache) == 0
+        assert cache.misses == 1
+
+    def test_resize(self):
+        cache = SampleCache()
+        for key in 'abc':
+            cache.get(key, lambda: np.zeros(10))
+        cache.resize(80)
+        assert list(cache.entries) == ['c']
+
+
+class TestSourceCaching:
+    def test_identical_sources(self):
+        """
+        Identically configured sources share one read-only sample
+        """
+        sample_cache.clear()
+        a = SawtoothWaveSource(3, 99, 0.25)
+        b = SawtoothWaveSource(3, 99, 0.25)
+        a.warm_up()
+        b.warm_up()
+        assert a.sample is b.sample
+        assert not a.sample.flags.writeable
+        assert (sample_cache.hits, sample_cache.misses) == (1, 1)
+        assert list(a.next_batch(5)) == list(b.next_batch(5))
+
+    def test_unkeyed(self):
+        """
+        Sources without a sample key bypass the cache
+        """
+        sample_cache.clear()
+        src = SeriesSource([1, 2, 3])
+        src.warm_up()
+        assert len(sample_cache) == 0
+        assert next(src) == 1
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pashehnet.sensors.helpers import sources_from_parquet
+from pashehnet.sensors.sources import CSVColumnReader
+
+
+@pytest.fixture()
+def csv_uri(tmp_path):
+    uri = tmp_path / 'wide.csv'
+    pd.DataFrame({
+        f'c{i}': np.arange(100) + i * 1000 for i in range(5)
+    }).to_csv(uri, index=False)
+    return str(uri)
+
+
+class TestColumnarReader:
+    def test_columns_in_use(self, csv_uri):
+        reader = CSVColumnReader(csv_uri, chunksize=16)
+        a = reader.column('c1')
+        b = reader.column('c3')
+        next(a)
+        assert set(reader.chunk(0)) == {'c1', 'c3'}
+        assert next(b) == 3000
+
+    def test_bounded(self, csv_uri):
+        reader = CSVColumnReader(csv_uri, chunksize=16)
+        a = reader.column('c0')
+        b = reader.column('c4')
+        for _ in range(250):
+            next(a)
+            next(b)
+            assert len(reader.chunks) <= 3
+        assert next(a) == 50
+        assert next(b) == 4050
+
+    def test_activated(self, csv_uri):
+        reader = CSVColumnReader(csv_uri, chunksize=16)
+        a = reader.column('c1')
+        b = reader.column('c3')
+        a.activate()
+        assert next(a) == 1000
+        assert set(reader.chunk(0)) == {'c1'}
+        with pytest.raises(ValueError):
+            next(b)
+        with pytest.raises(ValueError):
+            b.activate()
+
+    def test_max_chunks(self, csv_uri, caplog):
+        reader = CSVColumnReader(csv_uri, chunksize=16, max_chunks=3)
+        fast = reader.column('c0')
+        slow = reader.column('c4')
+        next(slow)
+        for _ in range(80):
+            fast.next_batch(4)
+            assert len(reader.chunks) <= 3
+        assert slow.chunk_no == reader.first and slow.pos == 0
+        assert next(slow) == reader.chunk(reader.first)['c4'][0]
+        assert 'c4' in caplog.text
+
+        with pytest.raises(ValueError):
+            CSVColumnReader(csv_uri, max_chunks=1)
+
+    def test_zero_copy(self, csv_uri):
+        reader = CSVColumnReader(csv_uri, chunksize=16)
+        src = reader.column('c2')
+        block = src.next_batch(8)
+        assert list(block) == list(range(2000, 2008))
+        assert np.shares_memory(block, reader.chunk(0)['c2'])
+        assert not block.flags.writeable
+
+    def test_single_chunk(self, csv_uri):
+        reader = CSVColumnReader(csv_uri, chunksize=1000)
+        src = reader.column('c0')
+        src.next_batch(250)
+        assert reader.single is not None
+        assert next(src) == 50
+
+    def test_parquet(self, tmp_path):
+        pytest.importorskip('pyarrow')
+        uri = str(tmp_path / 'wide.parquet')
+        pd.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}).to_parquet(uri)
+        sources = sources_from_parquet(uri, columns=['b'], batch_size=2)
+        assert list(sources['b'].next_batch(4)) == [4, 5, 6, 4]
@@ -15,3 +15,7 @@ class TestConstantValueSource:
         src = ConstantValueSource(val)
         values = [next(src) for i in range(10)]
         assert all(v == val for v in values)
+
+    def test_next_batch(self):
+        src = ConstantValueSource(42)
+        assert list(src.next_batch(5)) == [42] * 5
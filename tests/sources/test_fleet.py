@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from _pytest.python_api import approx
+
+from pashehnet.sensors.sources import (
+    AR1Fleet, RandomWalkFleet, SeriesSource, TrendFleet
+)
+
+
+def _read(channels, steps, batch=10):
+    # Channels advance together, as sensors ticking at the same rate do
+    blocks = [
+        np.array([ch.next_batch(batch) for ch in channels]).T
+        for _ in range(steps // batch)
+    ]
+    return np.concatenate(blocks)
+
+
+class TestFleetSources:
+    """
+    Unit tests for the fleet sources
+    """
+    def test_correlated_walk(self):
+        fleet = RandomWalkFleet(50, correlation=0.8, block_size=100, seed=1)
+        values = _read(fleet.channels(), 2000)
+        steps = np.diff(values, axis=0)
+        corr = np.corrcoef(steps.T)
+        off_diagonal = corr[~np.eye(50, dtype=bool)]
+        assert np.mean(off_diagonal) == approx(0.8, abs=0.05)
+        assert np.std(steps) == approx(1.0, abs=0.05)
+
+    def test_covariance(self):
+        cov = [[1.0, -0.9], [-0.9, 1.0]]
+        fleet = RandomWalkFleet(2, cov=cov, seed=2)
+        steps = np.diff(_read(fleet.channels(), 5000), axis=0)
+        assert np.corrcoef(steps.T)[0, 1] == approx(-0.9, abs=0.05)
+
+    def test_ar1(self):
+        fleet = AR1Fleet(20, phi=0.5, mean=10.0, block_size=64, seed=3)
+        values = _read(fleet.channels(), 5000)
+        assert np.mean(values) == approx(10.0, abs=0.05)
+        dev = values - 10.0
+        lag1 = np.mean(dev[1:] * dev[:-1]) / np.mean(dev * dev)
+        assert lag1 == approx(0.5, abs=0.05)
+
+    def test_trend(self):
+        trend = SeriesSource([0.0, 10.0, 20.0])
+        fleet = TrendFleet(3, trend=trend, offset=[0.0, 1.0, 2.0], scale=0.0,
+                           block_size=2)
+        values = _read(fleet.channels(), 4, batch=1)
+        assert values.tolist() == [
+            [0, 1, 2], [10, 11, 12], [20, 21, 22], [0, 1, 2]
+        ]
+
+    def test_channel_iteration(self):
+        """
+        Channels iterate independently over the same simulated blocks
+        """
+        a = RandomWalkFleet(3, block_size=8, seed=4)
+        b = RandomWalkFleet(3, block_size=8, seed=4)
+        expected = _read(a.channels(), 20)
+        ch = b.channels()
+        values = [[next(c) for c in ch] for _ in range(20)]
+        assert np.array(values) == approx(expected)
+
+    def test_max_chunks(self):
+        """
+        Channels read at different rates keep at most max_chunks blocks
+        """
+        fleet = AR1Fleet(2, block_size=8, seed=5, max_chunks=4)
+        fast, slow = fleet.channels()
+        next(slow)
+        for _ in range(50):
+            fast.next_batch(8)
+            assert len(fleet.chunks) <= 4
+        assert slow.chunk_no == fleet.first
+
+    def test_bad_channel(self):
+        with pytest.raises(IndexError):
+            AR1Fleet(2).channel(2)
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+from _pytest.python_api import approx
+
+from pashehnet.clock import VirtualClock
+from pashehnet.sensors import Sensor
+from pashehnet.sensors.formats import SimpleFormat
+from pashehnet.sensors.sources import (
+    ConstantValueSource, ResampledSource, SawtoothWaveSource, SeriesSource,
+    SharedSamples, sample_cache
+)
+
+
+class TestResampledSource:
+    """
+    Unit tests for ResampledSource class
+    """
+    def test_hold(self):
+        src = ResampledSource(
+            SeriesSource(list(range(10)), sample_rate=4), 1.5, 'hold'
+        )
+        # Output times 0, 2/3, 4/3, ... land on native samples 0, 2.67, ...
+        assert list(src.next_batch(6)) == [0, 2, 5, 8, 0, 3]
+
+    def test_linear(self):
+        src = ResampledSource(
+            SeriesSource([0.0, 10.0], sample_rate=1), 4, 'linear'
+        )
+        assert list(src.next_batch(8)) == \
+            approx([0, 2.5, 5, 7.5, 10, 7.5, 5, 2.5])
+
+    def test_decimate(self):
+        series = np.arange(1000.0)
+        src = ResampledSource(
+            SeriesSource(series, sample_rate=1000), 10, 'decimate',
+            block_size=3
+        )
+        values = [next(src) for _ in range(10)]
+        assert values == approx([np.mean(series[i:i + 100])
+                                 for i in range(0, 1000, 100)])
+        assert src.cycle is False
+
+    def test_blocks(self):
+        """
+        Iterating and batches agree across block boundaries
+        """
+        series = list(np.sin(np.arange(97) / 5))
+        a = ResampledSource(SeriesSource(series, sample_rate=7), 3,
+                            block_size=5)
+        b = ResampledSource(SeriesSource(series, sample_rate=7), 3,
+                            block_size=5)
+        expected = list(a.next_batch(200))
+        values = [next(b) for _ in range(13)] + list(b.next_batch(187))
+        assert values == approx(expected)
+
+    def test_cached_cycle(self):
+        """
+        A table whose cycle maps onto whole output values is resampled once
+        """
+        sample_cache.clear()
+        a = ResampledSource(SawtoothWaveSource(1, 1000), 10, 'decimate')
+        b = ResampledSource(SawtoothWaveSource(1, 1000), 10, 'decimate')
+        values = list(a.next_batch(25))
+        assert list(b.next_batch(25)) == values
+        assert a.cycle is b.cycle
+        assert len(a.cycle) == 10
+        assert values[:10] == values[10:20]
+
+    def test_warm_up(self):
+        """
+        Warming up or sharing a resampled source reaches the wrapped source
+        when its cycle doesn't map onto whole output values
+        """
+        src = ResampledSource(SawtoothWaveSource(1, 1000), 2.5)
+        src.warm_up()
+        assert src.cycle is False
+        assert src.source.sample is not None
+
+        tables = SharedSamples()
+        try:
+            src = ResampledSource(SawtoothWaveSource(1, 1000), 2.5)
+            assert tables.share(src)
+            src.warm_up()
+            assert src.source.shared is not None
+            expected = ResampledSource(SawtoothWaveSource(1, 1000), 2.5)
+            assert list(src.next_batch(10)) == \
+                approx(list(expected.next_batch(10)))
+        finally:
+            tables.close()
+
+    def test_no_rate(self):
+        with pytest.raises(ValueError):
+            ResampledSource(ConstantValueSource(1), 10)
+
+    def test_sensor(self):
+        source = SeriesSource(list(range(1000)), sample_rate=1000)
+        sensor = Sensor('s', source, SimpleFormat(), frequency=2,
+                        resample='hold', clock=VirtualClock())
+        assert [next(sensor) for _ in range(3)] == ['0', '500', '0']
@@ -1,3 +1,4 @@
+import pandas as pd
 from _pytest.python_api import approx
 
 from pashehnet.sensors.sources import SeriesSource
@@ -13,3 +14,28 @@ class TestSeriesSource:
         expected = [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 0.0]
         sample = [next(src) for _ in range(len(expected))]
         assert expected == approx(sample)
+
+    def test_next_batch(self):
+        """
+        Sources without a native implementation fall back to __next__
+        """
+        src = SeriesSource([0.0, 1.0, 2.0])
+        assert list(src.next_batch(4)) == [0.0, 1.0, 2.0, 0.0]
+        assert next(src) == 1.0
+
+    def test_objects(self):
+        """
+        Mixed and compound values come back unchanged
+        """
+        series = [1, 'a', (2, 3)]
+        src = SeriesSource(series)
+        assert [next(src) for _ in range(len(series))] == series
+
+    def test_indexed_times(self):
+        """
+        Recorded times in a pandas Series are read by position, not label
+        """
+        times = pd.Series([5.0, 6.0, 8.0], index=[2, 0, 1])
+        src = SeriesSource([1, 2, 3], times=times)
+        assert [src.next_timed() for _ in range(3)] == \
+            [(5.0, 1), (6.0, 2), (8.0, 3)]
@@ -0,0 +1,86 @@
+import multiprocessing
+
+import numpy as np
+
+from pashehnet.sensors.sources import (
+    ChirpSource, SawtoothWaveSource, SeriesSource, SharedSamples
+)
+from pashehnet.sensors.sources.shared import _attached
+
+
+def _read_in_child(source, n, mp_queue):
+    mp_queue.put(list(source.next_batch(n)))
+
+
+class TestSharedSamples:
+    def test_dedupe(self):
+        """
+        Identical sources share one segment, distinct ones get their own
+        """
+        tables = SharedSamples()
+        try:
+            a = SawtoothWaveSource(5, 100, 0.5)
+            b = SawtoothWaveSource(5, 100, 0.5)
+            c = SawtoothWaveSource(7, 100, 0.5)
+            assert all(tables.share(s) for s in [a, b, c])
+            assert len(tables.segments) == 2
+            assert a.shared == b.shared
+            assert a.shared != c.shared
+
+            expected = SawtoothWaveSource(5, 100, 0.5)
+            assert list(a.next_batch(150)) == \
+                list(expected.next_batch(150))
+            next(b)
+            assert a.sample is b.sample
+        finally:
+            tables.close()
+
+    def test_close_attached(self):
+        """
+        Segments attached in the creating process are closed with the rest
+        """
+        tables = SharedSamples()
+        src = SawtoothWaveSource(5, 100, 0.5)
+        tables.share(src)
+        next(src)
+        name = src.shared.name
+        shm = _attached[name][0]
+        tables.close()
+        assert name not in _attached
+        assert shm.buf is None
+        assert src.shared is None
+        expected = SawtoothWaveSource(5, 100, 0.5)
+        assert list(src.next_batch(5)) == list(expected.next_batch(5))
+
+    def test_array_params(self):
+        """
+        Array parameters are keyed on content, not identity
+        """
+        a = ChirpSource(np.linspace(0, 10, 100), f0=6, f1=1, t1=5)
+        b = ChirpSource(np.linspace(0, 10, 100), f0=6, f1=1, t1=5)
+        c = ChirpSource(np.linspace(0, 10, 101), f0=6, f1=1, t1=5)
+        assert a.sample_key() == b.sample_key()
+        assert a.sample_key() != c.sample_key()
+
+    def test_not_shareable(self):
+        tables = SharedSamples()
+        assert not tables.share(SeriesSource([1, 2, 3]))
+        assert not tables.segments
+
+    def test_child_process(self):
+        tables = SharedSamples()
+        try:
+            src = SawtoothWaveSource(5, 100, 0.5)
+            tables.share(src)
+            mp_queue = multiprocessing.Queue()
+            p = multiprocessing.Process(
+                target=_read_in_child,
+                args=(src, 10, mp_queue)
+            )
+            p.start()
+            values = mp_queue.get(timeout=5)
+            p.join()
+            expected = SawtoothWaveSource(5, 100, 0.5)
+            assert values == list(expected.next_batch(10))
+        finally:
+            tables.close()
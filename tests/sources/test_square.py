@@ -33,3 +33,21 @@ class TestSquareWaveSource:
 
         # Compare generated values with expected values
         assert generated_values == approx(expected_values)
+
+    def test_next_batch(self):
+        """
+        Test that batches match iterating and wrap around the cycle
+        """
+        frequency, sample_rate = 5, 500
+        a = SquareWaveSource(frequency, sample_rate)
+        b = SquareWaveSource(frequency, sample_rate)
+
+        expected = [next(a) for _ in range(2 * sample_rate + 10)]
+        batches = [b.next_batch(300) for _ in range(3)]
+        batches.append(b.next_batch(2 * sample_rate + 10 - 900))
+        assert list(np.concatenate(batches)) == expected
+
+        # Batches inside the cycle are read-only views, not copies
+        block = b.next_batch(10)
+        assert block.base is not None
+        assert not block.flags.writeable
@@ -0,0 +1,23 @@
+from _pytest.python_api import approx
+
+from pashehnet.sensors.sources import StreamingFileSource
+
+
+class TestStreamingFileSource:
+    """
+    Unit tests for StreamingFileSource class
+    """
+    def test_local(self):
+        uri = 'tests/sources/file_source.txt'
+        src = StreamingFileSource(uri, chunk_size=3)
+        expected = [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 0.0]
+        sample = [next(src) for _ in range(len(expected))]
+        assert expected == approx(sample)
+        assert len(src.chunk) <= 3
+
+    def test_batch(self):
+        uri = 'tests/sources/file_source.txt'
+        src = StreamingFileSource(uri, chunk_size=4)
+        expected = [float(x % 10) for x in range(25)]
+        assert list(src.next_batch(25)) == approx(expected)
+        assert next(src) == approx(5.0)
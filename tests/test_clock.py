@@ -0,0 +1,54 @@
+import asyncio
+import time
+
+from _pytest.python_api import approx
+
+from pashehnet.clock import RealClock, VirtualClock
+
+
+class TestRealClock:
+    def test_sleep_until(self):
+        clock = RealClock()
+        deadline = clock.monotonic() + 0.05
+        clock.sleep_until(deadline)
+        assert clock.monotonic() >= deadline
+
+
+class TestVirtualClock:
+    def test_as_fast_as_possible(self):
+        clock = VirtualClock(start=0.0)
+        start = time.monotonic()
+        clock.sleep_until(86400.0)
+        assert time.monotonic() - start < 0.1
+        assert clock.monotonic() == 86400.0
+        assert clock.time() == 86400.0
+
+    def test_never_runs_backwards(self):
+        clock = VirtualClock()
+        clock.sleep_until(10.0)
+        clock.sleep_until(5.0)
+        assert clock.monotonic() == 10.0
+
+    def test_speed(self):
+        clock = VirtualClock(speed=100)
+        start = time.monotonic()
+        clock.sleep_until(clock.monotonic() + 5.0)
+        elapsed = time.monotonic() - start
+        assert elapsed == approx(0.05, abs=0.04)
+
+    def test_async_order(self):
+        """
+        Async waiters on a shared virtual clock wake in deadline order
+        """
+        clock = VirtualClock(start=0.0)
+        woken = []
+
+        async def waiter(deadline):
+            await clock.sleep_until_async(deadline)
+            woken.append((deadline, clock.monotonic()))
+
+        async def main():
+            await asyncio.gather(*[waiter(d) for d in [3.0, 1.0, 2.0]])
+
+        asyncio.run(main())
+        assert woken == [(1.0, 1.0), (2.0, 2.0), (3.0, 3.0)]
@@ -0,0 +1,73 @@
+import json
+
+import numpy as np
+import pytest
+
+from pashehnet.sensors import Gateway, Sensor
+from pashehnet.sensors.formats import CSVFormat, JSONFormat
+from pashehnet.sensors.sources import ConstantValueSource, SeriesSource
+from pashehnet.sensors.transforms import NoiseTransform
+
+
+@pytest.fixture()
+def json_format():
+    return JSONFormat({'ids': [], 'values': []}, 'values', id_path='ids')
+
+
+class TestGateway:
+    """
+    Unit tests for Gateway class
+    """
+
+    def test(self, json_format):
+        """
+        Test a gateway reads every sensor into one payload per tick
+        """
+        sensors = [
+            Sensor('a', ConstantValueSource(1), None),
+            Sensor('b', SeriesSource([1, 2, 3]), None),
+        ]
+        gateway = Gateway('g', sensors, json_format, block_size=2)
+        payloads = [json.loads(gateway.read()) for _ in range(4)]
+        assert [p['ids'] for p in payloads] == [['a', 'b']] * 4
+        assert [p['values'] for p in payloads] == \
+            [[1, 1], [1, 2], [1, 3], [1, 1]]
+
+    def test_mixed_types(self, json_format):
+        """
+        Test a group mixing string and numeric sensors keeps their types
+        """
+        sensors = [
+            Sensor('a', ConstantValueSource('on'), None),
+            Sensor('b', SeriesSource([1.5, 2]), None),
+        ]
+        gateway = Gateway('g', sensors, json_format, block_size=2)
+        payloads = [json.loads(gateway.read()) for _ in range(2)]
+        assert [p['values'] for p in payloads] == [['on', 1.5], ['on', 2]]
+
+    def test_matches_sensors(self):
+        """
+        Test grouped sensors give the values they would give on their own
+        """
+        def make():
+            return [
+                Sensor(i, SeriesSource(np.arange(10.0)), None,
+                       transforms=[NoiseTransform()])
+                for i in ['a', 'b', 'c']
+            ]
+        alone = make()
+        for sensor in alone:
+            sensor.reseed(7)
+        expected = [[s._read_block(1)[0] for s in alone] for _ in range(5)]
+        gateway = Gateway('g', make(), CSVFormat(headers=False),
+                          block_size=3)
+        gateway.reseed(7)
+        for row in expected:
+            lines = gateway.read().split('\n')
+            assert [float(line.split(',')[-1]) for line in lines] == row
+
+    def test_replay(self, json_format):
+        sensor = Sensor('a', SeriesSource([1, 2], times=[0, 1]), None,
+                        replay_speed=1)
+        with pytest.raises(ValueError):
+            Gateway('g', [sensor], json_format)
@@ -24,3 +24,27 @@ def test_sources_from_csv():
         for _ in range(len(expected))
     ]
     assert expected == samples
+
+
+def test_sources_from_csv_chunked():
+    """
+    Chunks smaller than the file still replay every row in order, and are
+    released once every column has moved past them
+    """
+    sources = sources_from_csv('tests/sensors.csv', chunksize=3)
+    s1, s3 = sources['s1'], sources['s3']
+    samples = []
+    for _ in range(5):
+        samples.extend(zip(s1.next_batch(2), s3.next_batch(2)))
+        assert len(s1.reader.chunks) <= 3
+    assert samples == [
+        (1, 3), (2, 4), (3, 5), (4, 6), (5, 7),
+        (6, 8), (7, 9), (8, 0), (1, 3), (2, 4)
+    ]
+
+
+def test_sources_from_csv_timed():
+    sources = sources_from_csv('tests/sensors.csv', time_column='ts')
+    assert 'ts' not in sources
+    assert [sources['s2'].next_timed() for _ in range(3)] == \
+        [(0.0, 2), (1.0, 3), (2.0, 4)]
@@ -1,13 +1,19 @@
+import asyncio
 import multiprocessing
-import time
+import queue
+import signal
 from collections import namedtuple
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from pashehnet import Sensor
-from pashehnet.network import SensorNetwork
+from pashehnet.clock import VirtualClock
+from pashehnet.network import SensorNetwork, AsyncSensorNetwork
 from pashehnet.sensors.formats import CSVFormat
-from pashehnet.sensors.sources import ConstantValueSource
+from pashehnet.sensors.sources import ConstantValueSource, CSVColumnReader
+from pashehnet.sensors.transforms import NoiseTransform
 from pashehnet.targets import SensorTargetBase
 
 
@@ -33,6 +39,27 @@ class MockSensorTarget(SensorTargetBase):
         self.log.put(TopicPayload(topic, payload))
 
 
+class SequenceCheckTarget(SensorTargetBase):
+    """
+    Reports payloads that don't follow on from the previous one on their
+    topic, and progress every `every` payloads
+    """
+    def __init__(self, mp_queue, every):
+        super().__init__()
+        self.log = mp_queue
+        self.every = every
+        self.last = {}
+
+    def send(self, topic, payload):
+        value = int(float(payload.split(',')[-1]))
+        last = self.last.get(topic)
+        if last is not None and value != last + 1:
+            self.log.put(('skipped', topic, last, value))
+        elif value % self.every == 0:
+            self.log.put(('ok', topic, value))
+        self.last[topic] = value
+
+
 class TestNetwork:
     def test_network(self, target, mp_queue):
         topic = 'foo'
@@ -41,12 +68,187 @@ class TestNetwork:
         format = CSVFormat(headers=False)
         sensor = Sensor(id, source=source, format=format, frequency=10)
 
-        network = SensorNetwork(target)
+        # Simulated time at 100x keeps the test from sleeping for seconds
+        network = SensorNetwork(target, clock=VirtualClock(speed=100))
         network.add_sensor(topic, sensor)
 
         network.start()
-        time.sleep(3)
+        payload = mp_queue.get(timeout=5)
+        network.stop()
+
+        assert payload == TopicPayload(topic, ',42')
+
+    def test_no_signal_masks(self, target, mp_queue, monkeypatch):
+        """
+        Networks start on platforms without signal masks, e.g. Windows
+        """
+        monkeypatch.delattr(signal, 'pthread_sigmask')
+        network = SensorNetwork(target, clock=VirtualClock(speed=100))
+        network.add_sensor('foo', Sensor(
+            'bar', source=ConstantValueSource(42),
+            format=CSVFormat(headers=False), frequency=10
+        ))
+
+        network.start()
+        payload = mp_queue.get(timeout=5)
+        network.stop()
+
+        assert payload == TopicPayload('foo', ',42')
+
+    def test_scheduler_mode(self, target, mp_queue):
+        sensors = [
+            Sensor(f'bar{i}', source=ConstantValueSource(i),
+                   format=CSVFormat(headers=False), frequency=10)
+            for i in range(10)
+        ]
+
+        network = SensorNetwork(
+            target,
+            mode=SensorNetwork.MODE_SCHEDULER,
+            workers=2,
+            clock=VirtualClock(speed=100)
+        )
+        network.add_sensors('foo', sensors)
+
+        network.start()
+        payload = mp_queue.get(timeout=5)
+        network.stop()
+
+        assert len(network.sensor_procs) == 2
+        assert payload.topic == 'foo'
+
+    def test_asyncio_mode(self, target, mp_queue):
+        sensors = [
+            Sensor(f'bar{i}', source=ConstantValueSource(i),
+                   format=CSVFormat(headers=False), frequency=10)
+            for i in range(10)
+        ]
+
+        network = SensorNetwork(
+            target,
+            mode=SensorNetwork.MODE_ASYNCIO,
+            clock=VirtualClock(speed=100)
+        )
+        network.add_sensors('foo', sensors)
+
+        network.start()
+        payload = mp_queue.get(timeout=5)
         network.stop()
 
-        print(f'target log: {target.log}')
-        assert not target.log.empty()
+        assert len(network.sensor_procs) == 1
+        assert payload.topic == 'foo'
+
+    def test_seed(self):
+        """
+        Seeded networks produce the same values however many workers run
+        the sensors
+        """
+        def run(workers):
+            # A fresh queue each run, as terminated workers can leave a
+            # shared one locked
+            mp_queue = multiprocessing.Queue()
+            network = SensorNetwork(MockSensorTarget(mp_queue),
+                                    mode=SensorNetwork.MODE_SCHEDULER,
+                                    workers=workers,
+                                    clock=VirtualClock(speed=100), seed=7)
+            for i in range(4):
+                network.add_sensor('foo', Sensor(
+                    i, source=ConstantValueSource(0),
+                    format=CSVFormat(prefix_fields={'id': i}, headers=False),
+                    transforms=[NoiseTransform()], frequency=10
+                ))
+            network.start()
+            values = {i: [] for i in range(4)}
+            try:
+                while min(len(v) for v in values.values()) < 5:
+                    id, value = mp_queue.get(timeout=5).payload.split(',')
+                    values[int(id)].append(value)
+            finally:
+                network.stop()
+            return {i: v[:5] for i, v in values.items()}
+
+        assert run(1) == run(3)
+
+    def test_async_network_run(self, target, mp_queue):
+        sensors = [
+            Sensor(f'bar{i}', source=ConstantValueSource(i),
+                   format=CSVFormat(headers=False), frequency=20)
+            for i in range(5)
+        ]
+        network = AsyncSensorNetwork(target)
+        network.add_sensors('foo', sensors)
+
+        async def run_briefly():
+            try:
+                await asyncio.wait_for(network.run(), timeout=0.5)
+            except asyncio.TimeoutError:
+                pass
+
+        asyncio.run(run_briefly())
+        payloads = set()
+        try:
+            while True:
+                payloads.add(mp_queue.get(timeout=0.5).payload)
+        except queue.Empty:
+            pass
+        assert payloads == {f',{i}' for i in range(5)}
+
+    def test_async_virtual_clock(self):
+        """
+        Unpaced virtual time only moves on once every sensor task waits on
+        the clock, however long publishing yields to the loop for
+        """
+        clock = VirtualClock(speed=None, start=0.0)
+        sent = {'a': [], 'b': []}
+
+        class TimingTarget(SensorTargetBase):
+            def send(self, topic, payload):
+                sent[topic].append(clock.monotonic())
+
+        network = AsyncSensorNetwork(TimingTarget(), clock=clock)
+        network.add_sensor('a', Sensor('a', source=ConstantValueSource(0),
+                                       format=CSVFormat(), frequency=1))
+        network.add_sensor('b', Sensor('b', source=ConstantValueSource(0),
+                                       format=CSVFormat(), frequency=0.1))
+
+        async def run_briefly():
+            try:
+                await asyncio.wait_for(network.run(), timeout=0.5)
+            except asyncio.TimeoutError:
+                pass
+
+        asyncio.run(run_briefly())
+        assert len(sent['b']) >= 3
+        assert np.diff(sent['a']) == pytest.approx(1.0)
+        assert np.diff(sent['b']) == pytest.approx(10.0)
+
+    def test_replay_workers(self, tmp_path):
+        """
+        Replays aligned before the workers fork read their file afresh in
+        each worker, rather than sharing the parent's open reader
+        """
+        uri = str(tmp_path / 'replay.csv')
+        rows = 200000
+        pd.DataFrame({
+            't': np.arange(rows) / 1000, 'a': np.arange(rows),
+            'b': np.arange(rows) + 1000000
+        }).to_csv(uri, index=False)
+        reader = CSVColumnReader(uri, chunksize=5000)
+        mp_queue = multiprocessing.Queue()
+        network = SensorNetwork(SequenceCheckTarget(mp_queue, 20000),
+                                mode=SensorNetwork.MODE_SCHEDULER,
+                                workers=2, clock=VirtualClock(speed=None))
+        for name in ['a', 'b']:
+            network.add_sensor(name, Sensor(
+                name, reader.column(name, time_column='t'),
+                CSVFormat(headers=False), replay_speed=1
+            ))
+        network.start()
+        progress = {'a': 0, 'b': 1000000}
+        try:
+            while progress['a'] < 120000 or progress['b'] < 1120000:
+                report = mp_queue.get(timeout=30)
+                assert report[0] == 'ok', report
+                progress[report[1]] = report[2]
+        finally:
+            network.stop()
@@ -0,0 +1,206 @@
+import logging
+import zlib
+from collections import namedtuple
+
+from _pytest.python_api import approx
+
+from pashehnet import Sensor
+from pashehnet.clock import VirtualClock
+from pashehnet.network import SensorScheduler
+from pashehnet.network import util
+from pashehnet.network.scheduler import shard_sensors
+from pashehnet.network.network import TopicSensor
+from pashehnet.sensors.compressors import ZlibCompressor
+from pashehnet.sensors.formats import CSVFormat, SimpleFormat
+from pashehnet.sensors.sources import (
+    ConstantValueSource, SensorSourceBase, SeriesSource
+)
+from pashehnet.targets import SensorTargetBase
+
+TopicPayload = namedtuple('TopicPayload', ['topic', 'payload'])
+
+
+class ListTarget(SensorTargetBase):
+    def __init__(self):
+        self.log = []
+
+    def send(self, topic, payload):
+        self.log.append(TopicPayload(topic, payload))
+
+
+class TestSensorScheduler:
+    def test_rate_order(self):
+        """
+        A sensor running at twice the rate of another should be published
+        twice as often from the same loop
+        """
+        fast = Sensor('fast', ConstantValueSource(1), SimpleFormat(),
+                      frequency=200)
+        slow = Sensor('slow', ConstantValueSource(2), SimpleFormat(),
+                      frequency=100)
+        target = ListTarget()
+        clock = VirtualClock()
+        fast.clock = slow.clock = clock
+        scheduler = SensorScheduler(target, [
+            TopicSensor('a', fast),
+            TopicSensor('b', slow),
+        ], clock=clock)
+        for _ in range(9):
+            scheduler.step()
+        topics = [x.topic for x in target.log]
+        assert topics.count('a') == 6
+        assert topics.count('b') == 3
+
+    def test_batch(self):
+        """
+        Batching sensors are only published once a batch is full
+        """
+        sensor = Sensor('s', ConstantValueSource(1), SimpleFormat(),
+                        frequency=100, batch_size=4)
+        target = ListTarget()
+        clock = VirtualClock()
+        sensor.clock = clock
+        scheduler = SensorScheduler(target, [TopicSensor('a', sensor)],
+                                    clock=clock)
+        for _ in range(10):
+            scheduler.step()
+        assert [x.payload for x in target.log] == ['1\n1\n1\n1'] * 2
+
+    def test_compression(self):
+        """
+        Compressing sensors are published from a publisher thread, in order
+        """
+        sensor = Sensor('s', SeriesSource([1, 2, 3]), SimpleFormat(),
+                        frequency=100, compressor=ZlibCompressor())
+        target = ListTarget()
+        clock = VirtualClock()
+        sensor.clock = clock
+        scheduler = SensorScheduler(target, [TopicSensor('a', sensor)],
+                                    clock=clock)
+        for _ in range(6):
+            scheduler.step()
+        scheduler.publisher.queue.join()
+        assert [zlib.decompress(x.payload) for x in target.log] == \
+            [b'1', b'2', b'3'] * 2
+        assert sensor.compressor.stats.payloads == 6
+
+    def test_report_lateness(self, monkeypatch, caplog):
+        """
+        Sensors falling behind their deadlines are reported, not just
+        counted
+        """
+        clock = VirtualClock()
+
+        class SlowSource(SensorSourceBase):
+            def __next__(self):
+                # Reading takes half a second of simulated time
+                clock.sleep_until(clock.monotonic() + 0.5)
+                return 1
+
+        sensor = Sensor('slow', SlowSource(), SimpleFormat(), frequency=10)
+        sensor.clock = clock
+        scheduler = SensorScheduler(ListTarget(), [TopicSensor('a', sensor)],
+                                    clock=clock)
+        monkeypatch.setattr(util, 'REPORT_INTERVAL', 0.0)
+        with caplog.at_level(logging.INFO):
+            for _ in range(5):
+                scheduler.step()
+        warnings = [r.getMessage() for r in caplog.records
+                    if r.levelno == logging.WARNING]
+        assert warnings and warnings[-1].startswith('Sensor slow schedule:')
+        assert 'caught up' in warnings[-1]
+
+    def test_unpaced(self):
+        """
+        Sensors without a frequency must not starve paced sensors
+        """
+        unpaced = Sensor('unpaced', ConstantValueSource(1), SimpleFormat(),
+                         frequency=None)
+        paced = Sensor('paced', ConstantValueSource(2), SimpleFormat(),
+                       frequency=1000)
+        target = ListTarget()
+        scheduler = SensorScheduler(target, [
+            TopicSensor('a', unpaced),
+            TopicSensor('b', paced),
+        ])
+        for _ in range(1000):
+            scheduler.step()
+        assert 'b' in [x.topic for x in target.log]
+
+
+def _sensor(id, frequency):
+    return TopicSensor(
+        'foo',
+        Sensor(id, ConstantValueSource(0), SimpleFormat(), frequency=frequency)
+    )
+
+
+class TestShardSensors:
+    def test_spread_heavy(self):
+        """
+        High-rate sensors must land on separate workers
+        """
+        sensors = [_sensor(f'slow{i}', 1) for i in range(20)]
+        sensors += [_sensor(f'fast{i}', 1000) for i in range(4)]
+        shards = shard_sensors(sensors, 4)
+        assert len(shards) == 4
+        for shard in shards:
+            assert sum(1 for ts in shard if ts.sensor.frequency == 1000) == 1
+            assert sum(1 for ts in shard if ts.sensor.frequency == 1) == 5
+
+    def test_deterministic(self):
+        sensors = [_sensor(f's{i}', i % 7 + 1) for i in range(50)]
+        first = [[ts.sensor.id for ts in s] for s in shard_sensors(sensors, 3)]
+        again = [[ts.sensor.id for ts in s] for s in shard_sensors(sensors, 3)]
+        assert first == again
+
+    def test_fewer_sensors_than_workers(self):
+        sensors = [_sensor('a', 1), _sensor('b', None)]
+        shards = shard_sensors(sensors, 8)
+        assert len(shards) == 2
+
+
+class TestVirtualTime:
+    def test_timestamps(self):
+        """
+        A simulated hour at 1Hz runs instantly with simulated timestamps
+        """
+        clock = VirtualClock(start=1000.0)
+        sensor = Sensor('s', ConstantValueSource(1),
+                        CSVFormat(headers=False, timestamp_field='ts'),
+                        frequency=1, clock=clock)
+        target = ListTarget()
+        scheduler = SensorScheduler(target, [TopicSensor('a', sensor)],
+                                    clock=clock)
+        for _ in range(3600):
+            scheduler.step()
+        assert target.log[0].payload == '1001.0,1'
+        assert target.log[-1].payload == '4600.0,1'
+        assert sensor.stats.max_lateness == 0.0
+
+    def test_replay_merge(self):
+        """
+        Irregular replayed channels publish in their recorded global order
+        """
+        clock = VirtualClock(start=0.0)
+        channels = {
+            'a': [0.0, 0.1, 0.15, 2.0],
+            'b': [0.05, 1.0, 1.01, 1.02],
+            'c': [0.12, 0.13, 3.0, 3.5],
+        }
+        sensors = [
+            TopicSensor(id, Sensor(
+                id, SeriesSource(times, times=times), SimpleFormat(),
+                replay_speed=1, clock=clock
+            ))
+            for id, times in channels.items()
+        ]
+        target = ListTarget()
+        scheduler = SensorScheduler(target, sensors, clock=clock)
+        # Channel b loops back at 1.97s, ahead of a's value at 2.0s
+        for _ in range(10):
+            scheduler.step()
+        payloads = [float(x.payload) for x in target.log]
+        first_pass = [t for t in sum(channels.values(), []) if t < 1.5]
+        assert payloads == sorted(first_pass) + [0.05]
+        assert clock.monotonic() == approx(1.97)
@@ -1,8 +1,18 @@
+import time
+
+import numpy as np
 import pytest
+from _pytest.python_api import approx
 
+from pashehnet.clock import VirtualClock
 from pashehnet.sensors import Sensor
-from pashehnet.sensors.formats import CSVFormat
-from pashehnet.sensors.sources import ConstantValueSource
+from pashehnet.sensors.formats import (
+    CSVFormat, JSONFormat, SensorFormatBase, StructFormat
+)
+from pashehnet.sensors.sources import (
+    ConstantValueSource, SeriesSource, SquareWaveSource
+)
+from pashehnet.sensors.transforms import DropoutTransform, SensorTransformBase
 
 
 @pytest.fixture()
@@ -32,3 +42,178 @@ class TestSensor:
         """
         sensor = Sensor(0, source=cv_source, format=csv_format)
         assert 'a,b,value\n1,2,42' == next(sensor)
+
+    def test_no_drift(self, cv_source, csv_format):
+        """
+        Work done per tick must not stretch the period
+        """
+        class SlowTransform(SensorTransformBase):
+            def transform(self, value):
+                time.sleep(0.01)
+                return value
+
+        sensor = Sensor(0, source=cv_source, format=csv_format,
+                        transforms=[SlowTransform()], frequency=50)
+        start = time.monotonic()
+        for _ in range(10):
+            next(sensor)
+        # 10 ticks at 50Hz is 0.2s; sleeping a fixed period would take 0.3s
+        assert time.monotonic() - start < 0.27
+
+    def test_catchup(self, cv_source, csv_format):
+        sensor = Sensor(0, source=cv_source, format=csv_format, frequency=10)
+        sensor.reset(0.0)
+        assert sensor.deadline == approx(0.1)
+        sensor.tick(0.35)
+        assert sensor.deadline == approx(0.2)
+        assert sensor.stats.last_lateness == approx(0.25)
+        assert sensor.stats.skipped == 0
+        assert sensor.stats.behind == 1
+        summary, lagging = sensor.stats.summary()
+        assert lagging and '1 late' in summary and '1 caught up' in summary
+        sensor.tick(0.36)
+        assert sensor.stats.summary()[0].startswith('1 ticks, 1 late')
+
+    def test_skip(self, cv_source, csv_format):
+        sensor = Sensor(0, source=cv_source, format=csv_format, frequency=10,
+                        lag_policy=Sensor.LAG_SKIP)
+        sensor.reset(0.0)
+        sensor.tick(0.35)
+        assert sensor.deadline == approx(0.4)
+        assert sensor.stats.skipped == 2
+        assert sensor.stats.max_lateness == approx(0.25)
+
+    def test_replay(self, csv_format):
+        """
+        Replayed values fall due at their recorded offsets, scaled by the
+        replay speed, and keep running forward when the series loops
+        """
+        source = SeriesSource([1, 2, 3], times=[10.0, 10.5, 12.0])
+        sensor = Sensor(0, source=source, format=csv_format, replay_speed=2)
+        sensor.reset(100.0)
+        deadlines = [sensor.deadline]
+        values = []
+        for _ in range(5):
+            sensor.tick(sensor.deadline)
+            values.append(sensor.value)
+            deadlines.append(sensor.deadline)
+        assert values == [1, 2, 3, 1, 2]
+        assert deadlines == approx([100.0, 100.25, 101.0, 101.25, 101.5,
+                                    102.25])
+
+    def test_replay_start(self, csv_format):
+        source = SeriesSource([1, 2], times=[10.0, 11.0])
+        sensor = Sensor(0, source=source, format=csv_format, replay_speed=1,
+                        replay_start=8.0)
+        sensor.reset(0.0)
+        assert sensor.deadline == approx(2.0)
+
+    def test_replay_skip(self, csv_format):
+        source = SeriesSource(list(range(10)), times=list(range(10)))
+        sensor = Sensor(0, source=source, format=csv_format, replay_speed=1,
+                        lag_policy=Sensor.LAG_SKIP)
+        sensor.reset(0.0)
+        sensor.tick(3.5)
+        assert sensor.value == 0
+        assert sensor.deadline == approx(4.0)
+        assert sensor.stats.skipped == 3
+
+    def test_block_size(self, csv_format):
+        """
+        Reading in blocks yields the same payloads as reading value by value
+        """
+        def sensor(block_size):
+            xform = DropoutTransform(prob=0.1, value=-1,
+                                     rng=np.random.default_rng(7))
+            return Sensor(0, source=SeriesSource(list(range(50))),
+                          format=csv_format, transforms=[xform],
+                          block_size=block_size)
+
+        single, blocked = sensor(1), sensor(16)
+        assert [single.read() for _ in range(120)] == \
+            [blocked.read() for _ in range(120)]
+
+    def test_batch_size(self, cv_source, csv_format):
+        sensor = Sensor(0, source=cv_source, format=csv_format, batch_size=3)
+        payloads = [sensor.read() for _ in range(6)]
+        assert payloads[:2] == [None, None]
+        assert payloads[2] == 'a,b,value\n1,2,42\n1,2,42\n1,2,42'
+        assert payloads[5] == payloads[2]
+
+    def test_batch_interval(self, cv_source):
+        clock = VirtualClock(speed=None)
+        fmt = CSVFormat(headers=False, timestamp_field='ts')
+        sensor = Sensor(0, source=cv_source, format=fmt, clock=clock,
+                        batch_interval=1.0, frequency=4)
+        start = clock.time()
+        payloads = []
+        for _ in range(9):
+            payloads.append(next(sensor))
+        sent = [p for p in payloads if p is not None]
+        # Readings at 0.25..1.0s go out with the one at 1.25s
+        assert len(sent) == 2 and payloads[4] is not None
+        rows = sent[0].split('\n')
+        assert [float(r.split(',')[0]) - start for r in rows] == \
+            approx([0.25, 0.5, 0.75, 1.0])
+
+    def test_precompute(self):
+        """
+        Test periodic sensors publish the same payloads from a shared table
+        """
+        formats = [
+            CSVFormat(prefix_fields={'a': 1}),
+            JSONFormat({'v': None}, 'v'),
+            StructFormat([['id', 'H', 7], ['value', 'h']]),
+        ]
+        for fmt in formats:
+            def make(precompute):
+                return Sensor(0, SquareWaveSource(3, 10), fmt,
+                              precompute=precompute)
+            sensor, other, plain = make(True), make(True), make(False)
+            payloads = [sensor.read() for _ in range(25)]
+            assert payloads == [plain.read() for _ in range(25)]
+            assert other.precompute() and not plain.precompute()
+            assert other.payloads is sensor.payloads
+            assert len(sensor.payloads) == 10
+
+    def test_precompute_constant(self, cv_source, csv_format):
+        sensor = Sensor(0, source=cv_source, format=csv_format)
+        assert sensor.precompute()
+        assert sensor.read() == 'a,b,value\n1,2,42'
+        # Equal but differently formatted values don't share a table
+        other = Sensor(1, ConstantValueSource(42.0), csv_format)
+        assert other.read() == 'a,b,value\n1,2,42.0'
+
+    def test_precompute_unavailable(self, cv_source):
+        """
+        Test payloads that change over time are formatted every tick
+        """
+        fmt = CSVFormat(timestamp_field='ts')
+        sensors = [
+            Sensor(0, cv_source, fmt),
+            Sensor(0, cv_source, CSVFormat(), batch_size=2),
+            Sensor(0, cv_source, CSVFormat(),
+                   transforms=[DropoutTransform()]),
+        ]
+        assert not any(sensor.precompute() for sensor in sensors)
+
+    def test_precompute_impure(self, cv_source):
+        """
+        Test formatters that don't declare themselves pure, including
+        subclasses of pure ones, format every tick
+        """
+        class SequenceFormat(SensorFormatBase):
+            def __init__(self):
+                self.count = 0
+
+            def transform(self, value):
+                self.count += 1
+                return f'{self.count},{value}'
+
+        class TaggedFormat(CSVFormat):
+            pass
+
+        sensor = Sensor(0, cv_source, SequenceFormat())
+        assert [sensor.read() for _ in range(3)] == ['1,42', '2,42', '3,42']
+        assert not sensor.precompute()
+        assert not Sensor(0, cv_source, TaggedFormat()).precompute()
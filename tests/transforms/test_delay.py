@@ -0,0 +1,29 @@
+import numpy as np
+
+from pashehnet.sensors.transforms import DelayTransform
+
+
+class TestDelayTransform:
+    def test_delay(self):
+        xform = DelayTransform(delay=2)
+        assert [xform.transform(v) for v in range(5)] == [0, 0, 0, 1, 2]
+        assert list(xform.transform_batch(np.arange(5, 8))) == [3, 4, 5]
+
+    def test_batch(self):
+        """
+        Batches over uneven blocks match transforming value by value,
+        jitter included
+        """
+        values = np.arange(3000)
+        single = DelayTransform(delay=3, jitter=2,
+                                rng=np.random.default_rng(4))
+        batched = DelayTransform(delay=3, jitter=2,
+                                 rng=np.random.default_rng(4))
+        expected = [single.transform(v) for v in values]
+        out = np.concatenate([
+            batched.transform_batch(block)
+            for block in np.array_split(values, [1, 3, 200, 1100])
+        ])
+        assert expected == list(out)
+        lags = values - out
+        assert lags.min() >= 0 and lags.max() <= 5
@@ -0,0 +1,35 @@
+import numpy as np
+from _pytest.python_api import approx
+
+from pashehnet.sensors.transforms import DriftTransform
+
+
+class TestDriftTransform:
+    def test_linear(self):
+        xform = DriftTransform(rate=0.5)
+        assert [xform.transform(1.0) for _ in range(3)] == [1.5, 2.0, 2.5]
+        assert list(xform.transform_batch(np.ones(2))) == [3.0, 3.5]
+
+    def test_walk(self):
+        """
+        Random-walk drift spreads with the square root of time
+        """
+        ends = [
+            DriftTransform(walk=1.0, rng=np.random.default_rng(i))
+            .transform_batch(np.zeros(400))[-1]
+            for i in range(500)
+        ]
+        assert np.std(ends) == approx(20, rel=0.15)
+
+    def test_batch(self):
+        values = np.zeros(2000)
+        single = DriftTransform(rate=0.01, walk=0.1,
+                                rng=np.random.default_rng(3))
+        batched = DriftTransform(rate=0.01, walk=0.1,
+                                 rng=np.random.default_rng(3))
+        expected = [single.transform(v) for v in values]
+        out = np.concatenate([
+            batched.transform_batch(block)
+            for block in np.array_split(values, [5, 700, 1500])
+        ])
+        assert expected == list(out)
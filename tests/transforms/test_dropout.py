@@ -48,3 +48,19 @@ class TestDropoutTransform:
         sample = [xform.transform(x) for x in [0] * 100]
         runs = runs_of_ones_list(sample)
         assert min(runs) >= d_min
+
+    def test_batch(self):
+        """
+        Batches over uneven blocks match transforming value by value
+        """
+        values = np.arange(1, 3001, dtype=float)
+        single = DropoutTransform(prob=0.05, duration=3,
+                                  rng=np.random.default_rng(6))
+        batched = DropoutTransform(prob=0.05, duration=3,
+                                   rng=np.random.default_rng(6))
+        expected = [single.transform(v) for v in values]
+        out = np.concatenate([
+            batched.transform_batch(block)
+            for block in np.array_split(values, [1, 9, 200, 1100])
+        ])
+        assert expected == list(out)
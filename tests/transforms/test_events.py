@@ -0,0 +1,65 @@
+import itertools
+
+import numpy as np
+from _pytest.python_api import approx
+
+from pashehnet.sensors.transforms.events import EventSchedule
+
+
+def _naive(prob, duration, n, rng):
+    """
+    Reference implementation drawing for every sample outside an event
+    """
+    flags, remaining = [], 0
+    for _ in range(n):
+        if remaining <= 0 and rng.random() < prob:
+            remaining = duration
+        flags.append(remaining > 0)
+        remaining -= 1
+    return flags
+
+
+def _runs(flags):
+    return [len(list(g)) for b, g in itertools.groupby(flags) if b]
+
+
+class TestEventSchedule:
+    def test_equivalent(self):
+        """
+        Counting down geometric gaps matches drawing every sample
+        """
+        prob, duration, n = 0.02, 4, 200000
+        events = EventSchedule(prob, np.random.default_rng(1), duration)
+        flags = [events.step() for _ in range(n)]
+        naive = _naive(prob, duration, n, np.random.default_rng(2))
+        assert np.mean(flags) == approx(np.mean(naive), rel=0.05)
+        assert len(_runs(flags)) == approx(len(_runs(naive)), rel=0.05)
+
+    def test_duration_range(self):
+        events = EventSchedule(0.05, np.random.default_rng(3),
+                               duration_range=(2, 6))
+        runs = _runs([events.step() for _ in range(20000)])
+        # Back-to-back events merge into longer runs
+        assert min(runs) >= 2
+        assert np.median(runs) == approx(4, abs=1)
+
+    def test_never(self):
+        events = EventSchedule(0.0, np.random.default_rng())
+        assert not any(events.step() for _ in range(1000))
+
+    def test_always(self):
+        events = EventSchedule(1.0, np.random.default_rng(), duration=2)
+        assert all(events.step() for _ in range(1000))
+
+    def test_mask(self):
+        """
+        Masks over uneven blocks match stepping sample by sample
+        """
+        stepped = EventSchedule(0.05, np.random.default_rng(4),
+                                duration_range=(1, 8))
+        masked = EventSchedule(0.05, np.random.default_rng(4),
+                               duration_range=(1, 8))
+        flags = [stepped.step() for _ in range(5000)]
+        sizes = itertools.islice(itertools.cycle([1, 7, 64, 300]), 60)
+        blocks = np.concatenate([masked.mask(n) for n in sizes])
+        assert flags == list(blocks[:5000])
@@ -0,0 +1,31 @@
+import numpy as np
+from _pytest.python_api import approx
+
+from pashehnet.sensors.transforms import NoiseTransform
+
+
+class TestNoiseTransform:
+    def test_gaussian(self):
+        xform = NoiseTransform(scale=2.0, rng=np.random.default_rng(1))
+        out = xform.transform_batch(np.full(100000, 5.0))
+        assert np.mean(out) == approx(5.0, abs=0.05)
+        assert np.std(out) == approx(2.0, rel=0.02)
+
+    def test_uniform(self):
+        xform = NoiseTransform(scale=0.5, distribution='uniform')
+        out = xform.transform_batch(np.zeros(10000))
+        assert out.min() >= -0.5 and out.max() < 0.5
+
+    def test_batch(self):
+        """
+        Batches over uneven blocks match transforming value by value
+        """
+        values = np.arange(3000, dtype=float)
+        single = NoiseTransform(rng=np.random.default_rng(2))
+        batched = NoiseTransform(rng=np.random.default_rng(2))
+        expected = [single.transform(v) for v in values]
+        out = np.concatenate([
+            batched.transform_batch(block)
+            for block in np.array_split(values, [1, 9, 200, 1100, 2500])
+        ])
+        assert expected == list(out)
@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from pashehnet.sensors.transforms import QuantizeTransform
+
+
+class TestQuantizeTransform:
+    def test_step(self):
+        xform = QuantizeTransform(step=0.5, low=-1, high=1)
+        values = [-3.0, -0.3, 0.2, 0.26, 0.9, 7.0]
+        expected = [-1.0, -0.5, 0.0, 0.5, 1.0, 1.0]
+        assert [xform.transform(v) for v in values] == expected
+        assert list(xform.transform_batch(np.array(values))) == expected
+
+    def test_bits(self):
+        xform = QuantizeTransform(low=0, high=3.3, bits=8)
+        out = xform.transform_batch(np.linspace(-1, 4, 10001))
+        assert len(np.unique(out)) == 256
+        assert out.min() == 0 and out.max() == pytest.approx(3.3)
+
+    def test_bits_range(self):
+        with pytest.raises(ValueError):
+            QuantizeTransform(low=0, bits=8)
@@ -0,0 +1,25 @@
+import numpy as np
+from _pytest.python_api import approx
+
+from pashehnet.sensors.transforms import SpikeTransform
+
+
+class TestSpikeTransform:
+    def test_magnitude(self):
+        xform = SpikeTransform(prob=0.05, magnitude=10,
+                               rng=np.random.default_rng(1))
+        out = xform.transform_batch(np.zeros(100000))
+        assert set(np.unique(out)) == {-10.0, 0.0, 10.0}
+        assert np.mean(out != 0) == approx(0.05, rel=0.1)
+
+    def test_magnitude_range(self):
+        xform = SpikeTransform(prob=0.2, magnitude_range=(5, 8),
+                               rng=np.random.default_rng(2))
+        out = np.abs([xform.transform(0.0) for _ in range(10000)])
+        spikes = out[out != 0]
+        assert spikes.min() >= 5 and spikes.max() <= 8
+
+    def test_ints(self):
+        xform = SpikeTransform(prob=1.0, magnitude=0.5)
+        out = xform.transform_batch(np.zeros(10, dtype=int))
+        assert set(np.abs(out)) == {0.5}
@@ -43,3 +43,19 @@ class TestStuckTransform:
         for x in sample:
             c[x] += 1
         assert max(c.values()) >= d_min
+
+    def test_batch(self):
+        """
+        Batches over uneven blocks match transforming value by value
+        """
+        values = np.arange(3000, dtype=float)
+        single = StuckTransform(prob=0.05, duration_range=(1, 10),
+                                rng=np.random.default_rng(5))
+        batched = StuckTransform(prob=0.05, duration_range=(1, 10),
+                                 rng=np.random.default_rng(5))
+        expected = [single.transform(v) for v in values]
+        out = np.concatenate([
+            batched.transform_batch(block)
+            for block in np.array_split(values, [1, 9, 200, 1100])
+        ])
+        assert expected == list(out)